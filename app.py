@@ -3,10 +3,61 @@
 # Run: python app.py
 
 import os
+import sys
 import json
+import random
 import uuid
-from typing import Any, Dict, List
-from flask import Flask, request, jsonify, render_template_string, redirect, session, url_for
+import time
+import base64
+import binascii
+import queue
+import hashlib
+import functools
+import threading
+from collections import OrderedDict, deque
+from bisect import bisect_left, bisect_right
+from concurrent.futures import Future
+from contextlib import contextmanager, nullcontext
+from itertools import islice
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from flask import (Flask, Response, g, has_request_context, request, jsonify,
+                   session, before_render_template, template_rendered)
+from flask.json.provider import DefaultJSONProvider
+from flask.sessions import SecureCookieSessionInterface
+from flask.templating import Environment
+
+# Optional fast JSON backend (see json_dumps / json_loads)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import fcntl  # cross-process store lock (POSIX only)
+except ImportError:
+    fcntl = None
+
+# Optional binary encoders for API responses (see api_response)
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+# Optional Socket.IO push of store changes (see Live updates)
+try:
+    from flask_socketio import SocketIO
+except ImportError:
+    SocketIO = None
+
+# Optional greenlet server (SERVER_MODE=gevent, see serve.py)
+try:
+    import gevent
+except ImportError:
+    gevent = None
 
 ###############################################################################
 # App & Config
@@ -19,8293 +70,1941 @@ VEHICLES_FILE = "vehicles.json"
 DEPARTMENTS_FILE = "departments.json"
 TECHS_FILE = "technicians.json"
 SERVICES_FILE = "services.json"
+STORE_LOCK_FILE = ".store.lock"
+STORE_STATE_FILE = ".store.state"
+STORE_KEYS_FILE = ".store.keys"  # Idempotency-Key results shared by all processes
+
+# ---------- Store ----------
+# Group commit: the writer keeps collecting queued mutations for up to this
+# many ms (0 = only what is already queued) or until the batch is full, then
+# persists them all with one write + fsync.
+GROUP_COMMIT_WINDOW_MS = float(os.getenv("GROUP_COMMIT_WINDOW_MS", "0"))
+GROUP_COMMIT_MAX_BATCH = int(os.getenv("GROUP_COMMIT_MAX_BATCH", "64"))
+STORE_FSYNC = os.getenv("STORE_FSYNC", "1") != "0"
+# When a mutation is acknowledged (overridable per request with X-Durability):
+#   sync    - after it is on disk, written on its own without waiting for others
+#   batched - after it is on disk, possibly sharing a group commit
+#   async   - right after the in-memory apply; flushed within ASYNC_FLUSH_MS
+DURABILITY_LEVELS = ("sync", "batched", "async")
+STORE_DURABILITY = os.getenv("STORE_DURABILITY", "batched")
+if STORE_DURABILITY not in DURABILITY_LEVELS:
+    raise RuntimeError(f"STORE_DURABILITY={STORE_DURABILITY!r} is not one of {DURABILITY_LEVELS}")
+ASYNC_FLUSH_MS = float(os.getenv("ASYNC_FLUSH_MS", "100"))
+# Revision numbers a process reserves from STORE_STATE_FILE at a time
+ID_BLOCK = 1000
+
+# ---------- Serving ----------
+# threading: one OS thread per request (the dev server, gunicorn gthread).
+# gevent: one greenlet per request, so thousands of idle long-poll / SSE /
+# WebSocket clients fit in one process; start through serve.py, which
+# monkey-patches before this module is imported.
+SERVER_MODES = ("threading", "gevent")
+SERVER_MODE = os.getenv("SERVER_MODE", "threading")
+if SERVER_MODE not in SERVER_MODES or (SERVER_MODE == "gevent" and gevent is None):
+    raise RuntimeError(f"SERVER_MODE={SERVER_MODE!r} is not available (choose from {SERVER_MODES}; gevent needs gevent)")
+
+# ---------- Roles ----------
+# One process can serve everything, or the work can be split across
+# processes that share the data files (configure_role):
+#   all       - every page and API endpoint
+#   api-write - the whole API; run one, so every write has the same writer
+#   api-read  - read replica: GET API endpoints and the /display page
+#   pages     - login and the HTML pages
+APP_ROLES = ("all", "api-write", "api-read", "pages")
+# Socket.IO stays with the writer, which publishes every change as it makes it
+SOCKETIO_ROLES = ("all", "api-write")
+APP_ROLE = os.getenv("APP_ROLE", "all")
+if APP_ROLE not in APP_ROLES:
+    raise RuntimeError(f"APP_ROLE={APP_ROLE!r} is not one of {APP_ROLES}")
+
+# ---------- Live updates ----------
+SOCKETIO_ASYNC_MODE = os.getenv("SOCKETIO_ASYNC_MODE", SERVER_MODE)
+# Long-poll, SSE and Socket.IO clients held at once; more get 503 + Retry-After
+MAX_LIVE_CONNECTIONS = int(os.getenv("MAX_LIVE_CONNECTIONS", "5000"))
+# Recent change events kept for /api/wait (clients further behind refetch)
+CHANGE_FEED_SIZE = int(os.getenv("CHANGE_FEED_SIZE", "1000"))
+LONGPOLL_TIMEOUT = float(os.getenv("LONGPOLL_TIMEOUT", "25"))   # seconds
+LONGPOLL_MAX_TIMEOUT = 60.0
+# How often a waiting request checks for writes made by other processes
+FEED_RECHECK_SECONDS = 1.0
+# Server-sent events: idle comment interval and client reconnect delay
+SSE_KEEPALIVE_SECONDS = float(os.getenv("SSE_KEEPALIVE_SECONDS", "15"))
+SSE_RETRY_MS = 3000
+
+# ---------- Idempotency ----------
+IDEMPOTENCY_TTL = float(os.getenv("IDEMPOTENCY_TTL", "3600"))          # seconds
+IDEMPOTENCY_MAX_KEYS = int(os.getenv("IDEMPOTENCY_MAX_KEYS", "10000"))
+
+# ---------- Metrics ----------
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+QUANTILES = (0.5, 0.95, 0.99)
+# Directory shared by the worker processes of one server (gunicorn.conf.py
+# sets it): each writes its series there and /metrics adds them all up
+METRICS_DIR = os.getenv("METRICS_DIR", "")
+METRICS_SHARE_SECONDS = 1.0
+
+# ---------- Slow request log ----------
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS", "500"))
+SLOW_LOG_SIZE = int(os.getenv("SLOW_LOG_SIZE", "200"))
+
+# ---------- Profiler ----------
+# Fraction of requests profiled automatically (admins can change it at
+# runtime); an admin can also profile one request with "X-Profile: 1"
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "5"))
+PROFILE_MAX_STACKS = 20000
 
 # ---------- Constants ----------
 STATUSES: List[str] = ["Waiting", "In Service", "Done"]
 PAYMENTS: List[str] = ["Paid", "Advance Paid", "Unpaid"]
 PARTS_OPTIONS: List[str] = ["Arrived", "Not Arrived"]
 
-USERS: Dict[str, str] = {
-    "admin": "admin123",
-    "staff": "staff123",
-    "dashboard": "dashboard123",
-    "display": "display123",
-    "reception": "reception123",
-}
-
-###############################################################################
-# Helpers
-###############################################################################
-
-def load_json(path: str) -> Any:
-    if os.path.exists(path):
-        with open(path, "r", encoding="utf-8") as f:
-            try:
-                return json.load(f)
-            except json.JSONDecodeError:
-                # tolerate corrupted/empty files
-                return []
-    return []
-
-
-def save_json(path: str, data: Any) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-
-
-def read_vehicles():
-    """Read vehicles from file and ensure proper formatting"""
-    global vehicles
-    vehicles = load_json(VEHICLES_FILE) or []
-    
-    # Backfill defaults for all records
-    for v in vehicles:
-        v.setdefault("id", str(uuid.uuid4()))
-        v.setdefault("customer", "")
-        v.setdefault("vehicle_no", "")
-        v.setdefault("vehicle_name", "")
-        v.setdefault("department", departments[0] if departments else "")
-        v.setdefault("service", services[0] if services else "")
-        v.setdefault("technician", technicians[0] if technicians else "")
-        v.setdefault("status", STATUSES[0])
-        v.setdefault("payment", "Unpaid")
-        v.setdefault("parts", "Not Arrived")
-        v.setdefault("visible", True)
-    
-    return vehicles
-
-# Load initial data with sensible defaults
-departments: List[str] = load_json(DEPARTMENTS_FILE) or ["Mechanical", "Electrical", "Body Shop"]
-technicians: List[str] = load_json(TECHS_FILE) or ["Rajesh", "Syon"]
-services: List[str] = load_json(SERVICES_FILE) or ["General Service", "Oil Change", "Full Inspection"]
-vehicles: List[Dict[str, Any]] = read_vehicles()
-
-###############################################################################
-# Auth (fixed: new UI, original USERS, added logout)
-###############################################################################
-@app.route("/", methods=["GET", "POST"])
-def login():
-    error = ""
-    if request.method == "POST":
-        username = request.form.get("username", "").strip()
-        password = request.form.get("password", "").strip()
-        if username in USERS and USERS[username] == password:
-            session["user"] = username
-            return redirect(f"/{username}") if username != "admin" else redirect("/admin")
-        error = "Invalid username or password"
-
-    return render_template_string(
-        r"""<!doctype html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0, user-scalable=no">
-  <title>Login</title>
-  <style>
-    /* === Enhanced Ultra-Responsive CSS === */
-    * { 
-      margin: 0; 
-      padding: 0; 
-      box-sizing: border-box; 
-      font-family: "Segoe UI", Tahoma, Geneva, Verdana, sans-serif;
-      -webkit-font-smoothing: antialiased;
-      -moz-osx-font-smoothing: grayscale;
-    }
-    
-    html { 
-      font-size: clamp(14px, 2vw, 16px); 
-      height: 100%;
-      overflow: hidden;
-    }
-    
-    body { 
-      display: flex; 
-      justify-content: center; 
-      align-items: center; 
-      min-height: 100vh; 
-      height: 100vh;
-      overflow: hidden; 
-      position: relative;
-      touch-action: manipulation;
-    }
-    
-    .background { 
-      position: fixed; 
-      inset: 0; 
-      background: url("{{ url_for('static', filename='background.png') }}") no-repeat center center/cover; 
-      animation: zoom 20s infinite alternate ease-in-out;
-      will-change: transform;
-    }
-    
-    .background.back { 
-      filter: brightness(1.4) blur(clamp(4px, 1vw, 8px)); 
-      transform: scale(1.3); 
-      z-index: -2; 
-    }
-    
-    .background.front { 
-      filter: brightness(0.5); 
-      transform: scale(1.3); 
-      z-index: -1; 
-    }
-    
-    @keyframes zoom { 
-      0% { transform: scale(1.3); } 
-      100% { transform: scale(1.8); } 
-    }
-    
-    .big-box { 
-      position: fixed; 
-      top: clamp(10px, 5vh, 5cm); 
-      bottom: clamp(10px, 5vh, 5cm); 
-      left: clamp(10px, 5vw, 5cm); 
-      right: clamp(10px, 5vw, 5cm); 
-      background: url("{{ url_for('static', filename='background.png') }}") no-repeat center center/cover; 
-      border-radius: clamp(10px, 2vw, 20px); 
-      overflow: hidden; 
-      z-index: 0; 
-      box-shadow: 0 0 clamp(20px, 4vw, 40px) rgba(0,0,0,0.6);
-      will-change: transform;
-    }
-    
-    .container { 
-      width: 100%; 
-      max-width: min(90vw, 900px); 
-      display: flex; 
-      justify-content: center; 
-      align-items: center; 
-      padding: clamp(10px, 3vw, 20px); 
-      position: relative; 
-      z-index: 1; 
-    }
-    
-    .login-box { 
-      position: relative; 
-      border-radius: clamp(15px, 2vw, 20px); 
-      padding: clamp(20px, 4vw, 30px); 
-      width: min(90vw, 350px); 
-      max-width: 350px;
-      text-align: center; 
-      color: #fff; 
-      box-shadow: 0 clamp(4px, 1vw, 8px) clamp(10px, 2vw, 20px) rgba(0,0,0,0.3); 
-      backdrop-filter: blur(clamp(8px, 1.5vw, 12px)); 
-      background: linear-gradient(135deg, rgba(0,0,0,0.65), rgba(0,0,0,0.85)); 
-      overflow: hidden; 
-      opacity: 0; 
-      transform: translateY(30px); 
-      animation: fadeInUp 1s forwards ease-out;
-      will-change: transform, opacity;
-    }
-    
-    .login-box img { 
-      width: clamp(60px, 12vw, 100px); 
-      height: clamp(60px, 12vw, 100px); 
-      object-fit: cover; 
-      border-radius: 50%; 
-      margin-bottom: clamp(10px, 2vw, 15px); 
-      animation: bounceIn 1s ease-out;
-      will-change: transform;
-    }
-    
-    @keyframes bounceIn { 
-      0% { transform: scale(0.3); opacity: 0; } 
-      60% { transform: scale(1.2); opacity: 1; } 
-      80% { transform: scale(0.9); } 
-      100% { transform: scale(1); } 
-    }
-    
-    .login-box h2 { 
-      font-size: clamp(20px, 4vw, 26px); 
-      margin-bottom: clamp(15px, 3vw, 20px); 
-      font-weight: 600;
-    }
-    
-    .login-box input[type="text"], 
-    .login-box input[type="password"] { 
-      width: 100%; 
-      padding: clamp(10px, 2vw, 12px); 
-      margin-bottom: 5px; 
-      border: none; 
-      border-radius: clamp(4px, 1vw, 6px); 
-      outline: none; 
-      background: rgba(255,255,255,0.95); 
-      color: #333; 
-      transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-      font-size: clamp(14px, 2vw, 16px);
-      will-change: box-shadow, transform;
-      -webkit-appearance: none;
-      appearance: none;
-    }
-    
-    .login-box input:focus { 
-      box-shadow: 0 0 0 3px rgba(230,57,70,0.3), 0 0 clamp(6px, 1vw, 8px) rgba(230,57,70,0.8); 
-      transform: scale(1.02); 
-      background: #fff;
-    }
-    
-    .login-box input:hover:not(:focus) {
-      background: #fff;
-      transform: translateY(-1px);
-    }
-    
-    .field-error { 
-      text-align: left; 
-      font-size: clamp(12px, 2vw, 13px); 
-      color: #ff3b30; 
-      margin-bottom: 10px; 
-      opacity: 0; 
-      height: 0; 
-      transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-      transform: translateY(-5px);
-    }
-    
-    .field-error.visible { 
-      opacity: 1; 
-      height: auto;
-      transform: translateY(0);
-    }
-    
-    .password-wrapper { 
-      position: relative; 
-    }
-    
-    .toggle-password { 
-      position: absolute; 
-      right: clamp(8px, 2vw, 12px); 
-      top: 50%; 
-      transform: translateY(-50%); 
-      cursor: pointer; 
-      color: #666; 
-      width: clamp(18px, 3vw, 22px); 
-      height: clamp(18px, 3vw, 22px); 
-      opacity: 0.6; 
-      transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-      touch-action: manipulation;
-    }
-    
-    .toggle-password:hover, .toggle-password:active { 
-      opacity: 1; 
-      transform: translateY(-50%) scale(1.1);
-    }
-    
-    .login-box button { 
-      width: 100%; 
-      padding: clamp(10px, 2vw, 12px); 
-      border: none; 
-      border-radius: clamp(4px, 1vw, 6px); 
-      background: linear-gradient(135deg, #e63946, #d62828); 
-      color: #fff; 
-      font-weight: 600; 
-      font-size: clamp(14px, 2vw, 16px);
-      cursor: pointer; 
-      transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-      position: relative;
-      overflow: hidden;
-      will-change: transform, background;
-      touch-action: manipulation;
-      -webkit-appearance: none;
-      appearance: none;
-    }
-    
-    .login-box button::before {
-      content: '';
-      position: absolute;
-      top: 0;
-      left: -100%;
-      width: 100%;
-      height: 100%;
-      background: linear-gradient(90deg, transparent, rgba(255,255,255,0.3), transparent);
-      transition: left 0.6s;
-    }
-    
-    .login-box button:hover::before {
-      left: 100%;
-    }
-    
-    .login-box button:hover:not(:disabled) { 
-      background: linear-gradient(135deg, #d62828, #b71c1c); 
-      transform: translateY(-2px) scale(1.02); 
-      box-shadow: 0 clamp(4px, 1vw, 8px) clamp(15px, 3vw, 25px) rgba(230,57,70,0.4);
-    }
-    
-    .login-box button:active:not(:disabled) {
-      transform: translateY(0) scale(1);
-      transition: all 0.1s;
-    }
-    
-    .login-box button:disabled { 
-      background: #999; 
-      cursor: not-allowed; 
-      transform: none;
-      box-shadow: none;
-    }
-    
-    .error { 
-      margin-top: clamp(10px, 2vw, 15px); 
-      color: #ffcccc; 
-      font-size: clamp(13px, 2vw, 14px); 
-      opacity: 0; 
-      transform: translateY(-10px); 
-      animation: fadeInError 0.5s forwards cubic-bezier(0.4, 0, 0.2, 1);
-    }
-    
-    @keyframes fadeInError { 
-      to { 
-        opacity: 1; 
-        transform: translateY(0); 
-      } 
-    }
-    
-    @keyframes fadeInUp { 
-      to { 
-        opacity: 1; 
-        transform: translateY(0); 
-      } 
-    }
-    
-    .spinner { 
-      width: clamp(16px, 3vw, 20px); 
-      height: clamp(16px, 3vw, 20px); 
-      border: 2px solid rgba(255,255,255,0.3); 
-      border-top-color: white; 
-      border-radius: 50%; 
-      animation: spin 0.8s linear infinite; 
-      margin: auto;
-    }
-    
-    @keyframes spin { 
-      to { transform: rotate(360deg); } 
-    }
-    
-    /* === Ultra Responsive Breakpoints === */
-    
-    /* Small phones (320px - 480px) */
-    @media (max-width: 480px) {
-      .big-box {
-        top: 5px;
-        bottom: 5px;
-        left: 5px;
-        right: 5px;
-      }
-      
-      .login-box {
-        padding: 20px 15px;
-        width: calc(100vw - 20px);
-        margin: 0 10px;
-      }
-      
-      .login-box img { 
-        width: 70px; 
-        height: 70px; 
-      }
-      
-      .login-box h2 { 
-        font-size: 20px; 
-      }
-      
-      .login-box input, 
-      .login-box button { 
-        padding: 12px 10px;
-        font-size: 16px; /* Prevent zoom on iOS */
-      }
-    }
-    
-    /* Medium phones (481px - 768px) */
-    @media (min-width: 481px) and (max-width: 768px) {
-      .login-box {
-        width: min(80vw, 320px);
-      }
-    }
-    
-    /* Tablets (769px - 1024px) */
-    @media (min-width: 769px) and (max-width: 1024px) {
-      .login-box {
-        width: min(60vw, 350px);
-      }
-    }
-    
-    /* Large screens (1025px+) */
-    @media (min-width: 1025px) {
-      .login-box {
-        width: 350px;
-      }
-    }
-    
-    /* Ultra-wide screens */
-    @media (min-width: 1440px) {
-      .big-box {
-        top: 8vh;
-        bottom: 8vh;
-        left: 8vw;
-        right: 8vw;
-      }
-    }
-    
-    /* Portrait orientation adjustments */
-    @media (orientation: portrait) and (max-height: 600px) {
-      .login-box {
-        padding: 15px;
-      }
-      
-      .login-box img {
-        width: 60px;
-        height: 60px;
-        margin-bottom: 10px;
-      }
-    }
-    
-    /* Landscape orientation adjustments */
-    @media (orientation: landscape) and (max-height: 500px) {
-      .big-box {
-        top: 2vh;
-        bottom: 2vh;
-        left: 10vw;
-        right: 10vw;
-      }
-      
-      .login-box {
-        padding: 20px;
-        max-height: 90vh;
-      }
-      
-      .login-box img {
-        width: 50px;
-        height: 50px;
-        margin-bottom: 8px;
-      }
-    }
-    
-    /* High-DPI displays */
-    @media (-webkit-min-device-pixel-ratio: 2), (min-resolution: 192dpi) {
-      .login-box {
-        border: 0.5px solid rgba(255,255,255,0.1);
-      }
-    }
-    
-    /* Dark mode support */
-    @media (prefers-color-scheme: dark) {
-      .login-box input[type="text"], 
-      .login-box input[type="password"] {
-        background: rgba(255,255,255,0.95);
-      }
-    }
-    
-    /* Reduced motion support */
-    @media (prefers-reduced-motion: reduce) {
-      *,
-      *::before,
-      *::after {
-        animation-duration: 0.01ms !important;
-        animation-iteration-count: 1 !important;
-        transition-duration: 0.01ms !important;
-      }
-    }
-    
-    /* Focus visible for accessibility */
-    .login-box button:focus-visible {
-      outline: 2px solid #fff;
-      outline-offset: 2px;
-    }
-    
-    .login-box input:focus-visible {
-      outline: none; /* We handle this with box-shadow */
-    }
-    
-    /* Hover support detection */
-    @media (hover: none) {
-      .login-box button:hover {
-        transform: none;
-        box-shadow: none;
-        background: linear-gradient(135deg, #e63946, #d62828);
-      }
-      
-      .toggle-password:hover {
-        transform: translateY(-50%);
-        opacity: 0.6;
-      }
-    }
-  </style>
-</head>
-<body>
-  <div class="background back"></div>
-  <div class="background front"></div>
-  <div class="big-box"></div>
-  <div class="container">
-    <div class="login-box">
-      <img src="{{ url_for('static', filename='logo.png') }}" alt="Logo">
-      <h2>Login</h2>
-      <form method="POST" id="loginForm" novalidate>
-        <input type="text" id="username" name="username" placeholder="Username" autofocus autocomplete="username" inputmode="text">
-        <div id="usernameError" class="field-error">Please enter your username</div>
-
-        <div class="password-wrapper">
-          <input type="password" id="password" name="password" placeholder="Password" autocomplete="current-password">
-          <span class="toggle-password" id="togglePassword" onclick="togglePassword()" role="button" tabindex="0" aria-label="Toggle password visibility">
-            <svg id="eyeIcon" xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24" stroke="currentColor">
-              <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2"
-                d="M15 12a3 3 0 11-6 0 3 3 0 016 0z" />
-              <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2"
-                d="M2.458 12C3.732 7.943 7.523 5 12 5c4.477 0 8.268 2.943 9.542 7-1.274 4.057-5.065 7-9.542 7-4.477 0-8.268-2.943-9.542-7z" />
-            </svg>
-          </span>
-        </div>
-        <div id="passwordError" class="field-error">Please enter your password</div>
-
-        <button type="submit" id="loginBtn">Login</button>
-      </form>
-      {% if error %}
-      <div class="error">{{ error }}</div>
-      {% endif %}
-    </div>
-  </div>
-
-  <script>
-    // Enhanced JavaScript with performance optimizations
-    let isSubmitting = false;
-    
-    function togglePassword() {
-      if (isSubmitting) return;
-      
-      const pass = document.getElementById("password");
-      const eyeIcon = document.getElementById("eyeIcon");
-      
-      // Use requestAnimationFrame for smooth updates
-      requestAnimationFrame(() => {
-        if (pass.type === "password") {
-          pass.type = "text";
-          eyeIcon.innerHTML = `
-            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2"
-              d="M13.875 18.825A10.05 10.05 0 0112 19c-4.477 0-8.268-2.943-9.542-7a9.956 9.956 0 012.582-4.419M9.88 9.88a3 3 0 104.24 4.24M3 3l18 18" />`;
-        } else {
-          pass.type = "password";
-          eyeIcon.innerHTML = `
-            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2"
-              d="M15 12a3 3 0 11-6 0 3 3 0 016 0z" />
-            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2"
-              d="M2.458 12C3.732 7.943 7.523 5 12 5c4.477 0 8.268 2.943 9.542 7-1.274 4.057-5.065 7-9.542 7-4.477 0-8.268-2.943-9.542-7z" />`;
-        }
-      });
-    }
-    
-    // Enhanced keyboard support for toggle button
-    document.getElementById("togglePassword").addEventListener("keydown", function(e) {
-      if (e.key === "Enter" || e.key === " ") {
-        e.preventDefault();
-        togglePassword();
-      }
-    });
-
-    const form = document.getElementById("loginForm");
-    const username = document.getElementById("username");
-    const password = document.getElementById("password");
-    const btn = document.getElementById("loginBtn");
-    const usernameError = document.getElementById("usernameError");
-    const passwordError = document.getElementById("passwordError");
-
-    // Real-time validation with debouncing
-    let usernameTimeout, passwordTimeout;
-    
-    username.addEventListener("input", function() {
-      clearTimeout(usernameTimeout);
-      usernameTimeout = setTimeout(() => {
-        if (this.value.trim()) {
-          usernameError.classList.remove("visible");
-        }
-      }, 300);
-    });
-    
-    password.addEventListener("input", function() {
-      clearTimeout(passwordTimeout);
-      passwordTimeout = setTimeout(() => {
-        if (this.value.trim()) {
-          passwordError.classList.remove("visible");
-        }
-      }, 300);
-    });
-    
-    // Enhanced form submission
-    form.addEventListener("submit", function(e) {
-      if (isSubmitting) {
-        e.preventDefault();
-        return;
-      }
-      
-      let valid = true;
-      
-      // Reset errors first
-      usernameError.classList.remove("visible");
-      passwordError.classList.remove("visible");
-      
-      // Use requestAnimationFrame for smooth error display
-      requestAnimationFrame(() => {
-        if (!username.value.trim()) {
-          usernameError.classList.add("visible");
-          valid = false;
-        }
-
-        if (!password.value.trim()) {
-          passwordError.classList.add("visible");
-          valid = false;
-        }
-
-        if (!valid) {
-          // Focus first invalid field
-          const firstInvalid = !username.value.trim() ? username : password;
-          firstInvalid.focus();
-          return;
-        }
-        
-        // If validation passes, show loading state
-        isSubmitting = true;
-        btn.disabled = true;
-        btn.innerHTML = `<div class="spinner"></div>`;
-        
-        // Add small delay to show loading animation before form submits
-        setTimeout(() => {
-          form.submit();
-        }, 100);
-      });
-      
-      if (!valid) {
-        e.preventDefault();
-      }
-    });
-    
-    // Enhanced focus management
-    document.addEventListener("DOMContentLoaded", function() {
-      // Ensure username field gets focus after animations
-      setTimeout(() => {
-        username.focus();
-      }, 1000);
-    });
-    
-    // Performance optimization: Preload background image
-    const img = new Image();
-    img.src = "{{ url_for('static', filename='background.png') }}";
-    
-    // Handle form reset on page show (for back button)
-    window.addEventListener("pageshow", function(e) {
-      if (e.persisted || performance.navigation.type === 2) {
-        isSubmitting = false;
-        btn.disabled = false;
-        btn.innerHTML = "Login";
-        usernameError.classList.remove("visible");
-        passwordError.classList.remove("visible");
-      }
-    });
-    
-    // Prevent double-tap zoom on mobile
-    let lastTouchEnd = 0;
-    document.addEventListener('touchend', function (event) {
-      const now = (new Date()).getTime();
-      if (now - lastTouchEnd <= 300) {
-        event.preventDefault();
-      }
-      lastTouchEnd = now;
-    }, false);
-  </script>
-</body>
-</html>
-""",
-        error=error,
-    )
-
-@app.route("/logout")
-def logout():
-    session.pop("user", None)
-    return redirect("/")
-###############################################################################
-# Reception (Vue wizard)
-###############################################################################
-@app.route("/reception")
-def reception():
-    if session.get("user") != "reception":
-        return redirect("/")
-    return render_template_string(r"""
-<!doctype html>
-<html lang="en">
-<head>
-<meta charset="utf-8" />
-<meta name="viewport" content="width=device-width,initial-scale=1,user-scalable=no" />
-<title>Reception — 7-Step Wizard</title>
-<link rel="stylesheet" href="https://unpkg.com/@phosphor-icons/web@2.0.3/src/regular/style.css">
-<style>
-  :root{
-    --bg1:#0b0d10; --bg2:#0f1418;
-    --card:#E63946; --white:#fff; --muted:rgba(255,255,255,.75);
-    --glass:rgba(255,255,255,.06); --radius:20px;
-    --shadow-lg:0 22px 60px rgba(2,6,23,.6);
-    --ease-spring:cubic-bezier(.22,.61,.36,1);
-    
-    /* Base dimensions */
-    --base-card-width: 380px;
-    --base-card-height: 600px;
-    --base-font: 16px;
-    --base-icon: 120px;
-    --base-padding: 28px;
-    --base-spacing: 8px;
-    --base-border-radius: 12px;
-    
-    /* Default scale factor */
-    --scale: 1;
-    
-    /* Calculated responsive values */
-    --card-width: calc(var(--base-card-width) * var(--scale));
-    --card-height: calc(var(--base-card-height) * var(--scale));
-    --font-size: calc(var(--base-font) * var(--scale));
-    --font-heading: calc(18px * var(--scale));
-    --icon-size: calc(var(--base-icon) * var(--scale));
-    --padding: calc(var(--base-padding) * var(--scale));
-    --spacing: calc(var(--base-spacing) * var(--scale));
-    --border-radius: calc(var(--base-border-radius) * var(--scale));
-    --touch-target: max(44px, calc(44px * var(--scale)));
-  }
-
-  /* Ultra-wide displays (4K+) */
-  @media (min-width: 3840px) {
-    :root { --scale: 2.5; }
-  }
-
-  /* Large 4K displays */
-  @media (min-width: 2560px) and (max-width: 3839px) {
-    :root { --scale: 2.0; }
-  }
-  
-  /* Standard 4K displays */
-  @media (min-width: 1920px) and (max-width: 2559px) {
-    :root { --scale: 1.6; }
-  }
-  
-  /* Large desktop */
-  @media (min-width: 1440px) and (max-width: 1919px) {
-    :root { --scale: 1.3; }
-  }
-  
-  /* Standard desktop */
-  @media (min-width: 1200px) and (max-width: 1439px) {
-    :root { --scale: 1.1; }
-  }
-  
-  /* Small desktop */
-  @media (min-width: 1024px) and (max-width: 1199px) {
-    :root { --scale: 1.0; }
-  }
-  
-  /* Large tablet */
-  @media (min-width: 768px) and (max-width: 1023px) {
-    :root { --scale: 0.85; }
-  }
-  
-  /* Small tablet / Large mobile */
-  @media (min-width: 600px) and (max-width: 767px) {
-    :root { --scale: 0.75; }
-  }
-  
-  /* Standard mobile */
-  @media (min-width: 480px) and (max-width: 599px) {
-    :root { --scale: 0.65; }
-  }
-  
-  /* Small mobile */
-  @media (min-width: 360px) and (max-width: 479px) {
-    :root { --scale: 0.58; }
-  }
-  
-  /* Very small mobile */
-  @media (min-width: 320px) and (max-width: 359px) {
-    :root { --scale: 0.52; }
-  }
-  
-  /* Tiny displays */
-  @media (max-width: 319px) {
-    :root { --scale: 0.45; }
-  }
-
-  /* Landscape mobile adjustments */
-  @media (max-width: 767px) and (orientation: landscape) and (max-height: 500px) {
-    :root { --scale: calc(var(--scale) * 0.8); }
-  }
-
-  /* Portrait tablet adjustments */
-  @media (min-width: 768px) and (max-width: 1023px) and (orientation: portrait) {
-    :root { --scale: calc(var(--scale) * 0.9); }
-  }
-
-  *{box-sizing:border-box}
-  html,body{height:100%}
-  body{
-    margin:0; font-family:Inter,"Segoe UI",system-ui,-apple-system,sans-serif;
-    background:
-      radial-gradient(800px 500px at 10% 10%, #11141a 0%, rgba(0,0,0,0) 30%),
-      linear-gradient(180deg,var(--bg1),var(--bg2));
-    color:var(--white);
-    display:flex; justify-content:center; align-items:flex-start;
-    padding:calc(56px * var(--scale)) calc(16px * var(--scale)) calc(80px * var(--scale));
-    font-size: var(--font-size);
-  }
-
-  /* ===== Top Chrome ===== */
-  .topbar{
-    position:fixed; 
-    top:calc(14px * var(--scale)); 
-    right:calc(14px * var(--scale)); 
-    z-index:1200; 
-    display:flex; 
-    gap:calc(10px * var(--scale));
-  }
-  .hamburger{
-    width:var(--touch-target); 
-    height:var(--touch-target); 
-    border-radius:calc(var(--base-border-radius) * var(--scale)); 
-    display:flex; align-items:center; justify-content:center;
-    background:var(--glass); 
-    border:1px solid rgba(255,255,255,.08); 
-    cursor:pointer;
-    transition:transform .12s ease, background .12s ease;
-  }
-  .hamburger:hover{
-    transform:translateY(calc(-2px * var(--scale))); 
-    background:rgba(255,255,255,.12);
-  }
-  .hamburger svg {
-    width:calc(24px * var(--scale));
-    height:calc(24px * var(--scale));
-    stroke-width: calc(2 * var(--scale));
-  }
-  .hamburger svg line {
-    stroke-width: calc(2 * var(--scale));
-  }
-
-  /* ===== Overlay ===== */
-  #overlay {
-    position: fixed;
-    inset: 0;
-    background: rgba(0, 0, 0, 0.35);
-    opacity: 0;
-    pointer-events: none;
-    transition: opacity .24s ease;
-    z-index: 1198;
-  }
-  #overlay.active {
-    opacity: 1;
-    pointer-events: auto;
-  }
-
-  /* ===== Drawer (full-height right panel) ===== */
-  .drawer {
-    position: fixed;
-    top: 0;
-    right: calc(-280px * var(--scale));
-    width: calc(280px * var(--scale));
-    height: 100vh;
-    z-index: 1199;
-    background: #0e1116;
-    border-left: 1px solid #1b1f27;
-    box-shadow: calc(-16px * var(--scale)) 0 calc(48px * var(--scale)) rgba(0,0,0,.5);
-    display: flex;
-    flex-direction: column;
-    transition: right .3s cubic-bezier(0.22, 1, 0.36, 1);
-  }
-  .drawer.active { right: 0; }
-
-  /* ===== Drawer Header ===== */
-  .drawer-header {
-    display: flex;
-    align-items: center;
-    justify-content: space-between;
-    padding: calc(16px * var(--scale)) calc(20px * var(--scale));
-    border-bottom: 1px solid #1b1f27;
-  }
-  .drawer-header h3 { 
-    font-size: var(--font-heading); 
-    font-weight: 600; 
-    color: #fff; 
-    margin: 0;
-  }
-  .drawer-header button {
-    font-size: calc(20px * var(--scale)); 
-    color: #888; 
-    background: none; 
-    border: none; 
-    cursor: pointer; 
-    transition: color .2s ease;
-    width: var(--touch-target);
-    height: var(--touch-target);
-    display: flex;
-    align-items: center;
-    justify-content: center;
-  }
-  .drawer-header button:hover { color: #fff; }
-
-  /* ===== Logout at the TOP ===== */
-  .drawer .logout {
-    margin: calc(16px * var(--scale)) calc(20px * var(--scale));
-    padding: calc(14px * var(--scale)) calc(16px * var(--scale));
-    border-radius: calc(var(--base-border-radius) * var(--scale));
-    border: none;
-    cursor: pointer;
-    background: linear-gradient(90deg, #e63946, #d2353f);
-    color: #fff;
-    font-weight: 900;
-    font-size: var(--font-size);
-    text-align: center;
-    box-shadow: 0 calc(10px * var(--scale)) calc(30px * var(--scale)) rgba(0,0,0,.2);
-    transition: transform .15s ease, background .3s ease;
-    min-height: var(--touch-target);
-  }
-  .drawer .logout:hover {
-    transform: translateY(calc(-2px * var(--scale)));
-    background: linear-gradient(90deg, #f04755, #e63946);
-  }
-
-  /* ===== Menu Links (Optional Future Items) ===== */
-  .drawer .menu-items {
-    flex: 1; 
-    padding: calc(20px * var(--scale)); 
-    display: flex; 
-    flex-direction: column; 
-    gap: calc(12px * var(--scale));
-  }
-  .drawer .menu-items a {
-    display: block; 
-    padding: calc(12px * var(--scale)) calc(14px * var(--scale)); 
-    border-radius: calc(10px * var(--scale)); 
-    background: #1b1f27; 
-    color: #eee; 
-    text-decoration: none; 
-    font-size: calc(15px * var(--scale)); 
-    transition: background .2s ease, color .2s ease;
-    min-height: var(--touch-target);
-    display: flex;
-    align-items: center;
-  }
-  .drawer .menu-items a:hover { background: #2a2f3a; color: #fff; }
-
-/* === Apple-style fast-start, slow-end card slide === */
-.card.left-off, .card.prev, .card.active, .card.next, .card.right-off {
-    transition: transform 0.18s cubic-bezier(0.4, 0, 0.2, 1), 
-                opacity 0.18s ease-out, 
-                filter 0.18s ease-out;
-}
-
-/* Off-screen cards slightly closer to avoid overlap */
-.card.left-off  { 
-  transform: translateX(-105%) scale(0.92); 
-  opacity: 0; 
-  z-index: 1; 
-  filter: blur(calc(1px * var(--scale))); 
-}
-.card.prev      { 
-  transform: translateX(-50%) scale(0.92) rotateY(4deg); 
-  opacity: 0.84; 
-  z-index: 2; 
-  filter: blur(calc(0.8px * var(--scale))); 
-}
-.card.active    { 
-  transform: translateX(0) scale(1) rotateY(0); 
-  opacity: 1; 
-  z-index: 3; 
-  filter: blur(0); 
-}
-.card.next      { 
-  transform: translateX(50%) scale(0.92) rotateY(-4deg); 
-  opacity: 0.84; 
-  z-index: 2; 
-  filter: blur(calc(0.8px * var(--scale))); 
-}
-.card.right-off { 
-  transform: translateX(105%) scale(0.92); 
-  opacity: 0; 
-  z-index: 1; 
-  filter: blur(calc(1px * var(--scale))); 
-}
-
-  /* ===== Reception Card Container (Centered + Smooth Animations) ===== */
-  .cards-container {
-    position: fixed;
-    top: 50%;
-    left: 50%;
-    transform: translate(-50%, -50%);
-    width: 100%;
-    height: 100%;
-    display: flex;
-    justify-content: center;
-    align-items: center;
-    overflow: hidden;
-    z-index: 1000;
-  }
-
-  /* Stage (Wrapper for the stack of cards) */
-  .stage {
-    width: 100%;
-    max-width: 96vw;
-    height: auto;
-    position: relative;
-    display: flex;
-    justify-content: center;
-    align-items: center;
-    padding: calc(20px * var(--scale));
-  }
-
-  /* Stack of cards */
-  .stack {
-    position: relative;
-    width: 100%;
-    max-width: calc(760px * var(--scale));
-    height: calc(var(--card-height) + 40px * var(--scale));
-    perspective: calc(1600px * var(--scale));
-    display: flex;
-    justify-content: center;
-    align-items: center;
-  }
-
-  /* ===== Individual Cards ===== */
-  .card {
-    width: var(--card-width);
-    min-height: var(--card-height);
-    border-radius: calc(18px * var(--scale));
-    background: var(--card);
-    color: #fff;
-    box-shadow: var(--shadow-lg);
-    padding: var(--padding);
-    display: flex;
-    flex-direction: column;
-    align-items: center;
-    text-align: center;
-
-    position: absolute;
-    top: 0; bottom: 0; left: 0; right: 0;
-    margin: auto;
-    transform-origin: center;
-    will-change: transform, filter, opacity;
-    transition:
-      transform 0.9s cubic-bezier(0.22, 1, 0.36, 1),
-      opacity 0.6s ease,
-      filter 0.6s ease;
-  }
-
-  /* Animation effects for each card in different states */
-  .card.left-off { 
-    transform: translateX(-140%) scale(.92); 
-    opacity: 0; 
-    filter: blur(calc(1px * var(--scale))); 
-    z-index: 1; 
-  }
-  .card.prev { 
-    transform: translateX(-52%) scale(.92) rotateY(4deg); 
-    opacity: .84; 
-    filter: blur(calc(.8px * var(--scale))); 
-    z-index: 2; 
-  }
-  .card.active { 
-    transform: translateX(0) scale(1) rotateY(0); 
-    opacity: 1; 
-    filter: blur(0); 
-    z-index: 3; 
-  }
-  .card.next { 
-    transform: translateX(52%) scale(.92) rotateY(-4deg); 
-    opacity: .84; 
-    filter: blur(calc(.8px * var(--scale))); 
-    z-index: 2; 
-  }
-  .card.right-off {
-    transform: translateX(140%) scale(.92); 
-    opacity: 0; 
-    filter: blur(calc(1px * var(--scale))); 
-    z-index: 1;
-  }
-
-  /* Back button inside each card */
-  .card .back {
-    width: var(--touch-target); 
-    height: var(--touch-target); 
-    border-radius: calc(var(--base-border-radius) * var(--scale));
-    display: flex; align-items: center; justify-content: center;
-    background: rgba(255, 255, 255, .12); 
-    border: 1px solid rgba(255, 255, 255, .18); 
-    cursor: pointer;
-    visibility: hidden; opacity: 0;
-    transition: transform .12s ease, opacity .12s ease;
-    font-size: calc(20px * var(--scale));
-  }
-
-  /* Input fields inside each card */
-  .card input, .card select {
-    width: calc(260px * var(--scale));
-    margin: 0 auto calc(20px * var(--scale)) auto;
-    padding: calc(12px * var(--scale));
-    border-radius: calc(8px * var(--scale));
-    border: 1px solid rgba(255, 255, 255, .2);
-    background: transparent;
-    color: #fff;
-    font-size: var(--font-size);
-    outline: none;
-    min-height: var(--touch-target);
-  }
-
-  /* Button styling */
-  .card button {
-    width: calc(160px * var(--scale));
-    height: calc(48px * var(--scale));
-    min-height: var(--touch-target);
-    font-size: var(--font-size);
-    border-radius: calc(24px * var(--scale));
-    margin: calc(20px * var(--scale)) auto 0 auto;
-  }
-
-  /* ===== Fix Body and Overflow ===== */
-  html, body {
-    margin: 0;
-    padding: 0;
-    height: 100%;
-    overflow: hidden;
-  }
-
-  .card-top{ 
-    width:100%; 
-    display:flex; 
-    align-items:center; 
-    justify-content:space-between; 
-    margin-bottom: calc(12px * var(--scale));
-  }
-  .back{
-    width: var(--touch-target); 
-    height: var(--touch-target); 
-    border-radius: calc(var(--base-border-radius) * var(--scale)); 
-    display:flex; align-items:center; justify-content:center;
-    background:rgba(255,255,255,.12); 
-    border:1px solid rgba(255,255,255,.18); 
-    cursor:pointer; 
-    visibility:hidden; opacity:0;
-    transition:transform .12s ease, opacity .12s ease;
-    font-size: calc(20px * var(--scale));
-  }
-  .back.show{ visibility:visible; opacity:1; }
-  .back:hover{ transform:translateX(calc(-3px * var(--scale))); }
-  
-  .plate-icon {
-    width: calc(150px * var(--scale)); 
-    height: calc(44px * var(--scale)); 
-    border: calc(10px * var(--scale)) solid #fff; 
-    border-radius: calc(6px * var(--scale)); 
-    background: transparent; 
-    display: inline-block;
-  }
-
-  .icon {
-    margin: calc(8px * var(--scale)) auto calc(6px * var(--scale)); 
-    display:flex; 
-    align-items:center; 
-    justify-content:center; 
-    color:#fff; 
-    min-height: var(--icon-size);
-  }
-  .icon i { font-size: var(--icon-size); }
-
-  .icon svg{ 
-    width: calc(44px * var(--scale)); 
-    height: calc(44px * var(--scale)); 
-    stroke:#e63946; 
-    fill:none; 
-    stroke-width:1.8; 
-    stroke-linecap:round; 
-    stroke-linejoin:round; 
-  }
-  .heading{ 
-    font-size: var(--font-heading); 
-    letter-spacing:.12em; 
-    font-weight:900; 
-    text-transform:uppercase; 
-    margin-top: calc(4px * var(--scale)); 
-    margin-bottom: calc(8px * var(--scale)); 
-  }
-
-  .field{ 
-    width:100%; 
-    margin: calc(12px * var(--scale)) 0; 
-  }
-  .input{ 
-    width:100%; 
-    border-radius: calc(var(--base-border-radius) * var(--scale)); 
-    padding: calc(14px * var(--scale)) calc(14px * var(--scale)); 
-    background:#fff; 
-    border:0; 
-    color:#111; 
-    font-size: var(--font-size); 
-    outline:none;
-    min-height: var(--touch-target);
-  }
-  .row-2{ 
-    display:grid; 
-    grid-template-columns: calc(110px * var(--scale)) 1fr; 
-    gap: calc(10px * var(--scale)); 
-  }
-  /* FIX: keep step-2 inputs inside the card and aligned with grid */
-  .row-2 .input{ 
-    width:100%; 
-    margin:0; 
-  }
-  .select-toggle{
-    width:100%; 
-    display:flex; 
-    align-items:center; 
-    justify-content:space-between; 
-    gap: calc(10px * var(--scale));
-    padding: calc(14px * var(--scale)); 
-    border-radius: calc(var(--base-border-radius) * var(--scale)); 
-    background:#fff; 
-    color:#111; 
-    cursor:pointer; 
-    font-weight:700;
-    font-size: var(--font-size);
-    min-height: var(--touch-target);
-  }
-
-  .error{ 
-    color:#FFD2D2; 
-    font-size: calc(13px * var(--scale)); 
-    margin-top: calc(8px * var(--scale)); 
-    display:none; 
-  }
-
-  .progress{ 
-    display:flex; 
-    justify-content:center; 
-    gap: calc(8px * var(--scale)); 
-    margin-top:auto; 
-    padding-bottom: calc(8px * var(--scale)); 
-  }
-  .dot{ 
-    width: calc(10px * var(--scale)); 
-    height: calc(10px * var(--scale)); 
-    border-radius:50%; 
-    background:rgba(255,255,255,.46); 
-  }
-  .dot.on{ 
-    background:#fff; 
-    transform:scale(1.1); 
-  }
-
-  .footer{ 
-    display:flex; 
-    justify-content:center; 
-    gap: calc(12px * var(--scale)); 
-    margin-top: calc(12px * var(--scale)); 
-  }
-  .pill{ 
-    background:#fff; 
-    color:#0b0d10; 
-    border:none; 
-    padding: calc(12px * var(--scale)) calc(22px * var(--scale)); 
-    border-radius:999px; 
-    font-weight:900; 
-    cursor:pointer; 
-    box-shadow:0 calc(10px * var(--scale)) calc(30px * var(--scale)) rgba(2,6,23,.45);
-    font-size: var(--font-size);
-    min-height: var(--touch-target);
-  }
-  .pill:disabled{ 
-    opacity:.55; 
-    cursor:not-allowed; 
-    box-shadow:none; 
-  }
-
-  /* Picker Modal */
-  .picker-overlay{ 
-    position:fixed; 
-    inset:0; 
-    display:flex; 
-    align-items:center; 
-    justify-content:center; 
-    background:rgba(0,0,0,.45); 
-    z-index:1400; 
-    opacity:0; 
-    pointer-events:none; 
-    transition:opacity .18s ease; 
-  }
-  .picker-overlay.show{ opacity:1; pointer-events:auto; }
-  .picker {
-    width: min(calc(520px * var(--scale)), 94vw); 
-    max-height:68vh; 
-    background:#000; 
-    border-radius: calc(16px * var(--scale)); 
-    padding: calc(12px * var(--scale)); 
-    border:1px solid #1a1a1a; 
-    box-shadow:0 calc(30px * var(--scale)) calc(90px * var(--scale)) rgba(0,0,0,.6);
-  }
-  .picker-head{ 
-    font-weight:800; 
-    font-size: calc(13px * var(--scale)); 
-    color:#bbb; 
-    padding: calc(6px * var(--scale)) calc(8px * var(--scale)); 
-    text-transform:uppercase; 
-    letter-spacing:.08em; 
-  }
-  .wheel{ 
-    overflow:auto; 
-    max-height:44vh; 
-    scroll-snap-type:y mandatory; 
-    padding-right: calc(8px * var(--scale)); 
-    margin-top: calc(6px * var(--scale)); 
-  }
-  .opt {
-    width: 90%; 
-    height: var(--touch-target); 
-    margin: calc(6px * var(--scale)) auto; 
-    border-radius: calc(8px * var(--scale)); 
-    background: #0f0f0f; 
-    border: 1px solid #1b1b1b; 
-    color: #fff; 
-    font-size: var(--font-size);
-    display: flex; 
-    justify-content: center; 
-    align-items: center; 
-    cursor: pointer; 
-    text-align: center;
-  }
-  .opt:hover { background: #131313; }
-  .opt.sel{ outline:2px solid #fff; }
-  .picker-actions{ 
-    display:flex; 
-    justify-content:flex-end; 
-    gap: calc(10px * var(--scale)); 
-    padding-top: calc(8px * var(--scale)); 
-  }
-  .btn-ghost{ 
-    background:transparent; 
-    border:1px solid #222; 
-    color:#fff; 
-    padding: calc(8px * var(--scale)) calc(12px * var(--scale)); 
-    border-radius: calc(10px * var(--scale)); 
-    cursor:pointer;
-    font-size: var(--font-size);
-    min-height: var(--touch-target);
-  }
-
-  /* === Toasts (centered, fade, one-at-a-time) === */
-  .toast {
-    position: fixed;
-    top: 50%;
-    left: 50%;
-    transform: translate(-50%, -50%);
-    padding: calc(18px * var(--scale)) calc(28px * var(--scale));
-    border-radius: calc(16px * var(--scale));
-    font-size: calc(14px * var(--scale));
-    font-weight: 500;
-    display: flex;
-    align-items: center;
-    justify-content: space-between;
-    gap: calc(20px * var(--scale));
-    box-shadow: 0 calc(6px * var(--scale)) calc(20px * var(--scale)) rgba(0,0,0,0.25);
-    z-index: 2000;
-    min-width: calc(360px * var(--scale));
-    max-width: calc(360px * var(--scale));
-    opacity: 0;
-    pointer-events: none;
-    transition: all 0.35s ease;
-  }
-  .toast.show {
-    opacity: 1;
-    pointer-events: auto;
-    transform: translate(-50%, -50%) scale(1.02);
-  }
-  .toast.hide {
-    opacity: 0;
-    pointer-events: none;
-    transform: translate(-50%, -50%) scale(0.98);
-  }
-  .toast-success { background: linear-gradient(135deg, #2ecc71, #27ae60); color: #fff; }
-  .toast-error { background: #b71c1c; color: #fff; }
-  .toast-close { 
-    font-size: calc(14px * var(--scale)); 
-    font-weight: 400; 
-    color: rgba(255,255,255,0.85); 
-    cursor: pointer; 
-    transition: color 0.2s ease;
-    min-width: calc(40px * var(--scale));
-    text-align: center;
-  }
-  .toast-close:hover { color: #fff; }
-
-  /* Responsive adjustments for specific screen sizes */
-  @media (max-width: 767px) {
-    .cards-container {
-      padding: calc(10px * var(--scale));
-    }
-    
-    body {
-      padding: calc(40px * var(--scale)) calc(10px * var(--scale)) calc(60px * var(--scale));
-    }
-  }
-
-  /* High DPI displays enhancement */
-  @media (-webkit-min-device-pixel-ratio: 2), (min-resolution: 192dpi) {
-    .card {
-      box-shadow: 0 calc(22px * var(--scale)) calc(60px * var(--scale)) rgba(2,6,23,.8);
-    }
-  }
-</style>
-</head>
-<body>
-
-<!-- Top chrome -->
-<div class="topbar">
-  <div class="hamburger" id="menuToggle" aria-label="Menu" title="Menu">
-    <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="white" stroke-linecap="round" stroke-linejoin="round">
-      <line x1="4" y1="8" x2="20" y2="8"/>
-      <line x1="4" y1="12" x2="20" y2="12"/>
-      <line x1="4" y1="16" x2="20" y2="16"/>
-    </svg>
-  </div>
-</div>
-
-<!-- Overlay -->
-<div id="overlay"></div>
-
-<!-- Drawer -->
-<div class="drawer" id="drawer">
-  <div class="drawer-header">
-    <h3>MENU</h3>
-  </div>
-  <button class="logout" onclick="logout()">Logout</button>
-</div>
-
-<div class="cards-container">
-  <div class="stage" id="stage">
-    <div class="stack" id="stack">
-    <!-- STEP 1 -->
-    <div class="card" data-step="0">
-      <div class="card-top">
-        <div class="back" id="back-0" aria-label="Go back"></div>
-        <div style="width:44px"></div>
-      </div>
-      <div class="icon"><i class="ph ph-user-circle"></i></div>
-      <div class="heading">ADD CUSTOMER NAME</div>
-      <div class="field">
-        <input id="customer" class="input" placeholder="Customer Name" minlength="2" oninput="this.value=this.value.replace(/[^A-Za-z ]/g,'')" />
-        <div class="error" id="err_customer">At least 2 letters (A–Z and spaces).</div>
-      </div>
-      <div class="progress"></div>
-      <div class="footer">
-        <button class="pill" id="next-0" disabled>Next</button>
-      </div>
-    </div>
-
-    <!-- STEP 2 -->
-    <div class="card" data-step="1">
-      <div class="card-top">
-        <div class="back" id="back-1" aria-label="Go back">&#8592;</div>
-        <div style="width:44px"></div>
-      </div>
-      <div class="icon"><div class="plate-icon"></div></div>
-      <div class="heading">ADD VEHICLE NUMBER</div>
-      <div class="field row-2">
-        <input id="vehicle_code" class="input" placeholder="Code" maxlength="2" oninput="this.value=this.value.toUpperCase().replace(/[^A-Z]/g,'')" />
-        <input id="vehicle_number" class="input" placeholder="Number" maxlength="5" oninput="this.value=this.value.replace(/[^0-9]/g,'')" />
-      </div>
-      <div class="error" id="err_vehicle">Vehicle code (1–2 letters) & number (1–5 digits) required.</div>
-      <div class="progress"></div>
-      <div class="footer">
-        <button class="pill" id="next-1" disabled>Next</button>
-      </div>
-    </div>
-
-    <!-- STEP 3 -->
-    <div class="card" data-step="2">
-      <div class="card-top">
-        <div class="back" id="back-2" aria-label="Go back">&#8592;</div>
-        <div style="width:44px"></div>
-      </div>
-      <div class="icon"><i class="ph ph-car"></i></div>
-      <div class="heading">ADD VEHICLE NAME</div>
-      <div class="field">
-        <input id="vehicle_name" class="input" placeholder="Vehicle Name" minlength="2" oninput="this.value=this.value.replace(/[^A-Za-z0-9 ]/g,'')" />
-        <div class="error" id="err_vehicle_name">At least 2 characters (letters/numbers allowed).</div>
-      </div>
-      <div class="progress"></div>
-      <div class="footer">
-        <button class="pill" id="next-2" disabled>Next</button>
-      </div>
-    </div>
-
-    <!-- STEP 4 -->
-    <div class="card" data-step="3">
-      <div class="card-top">
-        <div class="back" id="back-3" aria-label="Go back">&#8592;</div>
-        <div style="width:44px"></div>
-      </div>
-      <div class="icon"><i class="ph ph-gear"></i></div>
-      <div class="heading">SELECT DEPARTMENT</div>
-      <div class="field">
-        <input type="hidden" id="department" />
-        <div class="select-toggle" data-target="department" id="toggle-department">
-          <span class="val" id="label_department">Tap to select...</span>
-          <span class="chev" aria-hidden="true">▾</span>
-        </div>
-        <div class="error" id="err_department">Please select a department.</div>
-      </div>
-      <div class="progress"></div>
-      <div class="footer">
-        <button class="pill" id="next-3" disabled>Next</button>
-      </div>
-    </div>
-
-    <!-- STEP 5 -->
-    <div class="card" data-step="4">
-      <div class="card-top">
-        <div class="back" id="back-4" aria-label="Go back">&#8592;</div>
-        <div style="width:44px"></div>
-      </div>
-      <div class="icon"><i class="ph ph-user"></i></div>
-      <div class="heading">SELECT TECHNICIAN</div>
-      <div class="field">
-        <input type="hidden" id="technician" />
-        <div class="select-toggle" data-target="technician" id="toggle-technician">
-          <span class="val" id="label_technician">Tap to select...</span>
-          <span class="chev" aria-hidden="true">▾</span>
-        </div>
-        <div class="error" id="err_technician">Please select a technician.</div>
-      </div>
-      <div class="progress"></div>
-      <div class="footer">
-        <button class="pill" id="next-4" disabled>Next</button>
-      </div>
-    </div>
-
-    <!-- STEP 6 -->
-    <div class="card" data-step="5">
-      <div class="card-top">
-        <div class="back" id="back-5" aria-label="Go back">&#8592;</div>
-        <div style="width:44px"></div>
-      </div>
-      <div class="icon"><i class="ph ph-wrench"></i></div>
-      <div class="heading">SELECT SERVICE</div>
-      <div class="field">
-        <input type="hidden" id="service" />
-        <div class="select-toggle" data-target="service" id="toggle-service">
-          <span class="val" id="label_service">Tap to select...</span>
-          <span class="chev" aria-hidden="true">▾</span>
-        </div>
-        <div class="error" id="err_service">Please select a service.</div>
-      </div>
-      <div class="progress"></div>
-      <div class="footer">
-        <button class="pill" id="next-5" disabled>Next</button>
-      </div>
-    </div>
-
-    <!-- STEP 7 -->
-    <div class="card" data-step="6">
-      <div class="card-top">
-        <div class="back" id="back-6" aria-label="Go back">&#8592;</div>
-        <div style="width:44px"></div>
-      </div>
-      <div class="icon"><i class="ph ph-flag"></i></div>
-      <div class="heading">SELECT STATUS</div>
-      <div class="field">
-        <input type="hidden" id="status" />
-        <div class="select-toggle" data-target="status" id="toggle-status">
-          <span class="val" id="label_status">Tap to select...</span>
-          <span class="chev" aria-hidden="true">▾</span>
-        </div>
-        <div class="error" id="err_status">Please select a status.</div>
-      </div>
-      <div class="progress"></div>
-      <div class="footer">
-        <button class="pill" id="next-6" disabled>Submit</button>
-      </div>
-   </div>
-  </div>
-</div>
-
-<!-- Picker modal -->
-<div class="picker-overlay" id="pickerOverlay" aria-hidden="true">
-  <div class="picker" role="dialog" aria-modal="true" aria-labelledby="pickerTitle">
-    <div class="picker-head" id="pickerTitle">Select</div>
-    <div class="wheel" id="pickerWheel"></div>
-    <div class="picker-actions">
-      <button class="btn-ghost" id="pickerCancel">Cancel</button>
-    </div>
-  </div>
-</div>
-
-<!-- Toasts -->
-<div id="toast-success" class="toast toast-success" onclick="closeToast('toast-success')">
-  <span>Vehicle added successfully</span>
-  <span class="toast-close">Close</span>
-</div>
-<div id="toast-error" class="toast toast-error" onclick="closeToast('toast-error')">
-  <span>Sorry, network issue. Please try again later</span>
-  <span class="toast-close">Close</span>
-</div>
-
-<script>
-/* ===== Server options ===== */
-const OPTIONS = {
-  department: {{ departments|tojson }},
-  technician: {{ technicians|tojson }},
-  service:    {{ services|tojson }},
-  status:     {{ statuses|tojson }}
-};
-
-/* ===== Cards / stack ===== */
-const cards = Array.from(document.querySelectorAll('.card'));
-let current = 0;
-let submitLock = false; // guard to prevent double-submit
-
-function renderDots(){
-  cards.forEach((c, idx)=>{
-    const p = c.querySelector('.progress');
-    if(!p) return;
-    if(p.children.length === 0){
-      for(let i=0;i<7;i++){
-        const d = document.createElement('div');
-        d.className = 'dot';
-        p.appendChild(d);
-      }
-    }
-    [...p.children].forEach((d,i)=> d.classList.toggle('on', i===idx));
-  });
-}
-function layout(){
-  cards.forEach((c,i)=>{
-    c.classList.remove('left-off','prev','active','next','right-off');
-    const d = i - current;
-    if(d === 0) c.classList.add('active');
-    else if(d === -1) c.classList.add('prev');
-    else if(d === 1) c.classList.add('next');
-    else if(d < -1) c.classList.add('left-off');
-    else c.classList.add('right-off');
-    const back = c.querySelector('.back');
-    if(back){ back.classList.toggle('show', current > 0 && i===current); }
-  });
-  renderDots();
-  updateNextState();
-}
-layout();
-
-/* ===== Validation ===== */
-function validateName(){
-  const v = document.getElementById('customer').value.trim();
-  return /^[A-Za-z ]{2,}$/.test(v);
-}
-function validateVehicle(){
-  const code = (document.getElementById('vehicle_code').value||'').trim();
-  const num  = (document.getElementById('vehicle_number').value||'').trim();
-  return /^[A-Z]{1,2}$/.test(code) && /^[0-9]{1,5}$/.test(num);
-}
-function validateVehicleName(){
-  const v = document.getElementById('vehicle_name').value.trim();
-  return /^[A-Za-z0-9 ]{2,}$/.test(v);
-}
-function hasValHidden(id){ return !!(document.getElementById(id).value || '').trim(); }
-
-function isStepValid(i){
-  switch(i){
-    case 0: return validateName();
-    case 1: return validateVehicle();
-    case 2: return validateVehicleName();
-    case 3: return hasValHidden('department');
-    case 4: return hasValHidden('technician');
-    case 5: return hasValHidden('service');
-    case 6: return hasValHidden('status');
-    default: return true;
-  }
-}
-function showErrors(i){
-  switch(i){
-    case 0: document.getElementById('err_customer').style.display = validateName()?'none':'block'; break;
-    case 1: document.getElementById('err_vehicle').style.display = validateVehicle()?'none':'block'; break;
-    case 2: document.getElementById('err_vehicle_name').style.display = validateVehicleName()?'none':'block'; break;
-    case 3: document.getElementById('err_department').style.display = hasValHidden('department')?'none':'block'; break;
-    case 4: document.getElementById('err_technician').style.display = hasValHidden('technician')?'none':'block'; break;
-    case 5: document.getElementById('err_service').style.display = hasValHidden('service')?'none':'block'; break;
-    case 6: document.getElementById('err_status').style.display = hasValHidden('status')?'none':'block'; break;
-  }
-}
-function updateNextState(){
-  const nextBtn = cards[current].querySelector('.pill');
-  if(nextBtn) nextBtn.disabled = !isStepValid(current);
-}
-
-/* live validation hooks */
-['customer','vehicle_code','vehicle_number','vehicle_name'].forEach(id=>{
-  const el = document.getElementById(id);
-  if(el) el.addEventListener('input', updateNextState);
-});
-['department','technician','service','status'].forEach(id=>{
-  const el = document.getElementById(id);
-  if(el) el.addEventListener('change', updateNextState);
-});
-
-/* ===== Navigation ===== */
-function next(){
-  if(!isStepValid(current)){
-    showErrors(current);
-    updateNextState();
-    return;
-  }
-  if(current < cards.length - 1){
-    current++;
-    layout();
-    focusFirst(current);
-  } else {
-    submitData();
-  }
-}
-function back(){
-  if(current > 0){
-    current--;
-    layout();
-    focusFirst(current);
-  }
-}
-/* buttons */
-for(let i=0;i<7;i++){
-  const btn = document.getElementById('next-'+i);
-  if(btn) btn.addEventListener('click', ()=>{ if(i===current) next(); });
-}
-document.querySelectorAll('.back').forEach(b=> b.addEventListener('click', back));
-/* enter key advances if valid (disabled while picker is open) */
-document.addEventListener('keydown', (e)=>{
-  if(e.key === 'Enter'){
-    if(document.getElementById('pickerOverlay').classList.contains('show')) return;
-    e.preventDefault();
-    const btn = cards[current].querySelector('.pill');
-    if(btn && !btn.disabled) next();
-  }
-});
-function focusFirst(i){
-  const el = cards[i].querySelector('input:not([type="hidden"]),.select-toggle');
-  if(el && el.focus) el.focus();
-}
-
-/* ===== Picker modal ===== */
-const pickerOverlay = document.getElementById('pickerOverlay');
-const pickerWheel = document.getElementById('pickerWheel');
-const pickerCancel = document.getElementById('pickerCancel');
-const pickerTitle = document.getElementById('pickerTitle');
-let pickerTarget = null;
-let tempValue = null;
-
-function openPicker(target){
-  pickerTarget = target;
-  tempValue = document.getElementById(target).value || null;
-  pickerTitle.textContent = 'Select ' + target.charAt(0).toUpperCase() + target.slice(1);
-  pickerWheel.innerHTML = '';
-  const items = OPTIONS[target] || [];
-  items.forEach(val=>{
-    const row = document.createElement('div');
-    row.className = 'opt' + (val === tempValue ? ' sel' : '');
-    row.textContent = val;
-    row.onclick = ()=>{ tempValue = val; commitPicker(); };
-    pickerWheel.appendChild(row);
-  });
-  pickerOverlay.classList.add('show');
-}
-function commitPicker(){
-  if(!pickerTarget) return;
-  document.getElementById(pickerTarget).value = tempValue || '';
-  const label = document.getElementById('label_'+pickerTarget);
-  if(label) label.textContent = tempValue || 'Tap to select...';
-  pickerOverlay.classList.remove('show');
-  updateNextState();
-  pickerTarget = null; tempValue = null;
-}
-function closePicker(){ pickerOverlay.classList.remove('show'); pickerTarget=null; tempValue=null; }
-pickerCancel.addEventListener('click', closePicker);
-pickerOverlay.addEventListener('click', (e)=>{ if(e.target === pickerOverlay) closePicker(); });
-document.querySelectorAll('.select-toggle').forEach(el=>{
-  el.addEventListener('click', ()=> openPicker(el.getAttribute('data-target')));
-});
-
-/* ===== Toasts ===== */
-function showToast(id) {
-  document.querySelectorAll(".toast.show").forEach(t => {
-    t.classList.remove("show");
-    t.classList.add("hide");
-  });
-  const toast = document.getElementById(id);
-  if (!toast) return;
-  toast.classList.remove("hide");
-  toast.classList.add("show");
-  const duration = (id === "toast-error") ? 5000 : 3000;
-  setTimeout(() => closeToast(id), duration);
-}
-function closeToast(id) {
-  const toast = document.getElementById(id);
-  if (!toast) return;
-  toast.classList.remove("show");
-  toast.classList.add("hide");
-}
-
-/* ===== Submit ===== */
-async function submitData(){
-  if(submitLock) return;
-
-  // final sweep for validation
-  for(let i=0;i<cards.length;i++){
-    if(!isStepValid(i)){
-      current = i; layout(); showErrors(i); return;
-    }
-  }
-
-  const payload = {
-    customer: (document.getElementById('customer').value||'').trim(),
-    vehicle_name: (document.getElementById('vehicle_name').value||'').trim(),
-    department: (document.getElementById('department').value||'').trim(),
-    technician: (document.getElementById('technician').value||'').trim(),
-    service: (document.getElementById('service').value||'').trim(),
-    status: (document.getElementById('status').value||'').trim()
-  };
-  const code = (document.getElementById('vehicle_code').value||'').toUpperCase().trim();
-  const num  = (document.getElementById('vehicle_number').value||'').trim();
-  payload.vehicle_no = [code, num].filter(Boolean).join(' ');
-
-  submitLock = true;
-  const btn = cards[current].querySelector('.pill');
-  if(btn) btn.disabled = true;
-
-  try {
-    const res = await fetch('/api/add', {
-      method:'POST',
-      headers:{'Content-Type':'application/json'},
-      body: JSON.stringify(payload)
-    });
-
-    if (res.ok) {
-      showToast('toast-success');
-     setTimeout(()=> location.reload(), 1200);
-    } else {
-      showToast('toast-error');
-      submitLock = false; if(btn) btn.disabled = false;
-    }
-  } catch(e){
-    showToast('toast-error');
-    submitLock = false; if(btn) btn.disabled = false;
-  }
-}
-
-/* ===== Drawer ===== */
-const menuToggle = document.getElementById('menuToggle');
-const drawer = document.getElementById('drawer');
-const overlay = document.getElementById('overlay');
-
-function openDrawer() {
-  drawer.classList.add('active');
-  overlay.classList.add('active');
-  drawer.setAttribute('aria-hidden','false');
-  menuToggle.style.opacity = '0';
-  menuToggle.style.pointerEvents = 'none';
-}
-function closeDrawer() {
-  drawer.classList.remove('active');
-  overlay.classList.remove('active');
-  drawer.setAttribute('aria-hidden','true');
-  menuToggle.style.opacity = '1';
-  menuToggle.style.pointerEvents = 'auto';
-}
-menuToggle.addEventListener('click', openDrawer);
-overlay.addEventListener('click', closeDrawer);
-
-/* ===== Logout ===== */
-function logout() {
-  window.location.href = "{{ url_for('logout') }}";
-}
-
-/* init */
-renderDots();
-updateNextState();
-</script>
-</body>
-</html>
-""",
-        departments=departments, technicians=technicians, services=services, statuses=STATUSES
-    )
-###############################################################################
-# Staff
-###############################################################################
-@app.route("/staff")
-def staff():
-    if session.get("user") != "staff":
-        return redirect("/")
-
-    vehicles = read_vehicles()
-
-    return render_template_string(
-        r"""<!doctype html>
-<html>
-<head>
-  <meta name="viewport" content="width=device-width, initial-scale=1, maximum-scale=1, user-scalable=no">
-  <title>Staff Panel</title>
-  <link rel="stylesheet" href="https://unpkg.com/@phosphor-icons/web@2.0.3/src/regular/style.css">
-  <style>
-      /* Hide scrollbars */
-    ::-webkit-scrollbar {
-      display: none;
-    }
-    * {
-      scrollbar-width: none;
-      -ms-overflow-style: none;
-    }
-    .scrollable::-webkit-scrollbar {
-      display: none;
-    }
-
-    body {
-      margin: 0;
-      font-family: Inter, "Segoe UI", system-ui, -apple-system, sans-serif;
-      background: radial-gradient(800px 500px at 10% 10%, #11141a 0%, rgba(0,0,0,0) 30%), linear-gradient(180deg, #0b0d10, #0f1418);
-      color: #fff;
-      min-height: 100vh;
-      overflow-x: hidden;
-      -webkit-overflow-scrolling: touch;
-      overscroll-behavior: none;
-      background-attachment: fixed;
-    }
-    
-    html {
-      -webkit-overflow-scrolling: touch;
-      overscroll-behavior: none;
-    }
-
-    /* Top Controls - Responsive */
-    .top-controls {
-      position: fixed;
-      top: 16px;
-      right: 16px;
-      z-index: 50;
-      display: flex;
-      gap: 12px;
-      transition: opacity 0.15s ease;
-    }
-    
-    @media (max-width: 480px) {
-      .top-controls {
-        top: 8px;
-        right: 8px;
-        gap: 8px;
-      }
-    }
-    
-    @media (max-width: 360px) {
-      .top-controls {
-        top: 4px;
-        right: 4px;
-        gap: 6px;
-      }
-    }
-    
-    .top-controls.fade {
-      opacity: 0;
-      transform: translateY(-10px);
-      pointer-events: none;
-    }
-
-    .top-controls.fade .search-input-container {
-      opacity: 0.5;
-      transition: opacity 0.3s ease;
-    }
-    
-    .control-btn {
-      width: 44px;
-      height: 44px;
-      border-radius: 12px;
-      display: flex;
-      align-items: center;
-      justify-content: center;
-      background: rgba(255,255,255,.06);
-      border: 1px solid rgba(255,255,255,.08);
-      backdrop-filter: blur(8px);
-      cursor: pointer;
-      transition: transform 0.3s ease;
-      position: relative;
-    }
-    
-    @media (max-width: 480px) {
-      .control-btn {
-        width: 40px;
-        height: 40px;
-        border-radius: 10px;
-      }
-    }
-    
-    @media (max-width: 360px) {
-      .control-btn {
-        width: 36px;
-        height: 36px;
-        border-radius: 8px;
-      }
-    }
-    
-    .control-btn:hover {
-      transform: translateY(-2px);
-    }
-
-    /* Search - Responsive */
-    .search-container {
-      display: flex;
-      align-items: center;
-      gap: 8px;
-    }
-    
-    .search-input-container {
-      display: none;
-      align-items: center;
-      background: rgba(255,255,255,.06);
-      border: 1px solid rgba(255,255,255,.08);
-      border-radius: 12px;
-      padding: 12px 16px;
-      backdrop-filter: blur(8px);
-      transition: all 0.3s ease;
-      animation: slideInFromRight 0.3s ease;
-    }
-    
-    @media (max-width: 768px) {
-      .search-input-container {
-        padding: 10px 12px;
-        border-radius: 10px;
-      }
-    }
-    
-    @media (max-width: 480px) {
-      .search-input-container {
-        padding: 8px 10px;
-        border-radius: 8px;
-      }
-    }
-    
-    .search-input-container.show {
-      display: flex;
-    }
-    
-    .search-input {
-      background: transparent;
-      border: none;
-      color: #fff;
-      outline: none;
-      width: 256px;
-      margin-left: 8px;
-    }
-    
-    @media (max-width: 768px) {
-      .search-input {
-        width: 200px;
-      }
-    }
-    
-    @media (max-width: 480px) {
-      .search-input {
-        width: 150px;
-        margin-left: 6px;
-      }
-    }
-    
-    @media (max-width: 360px) {
-      .search-input {
-        width: 120px;
-        margin-left: 4px;
-      }
-    }
-    
-    .search-input::placeholder {
-      color: rgba(255,255,255,0.5);
-    }
-    
-    .search-clear {
-      margin-left: 8px;
-      color: rgba(255,255,255,0.75);
-      background: none;
-      border: none;
-      cursor: pointer;
-    }
-
-    /* Watch List - Responsive */
-    .watch-badge {
-      position: absolute;
-      top: -4px;
-      right: -4px;
-      width: 20px;
-      height: 20px;
-      border-radius: 50%;
-      background: #E63946;
-      color: #fff;
-      font-size: 12px;
-      font-weight: 600;
-      display: flex;
-      align-items: center;
-      justify-content: center;
-    }
-    
-    @media (max-width: 480px) {
-      .watch-badge {
-        width: 18px;
-        height: 18px;
-        font-size: 10px;
-        top: -3px;
-        right: -3px;
-      }
-    }
-
-    .watch-dropdown {
-      position: absolute;
-      top: 100%;
-      right: 0;
-      margin-top: 8px;
-      width: 384px;
-      background: #0e1116;
-      border: 1px solid #1b1f27;
-      border-radius: 16px;
-      backdrop-filter: blur(8px);
-      box-shadow: 0 25px 50px rgba(0,0,0,0.25);
-      z-index: 60;
-      display: none;
-      opacity: 0;
-      transform: translateY(-8px);
-      transition: opacity 0.3s ease, transform 0.3s ease;
-    }
-    
-    @media (max-width: 768px) {
-      .watch-dropdown {
-        width: 320px;
-        border-radius: 12px;
-      }
-    }
-    
-    @media (max-width: 480px) {
-      .watch-dropdown {
-        width: 280px;
-        border-radius: 10px;
-        margin-top: 6px;
-      }
-    }
-    
-    @media (max-width: 360px) {
-      .watch-dropdown {
-        width: 250px;
-        border-radius: 8px;
-        margin-top: 4px;
-      }
-    }
-    
-    .watch-dropdown.show {
-      display: block;
-      opacity: 1;
-      transform: translateY(0);
-    }
-    
-    .watch-dropdown-header {
-      padding: 20px;
-      border-bottom: 1px solid #1b1f27;
-    }
-    
-    @media (max-width: 480px) {
-      .watch-dropdown-header {
-        padding: 16px;
-      }
-    }
-    
-    @media (max-width: 360px) {
-      .watch-dropdown-header {
-        padding: 12px;
-      }
-    }
-    
-    .watch-dropdown-header h3 {
-      font-size: 18px;
-      font-weight: 600;
-      color: #fff;
-      margin: 0;
-    }
-    
-    @media (max-width: 480px) {
-      .watch-dropdown-header h3 {
-        font-size: 16px;
-      }
-    }
-    
-    .watch-dropdown-content {
-      max-height: 384px;
-      overflow-y: auto;
-      scroll-behavior: smooth;
-    }
-    
-    @media (max-width: 480px) {
-      .watch-dropdown-content {
-        max-height: 300px;
-      }
-    }
-
-    .watch-dropdown-content:hover {
-      overscroll-behavior: contain;
-    }
-    
-    .watch-item {
-      padding: 16px;
-      border-bottom: 1px solid rgba(27,31,39,0.3);
-      display: flex;
-      justify-content: space-between;
-      align-items: flex-start;
-      transition: transform 0.2s ease;
-    }
-    
-    @media (max-width: 480px) {
-      .watch-item {
-        padding: 12px;
-      }
-    }
-    
-    .watch-item:hover {
-      transform: scale(1.02);
-    }
-    
-    .watch-item-info {
-      flex: 1;
-    }
-    
-    .watch-item-title {
-      color: #fff;
-      font-weight: 600;
-      margin-bottom: 4px;
-    }
-    
-    @media (max-width: 480px) {
-      .watch-item-title {
-        font-size: 14px;
-      }
-    }
-    
-    .watch-item-service {
-      color: rgba(255,255,255,0.75);
-      font-size: 14px;
-      margin-bottom: 4px;
-    }
-    
-    @media (max-width: 480px) {
-      .watch-item-service {
-        font-size: 12px;
-      }
-    }
-    
-    .watch-item-tech {
-      color: rgba(255,255,255,0.6);
-      font-size: 12px;
-    }
-    
-    @media (max-width: 480px) {
-      .watch-item-tech {
-        font-size: 10px;
-      }
-    }
-    
-    .watch-remove {
-      padding: 8px;
-      background: none;
-      border: none;
-      border-radius: 4px;
-      cursor: pointer;
-      transition: transform 0.2s ease;
-    }
-    
-    .watch-remove:hover {
-      transform: scale(1.1);
-    }
-
-    /* Overlay */
-    .overlay {
-      position: fixed;
-      inset: 0;
-      background: rgba(0,0,0,0);
-      backdrop-filter: blur(0px);
-      z-index: 40;
-      opacity: 0;
-      pointer-events: none;
-      transition: all 0.3s ease;
-    }
-    
-    .overlay.show {
-      backdrop-filter: blur(4px);
-      opacity: 1;
-      pointer-events: auto;
-    }
-
-    /* Drawer - Responsive */
-    .drawer {
-      position: fixed;
-      top: 0;
-      right: -320px;
-      width: 320px;
-      height: 100vh;
-      background: #0e1116;
-      border-left: 1px solid #1b1f27;
-      box-shadow: -16px 0 48px rgba(0,0,0,0.5);
-      z-index: 50;
-      transition: right 0.3s cubic-bezier(0.22, 1, 0.36, 1);
-    }
-    
-    @media (max-width: 480px) {
-      .drawer {
-        width: 280px;
-        right: -280px;
-      }
-    }
-    
-    @media (max-width: 360px) {
-      .drawer {
-        width: 250px;
-        right: -250px;
-      }
-    }
-    
-    .drawer.show {
-      right: 0;
-    }
-    
-    .drawer-header {
-      padding: 20px;
-      border-bottom: 1px solid #1b1f27;
-    }
-    
-    @media (max-width: 480px) {
-      .drawer-header {
-        padding: 16px;
-      }
-    }
-    
-    .drawer-header h3 {
-      font-size: 18px;
-      font-weight: 600;
-      color: #fff;
-      margin: 0;
-    }
-    
-    @media (max-width: 480px) {
-      .drawer-header h3 {
-        font-size: 16px;
-      }
-    }
-    
-    .logout-btn {
-      margin: 20px;
-      padding: 12px 16px;
-      border-radius: 12px;
-      border: none;
-      background: linear-gradient(90deg, #e63946, #d2353f);
-      color: #fff;
-      font-weight: 900;
-      cursor: pointer;
-      width: calc(100% - 40px);
-      transition: transform 0.3s ease;
-    }
-    
-    @media (max-width: 480px) {
-      .logout-btn {
-        margin: 16px;
-        padding: 10px 14px;
-        border-radius: 10px;
-        width: calc(100% - 32px);
-      }
-    }
-    
-    .logout-btn:hover {
-      transform: translateY(-2px);
-    }
-
-    /* Main Content - Responsive */
-    .main-content {
-      padding: 24px;
-      padding-top: 80px;
-      max-width: 1280px;
-      margin: 0 auto;
-    }
-    
-    @media (max-width: 768px) {
-      .main-content {
-        padding: 20px;
-        padding-top: 70px;
-      }
-    }
-    
-    @media (max-width: 480px) {
-      .main-content {
-        padding: 16px;
-        padding-top: 60px;
-      }
-    }
-    
-    @media (max-width: 360px) {
-      .main-content {
-        padding: 12px;
-        padding-top: 50px;
-      }
-    }
-
-    .page-title {
-      font-size: 30px;
-      font-weight: 700;
-      color: #fff;
-      margin-bottom: 32px;
-    }
-    
-    @media (max-width: 768px) {
-      .page-title {
-        font-size: 26px;
-        margin-bottom: 24px;
-      }
-    }
-    
-    @media (max-width: 480px) {
-      .page-title {
-        font-size: 22px;
-        margin-bottom: 20px;
-      }
-    }
-    
-    @media (max-width: 360px) {
-      .page-title {
-        font-size: 20px;
-        margin-bottom: 16px;
-      }
-    }
-
-    /* Table Container - Responsive */
-    .table-container {
-      background: rgba(255,255,255,.06);
-      border: 1px solid rgba(255,255,255,.08);
-      border-radius: 16px;
-      backdrop-filter: blur(8px);
-      box-shadow: 0 25px 50px rgba(0,0,0,0.25);
-      overflow: hidden;
-    }
-    
-    @media (max-width: 768px) {
-      .table-container {
-        border-radius: 12px;
-      }
-    }
-    
-    @media (max-width: 480px) {
-      .table-container {
-        border-radius: 10px;
-      }
-    }
-
-    .table-wrapper {
-      overflow-x: auto;
-    }
-
-    /* Desktop Table */
-    .desktop-table {
-      width: 100%;
-      border-collapse: collapse;
-      display: table;
-    }
-    
-    .desktop-table th {
-      text-align: left;
-      padding: 16px;
-      color: #fff;
-      font-weight: 600;
-      border-bottom: 1px solid rgba(255,255,255,0.1);
-    }
-    
-    @media (max-width: 768px) {
-      .desktop-table th {
-        padding: 12px 8px;
-        font-size: 14px;
-      }
-    }
-    
-    .desktop-table tr {
-      transition: all 0.2s ease-out;
-    }
-    
-    .desktop-table tr:not(:last-child) {
-      border-bottom: 1px solid rgba(255,255,255,0.05);
-    }
-    
-    .desktop-table tbody tr:hover {
-      transform: scale(1.01);
-      box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-    }
-
-    .desktop-table td {
-      padding: 16px;
-      color: rgba(255,255,255,0.9);
-    }
-    
-    @media (max-width: 768px) {
-      .desktop-table td {
-        padding: 12px 8px;
-        font-size: 14px;
-      }
-    }
-
-    /* Mobile Cards - Hidden on Desktop */
-    .mobile-cards {
-      display: none;
-    }
-    
-    @media (max-width: 640px) {
-      .desktop-table {
-        display: none;
-      }
-      
-      .mobile-cards {
-        display: block;
-        padding: 16px;
-      }
-    }
-    
-    @media (max-width: 480px) {
-      .mobile-cards {
-        padding: 12px;
-      }
-    }
-    
-    .vehicle-card {
-      background: rgba(255,255,255,.04);
-      border: 1px solid rgba(255,255,255,.06);
-      border-radius: 12px;
-      padding: 16px;
-      margin-bottom: 16px;
-      backdrop-filter: blur(4px);
-      transition: transform 0.2s ease, box-shadow 0.2s ease;
-    }
-    
-    @media (max-width: 480px) {
-      .vehicle-card {
-        border-radius: 10px;
-        padding: 14px;
-        margin-bottom: 14px;
-      }
-    }
-    
-    .vehicle-card:hover {
-      transform: translateY(-2px);
-      box-shadow: 0 8px 24px rgba(0,0,0,0.2);
-    }
-    
-    .card-header {
-      display: flex;
-      justify-content: space-between;
-      align-items: flex-start;
-      margin-bottom: 12px;
-      border-bottom: 1px solid rgba(255,255,255,0.1);
-      padding-bottom: 8px;
-    }
-    
-    .card-title {
-      font-size: 16px;
-      font-weight: 600;
-      color: #fff;
-      margin: 0;
-    }
-    
-    @media (max-width: 480px) {
-      .card-title {
-        font-size: 15px;
-      }
-    }
-    
-    .card-number {
-      font-size: 14px;
-      color: rgba(255,255,255,0.6);
-      font-weight: 500;
-    }
-    
-    @media (max-width: 480px) {
-      .card-number {
-        font-size: 13px;
-      }
-    }
-    
-    .card-row {
-      display: flex;
-      justify-content: space-between;
-      align-items: center;
-      margin: 8px 0;
-    }
-    
-    .card-label {
-      font-size: 13px;
-      color: rgba(255,255,255,0.7);
-      font-weight: 500;
-    }
-    
-    @media (max-width: 480px) {
-      .card-label {
-        font-size: 12px;
-      }
-    }
-    
-    .card-value {
-      font-size: 14px;
-      color: rgba(255,255,255,0.9);
-      text-align: right;
-    }
-    
-    @media (max-width: 480px) {
-      .card-value {
-        font-size: 13px;
-      }
-    }
-    
-    .card-actions {
-      display: flex;
-      justify-content: space-between;
-      align-items: center;
-      margin-top: 16px;
-      padding-top: 12px;
-      border-top: 1px solid rgba(255,255,255,0.1);
-    }
-    
-    @media (max-width: 480px) {
-      .card-actions {
-        margin-top: 14px;
-        padding-top: 10px;
-      }
-    }
-
-    /* Parts Status Button - Responsive */
-    .parts-btn {
-      display: flex;
-      align-items: center;
-      justify-content: space-between;
-      width: 128px;
-      max-width: 128px;
-      padding: 8px 12px;
-      background: rgba(255,255,255,.06);
-      border: 1px solid rgba(255,255,255,.08);
-      border-radius: 12px;
-      color: #fff;
-      font-weight: 600;
-      cursor: pointer;
-      transition: all 0.2s ease;
-      backdrop-filter: blur(8px);
-    }
-    
-    @media (max-width: 768px) {
-      .parts-btn {
-        width: 110px;
-        max-width: 110px;
-        padding: 6px 10px;
-        border-radius: 10px;
-        font-size: 13px;
-      }
-    }
-    
-    @media (max-width: 640px) {
-      .parts-btn {
-        width: 120px;
-        max-width: 120px;
-        padding: 8px 10px;
-        border-radius: 8px;
-        font-size: 12px;
-      }
-    }
-    
-    @media (max-width: 480px) {
-      .parts-btn {
-        width: 100px;
-        max-width: 100px;
-        padding: 6px 8px;
-        font-size: 11px;
-      }
-    }
-    
-    .parts-btn:hover {
-      background: rgba(255,255,255,.1);
-    }
-
-    /* Badges - Responsive */
-    .badge {
-      display: inline-block;
-      white-space: nowrap;
-      font-size: 14px !important;
-      font-weight: 600 !important;
-      padding: 6px 12px !important;
-      border-radius: 8px !important;
-      letter-spacing: 0.5px;
-      box-shadow: 0 2px 8px rgba(0,0,0,0.4);
-      text-transform: uppercase;
-    }
-    
-    @media (max-width: 768px) {
-      .badge {
-        font-size: 12px !important;
-        padding: 5px 10px !important;
-        border-radius: 6px !important;
-      }
-    }
-    
-    @media (max-width: 640px) {
-      .badge {
-        font-size: 11px !important;
-        padding: 4px 8px !important;
-        border-radius: 5px !important;
-      }
-    }
-    
-    @media (max-width: 480px) {
-      .badge {
-        font-size: 10px !important;
-        padding: 3px 6px !important;
-        border-radius: 4px !important;
-      }
-    }
-
-    .badge-success {
-      background-color: #28d17c !important;
-      color: #fff !important;
-    }
-
-    .badge-warning {
-      background-color: #ffc107 !important;
-      color: #212529 !important;
-    }
-
-    .badge-danger {
-      background-color: #ff3b30 !important;
-      color: #fff !important;
-    }
-    
-    .badge-paid {
-      background: #10b981;
-      color: #fff;
-    }
-    
-    .badge-advance {
-      background: #f59e0b;
-      color: #fff;
-    }
-    
-    .badge-unpaid {
-      background: #ef4444;
-      color: #fff;
-    }
-
-    /* Watch Button - Responsive */
-    .watch-btn {
-      padding: 8px;
-      background: none;
-      border: none;
-      border-radius: 8px;
-      cursor: pointer;
-      transition: transform 0.2s ease;
-    }
-    
-    @media (max-width: 640px) {
-      .watch-btn {
-        padding: 6px;
-        border-radius: 6px;
-      }
-    }
-    
-    .watch-btn:hover {
-      transform: scale(1.1);
-    }
-
-    /* Picker Modal - Responsive */
-    .picker-modal {
-      position: fixed;
-      inset: 0;
-      display: flex;
-      align-items: center;
-      justify-content: center;
-      z-index: 50;
-      opacity: 0;
-      pointer-events: none;
-      transition: all 0.3s ease;
-      padding: 16px;
-    }
-    
-    .picker-modal.show {
-      opacity: 1;
-      pointer-events: auto;
-    }
-    
-    .picker-content {
-      width: 100%;
-      max-width: 512px;
-      max-height: 384px;
-      background: #000;
-      border: 1px solid #1a1a1a;
-      border-radius: 16px;
-      padding: 12px;
-      box-shadow: 0 25px 50px rgba(0,0,0,0.6);
-    }
-    
-    @media (max-width: 768px) {
-      .picker-content {
-        max-width: 400px;
-        border-radius: 12px;
-      }
-    }
-    
-    @media (max-width: 480px) {
-      .picker-content {
-        max-width: 320px;
-        border-radius: 10px;
-        padding: 10px;
-      }
-    }
-    
-    @media (max-width: 360px) {
-      .picker-content {
-        max-width: 280px;
-        border-radius: 8px;
-      }
-    }
-    
-    .picker-header {
-      font-weight: 800;
-      font-size: 12px;
-      color: #bbb;
-      padding: 8px;
-      text-transform: uppercase;
-      letter-spacing: 0.08em;
-    }
-    
-    @media (max-width: 480px) {
-      .picker-header {
-        font-size: 11px;
-        padding: 6px;
-      }
-    }
-    
-    .picker-options {
-      overflow: auto;
-      max-height: 256px;
-      margin-top: 8px;
-      padding-right: 8px;
-    }
-    
-    @media (max-width: 480px) {
-      .picker-options {
-        max-height: 200px;
-      }
-    }
-    
-    .picker-option {
-      width: 90%;
-      height: 44px;
-      margin: 6px auto;
-      border-radius: 8px;
-      background: #0f0f0f;
-      border: 1px solid #1b1b1b;
-      color: #fff;
-      font-size: 18px;
-      display: flex;
-      justify-content: center;
-      align-items: center;
-      cursor: pointer;
-      text-align: center;
-      transition: all 0.2s ease;
-    }
-    
-    @media (max-width: 480px) {
-      .picker-option {
-        height: 40px;
-        font-size: 16px;
-        border-radius: 6px;
-      }
-    }
-    
-    .picker-option:hover {
-      background: #131313;
-    }
-    
-    .picker-option.selected {
-      outline: 2px solid #fff;
-    }
-    
-    .picker-actions {
-      display: flex;
-      justify-content: flex-end;
-      gap: 10px;
-      padding-top: 8px;
-    }
-    
-    .picker-cancel {
-      background: transparent;
-      border: 1px solid #222;
-      color: #fff;
-      padding: 8px 12px;
-      border-radius: 10px;
-      cursor: pointer;
-      transition: all 0.2s ease;
-    }
-    
-    @media (max-width: 480px) {
-      .picker-cancel {
-        padding: 6px 10px;
-        border-radius: 8px;
-        font-size: 14px;
-      }
-    }
-    
-    .picker-cancel:hover {
-      background: #222;
-    }
-
-    /* Toast - Responsive */
-    .toast {
-      position: fixed;
-      top: 50%;
-      left: 50%;
-      transform: translate(-50%, -50%);
-      padding: 20px 28px;
-      border-radius: 16px;
-      font-size: 14px;
-      font-weight: 500;
-      display: flex;
-      align-items: center;
-      justify-content: center;
-      box-shadow: 0 25px 50px rgba(0,0,0,0.25);
-      z-index: 100;
-      min-width: 384px;
-      max-width: 384px;
-      opacity: 0;
-      pointer-events: none;
-      transition: all 0.35s ease;
-    }
-    
-    @media (max-width: 768px) {
-      .toast {
-        min-width: 320px;
-        max-width: 320px;
-        padding: 16px 24px;
-        border-radius: 12px;
-      }
-    }
-    
-    @media (max-width: 480px) {
-      .toast {
-        min-width: 280px;
-        max-width: 280px;
-        padding: 14px 20px;
-        border-radius: 10px;
-        font-size: 13px;
-      }
-    }
-    
-    @media (max-width: 360px) {
-      .toast {
-        min-width: 240px;
-        max-width: 240px;
-        padding: 12px 16px;
-        border-radius: 8px;
-        font-size: 12px;
-      }
-    }
-    
-    .toast.show {
-      opacity: 1;
-      pointer-events: auto;
-      transform: translate(-50%, -50%) scale(1.02);
-    }
-    
-    .toast-success {
-      background: linear-gradient(135deg, #10b981, #059669);
-      color: #fff;
-    }
-    
-    .toast-error {
-      background: #ef4444;
-      color: #fff;
-    }
-
-    /* No Results - Responsive */
-    .no-results {
-      text-align: center;
-      color: rgba(255,255,255,0.75);
-      margin-top: 32px;
-    }
-    
-    @media (max-width: 768px) {
-      .no-results {
-        margin-top: 24px;
-        font-size: 14px;
-      }
-    }
-    
-    @media (max-width: 480px) {
-      .no-results {
-        margin-top: 20px;
-        font-size: 13px;
-      }
-    }
-
-    /* Icons - Responsive */
-    .ph {
-      font-size: 28px !important;
-      color: #fff !important;
-    }
-    
-    @media (max-width: 480px) {
-      .ph {
-        font-size: 24px !important;
-      }
-    }
-    
-    @media (max-width: 360px) {
-      .ph {
-        font-size: 20px !important;
-      }
-    }
-
-    /* Animations */
-    @keyframes slideInFromRight {
-      from {
-        transform: translateX(16px);
-        opacity: 0;
-      }
-      to {
-        transform: translateX(0);
-        opacity: 1;
-      }
-    }
-
-    /* Enhanced Badge Colors */
-    .badge-danger  { 
-      background-color: #ff1744 !important; 
-      color: #fff !important; 
-      box-shadow: 0 0 10px rgba(255,23,68,.9); 
-    }
-    
-    .badge-warning { 
-      background-color: #faff00 !important; 
-      color: #000 !important; 
-      box-shadow: 0 0 10px rgba(250,255,0,.9); 
-    }
-    
-    .badge-success { 
-      background-color: #39ff14 !important; 
-      color: #000 !important; 
-      box-shadow: 0 0 10px rgba(57,255,20,.9); 
-    }
-
-    /* Landscape orientation fixes for mobile */
-    @media (max-height: 500px) and (orientation: landscape) {
-      .main-content {
-        padding-top: 50px;
-      }
-      
-      .page-title {
-        font-size: 18px;
-        margin-bottom: 12px;
-      }
-      
-      .vehicle-card {
-        padding: 12px;
-        margin-bottom: 12px;
-      }
-      
-      .watch-dropdown {
-        max-height: 200px;
-      }
-      
-      .watch-dropdown-content {
-        max-height: 150px;
-      }
-    }
-
-    /* Ultra small screens (below 320px) */
-    @media (max-width: 320px) {
-      .top-controls {
-        gap: 4px;
-        top: 2px;
-        right: 2px;
-      }
-      
-      .control-btn {
-        width: 32px;
-        height: 32px;
-      }
-      
-      .search-input {
-        width: 100px;
-      }
-      
-      .watch-dropdown {
-        width: 220px;
-      }
-      
-      .drawer {
-        width: 220px;
-        right: -220px;
-      }
-      
-      .main-content {
-        padding: 8px;
-        padding-top: 45px;
-      }
-      
-      .page-title {
-        font-size: 18px;
-        margin-bottom: 12px;
-      }
-      
-      .vehicle-card {
-        padding: 10px;
-        margin-bottom: 10px;
-      }
-      
-      .parts-btn {
-        width: 80px;
-        max-width: 80px;
-        padding: 4px 6px;
-        font-size: 10px;
-      }
-      
-      .badge {
-        font-size: 9px !important;
-        padding: 2px 4px !important;
-        border-radius: 3px !important;
-      }
-    }
-
-  </style>
-</head>
-<body>
-
-<!-- Top Controls -->
-<div class="top-controls">
-  <!-- Search -->
-  <div class="search-container">
-    <div id="searchInput" class="search-input-container">
-      <i class="ph ph-magnifying-glass"></i>
-      <input id="searchField" class="search-input" placeholder="Search" />
-      <button id="searchClear" class="search-clear" style="display: none;">✕</button>
-    </div>
-    <button id="searchToggle" class="control-btn">
-      <i class="ph ph-magnifying-glass"></i>
-    </button>
-  </div>
-
-  <!-- Watch List -->
-  <div class="watch-container" style="position: relative;">
-    <button id="watchToggle" class="control-btn">
-      <i class="ph ph-eye"></i>
-      <span id="watchBadge" class="watch-badge" style="display: none;">0</span>
-    </button>
-    <div id="watchDropdown" class="watch-dropdown">
-      <div class="watch-dropdown-header">
-        <h3>Watch List</h3>
-      </div>
-      <div id="watchContent" class="watch-dropdown-content">
-        <div style="padding: 24px; text-align: center; color: rgba(255,255,255,0.75);">
-          No vehicles in watch list
-        </div>
-      </div>
-    </div>
-  </div>
-
-  <!-- Menu -->
-  <button id="menuToggle" class="control-btn">
-    <i class="ph ph-list"></i>
-  </button>
-</div>
-
-<!-- Overlay -->
-<div id="overlay" class="overlay"></div>
-
-<!-- Drawer -->
-<div id="drawer" class="drawer">
-  <div class="drawer-header">
-    <h3>MENU</h3>
-  </div>
-  <button class="logout-btn" onclick="logout()">Logout</button>
-</div>
-
-<!-- Main Content -->
-<div class="main-content">
-  <h1 class="page-title">Staff Panel</h1>
-  
-  <div class="table-container">
-    <!-- Desktop Table -->
-    <div class="table-wrapper">
-      <table class="desktop-table">
-        <thead>
-          <tr>
-           <th>S.No</th>
-           <th>Customer</th>
-           <th>Vehicle No</th>
-           <th>Vehicle Name</th>
-           <th>Department</th>
-           <th>Service</th>
-           <th>Technician</th>
-           <th>Parts Status</th>
-           <th>Status</th>
-           <th>Payment</th>
-           <th>Watch</th>
-          </tr>
-        </thead>
-        <tbody id="tableBody"></tbody>
-      </table>
-    </div>
-    
-    <!-- Mobile Cards -->
-    <div class="mobile-cards" id="mobileCards"></div>
-  </div>
-
-  <div id="noResults" class="no-results" style="display: none;">
-    No vehicles found matching "<span id="searchTerm"></span>"
-  </div>
-</div>
-
-<!-- Picker Modal -->
-<div id="pickerModal" class="picker-modal">
-  <div class="overlay"></div>
-  <div class="picker-content">
-    <div class="picker-header">Select Parts Status</div>
-    <div class="picker-options">
-      <div class="picker-option" data-value="Arrived">Arrived</div>
-      <div class="picker-option" data-value="Not Arrived">Not Arrived</div>
-    </div>
-    <div class="picker-actions">
-      <button id="pickerCancel" class="picker-cancel">Cancel</button>
-    </div>
-  </div>
-</div>
-
-<!-- Toast -->
-<div id="toast" class="toast">
-  <span id="toastMessage"></span>
-</div>
-
-
-<script>
-
-// Simple unified status badge (only 3 neon statuses)
-function statusBadge(status) {
-  const val = (status || '').toLowerCase();
-  if (val === 'done') return '<span class="badge badge-success">Done</span>';
-  if (val === 'in service') return '<span class="badge badge-warning">In Service</span>';
-  return '<span class="badge badge-danger">Waiting</span>';
-}
-
-// Global variables
-let vehicles = {{ vehicles|tojson }};
-let filteredVehicles = [...vehicles];
-let currentPickerVehicle = null;
-
-// DOM elements
-const searchToggle = document.getElementById('searchToggle');
-const searchInput = document.getElementById('searchInput');
-const searchField = document.getElementById('searchField');
-const searchClear = document.getElementById('searchClear');
-const watchToggle = document.getElementById('watchToggle');
-const watchDropdown = document.getElementById('watchDropdown');
-const watchBadge = document.getElementById('watchBadge');
-const watchContent = document.getElementById('watchContent');
-const menuToggle = document.getElementById('menuToggle');
-const overlay = document.getElementById('overlay');
-const drawer = document.getElementById('drawer');
-const tableBody = document.getElementById('tableBody');
-const mobileCards = document.getElementById('mobileCards');
-const noResults = document.getElementById('noResults');
-const searchTerm = document.getElementById('searchTerm');
-const pickerModal = document.getElementById('pickerModal');
-const pickerCancel = document.getElementById('pickerCancel');
-const toast = document.getElementById('toast');
-const toastMessage = document.getElementById('toastMessage');
-
-// Initialize
-updateWatchList();
-renderTable();
-
-// Fade top controls on scroll
-const topControls = document.querySelector('.top-controls');
-
-window.addEventListener('scroll', () => {
-  const scrollY = window.scrollY || window.pageYOffset;
-  if (scrollY > 20) {
-    topControls.classList.add('fade');
-  } else {
-    topControls.classList.remove('fade');
-  }
-});
-
-// Responsive screen size detection
-function isMobile() {
-  return window.innerWidth <= 640;
-}
-
-// Fixed API update function to match your exact API structure
-async function updateVehicleAPI(vehicleId, key, value) {
-  try {
-    console.log('Updating:', vehicleId, key, value);
-    
-    const response = await fetch('/api/update', {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-      },
-      body: JSON.stringify({
-        id: String(vehicleId),
-        key: key,
-        value: value
-      })
-    });
-
-    const result = await response.json();
-    console.log('API Response:', result);
-
-    if (result.success) {
-      const vehicle = vehicles.find(v => String(v.id) === String(vehicleId));
-      if (vehicle) {
-        vehicle[key] = value;
-      }
-
-      renderTable();
-      updateWatchList();
-
-      const messages = {
-        parts: 'Parts status updated successfully',
-        watch: 'Watch status updated successfully'
-      };
-      showToast(messages[key] || 'Updated successfully', 'success');
-
-      return true;
-    } else {
-      console.error('API Error:', result.error);
-      showToast(result.error || 'Update failed', 'error');
-      return false;
-    }
-
-  } catch (error) {
-    console.error('Network Error:', error);
-    showToast('Network error. Please check your connection.', 'error');
-    return false;
-  }
-}
-
-// Search functionality - Fixed for exact matching
-searchToggle.addEventListener('click', () => {
-  const isVisible = searchInput.classList.contains('show');
-  if (isVisible) {
-    searchInput.classList.remove('show');
-  } else {
-    searchInput.classList.add('show');
-    setTimeout(() => searchField.focus(), 200);
-  }
-});
-
-searchField.addEventListener('input', () => {
-  const query = searchField.value.trim();
-  if (query) {
-    searchClear.style.display = 'block';
-  } else {
-    searchClear.style.display = 'none';
-    filteredVehicles = [...vehicles];
-    renderTable();
-    noResults.style.display = 'none';
-  }
-});
-
-// Fixed search functionality for exact matching (case insensitive)
-searchField.addEventListener('keyup', () => {
-  const query = searchField.value.trim().toLowerCase();
-  if (!query) {
-    filteredVehicles = [...vehicles];
-    renderTable();
-    noResults.style.display = 'none';
-    return;
-  }
-
-  filteredVehicles = vehicles.filter(vehicle => {
-    const fields = [
-      vehicle.customer?.toLowerCase() || '',
-      vehicle.vehicle_no?.toLowerCase() || '',
-      vehicle.vehicle_name?.toLowerCase() || '',
-      vehicle.department?.toLowerCase() || '',
-      vehicle.service?.toLowerCase() || '',
-      vehicle.technician?.toLowerCase() || '',
-      vehicle.parts?.toLowerCase() || '',
-      vehicle.payment?.toLowerCase() || ''
-    ];
-    return fields.some(field => field === query);
-  });
-
-  renderTable();
-  
-  if (filteredVehicles.length === 0) {
-    searchTerm.textContent = searchField.value.trim();
-    noResults.style.display = 'block';
-  } else {
-    noResults.style.display = 'none';
-  }
-});
-
-searchClear.addEventListener('click', () => {
-  searchField.value = '';
-  searchClear.style.display = 'none';
-  filteredVehicles = [...vehicles];
-  renderTable();
-  noResults.style.display = 'none';
-});
-
-// Watch list functionality  
-watchToggle.addEventListener('click', () => {
-  const isVisible = watchDropdown.classList.contains('show');
-  if (isVisible) {
-    watchDropdown.classList.remove('show');
-    if (
-      !drawer.classList.contains('show') &&
-      !searchInput.classList.contains('show') &&
-      !pickerModal.classList.contains('show')
-    ) {
-      overlay.classList.remove('show');
-    }
-  } else {
-    watchDropdown.classList.add('show');
-    overlay.classList.add('show');
-  }
-});
-
-// Menu functionality
-menuToggle.addEventListener('click', () => {
-  drawer.classList.add('show');
-  overlay.classList.add('show');
-});
-
-// Overlay click
-overlay.addEventListener('click', () => {
-  if (watchDropdown.classList.contains('show')) watchDropdown.classList.remove('show');
-  if (drawer.classList.contains('show')) drawer.classList.remove('show');
-  if (searchInput.classList.contains('show')) searchInput.classList.remove('show');
-  overlay.classList.remove('show');
-});
-
-// Picker modal
-pickerCancel.addEventListener('click', () => {
-  pickerModal.classList.remove('show');
-  overlay.classList.remove('show');
-});
-
-// Master click handler for all watch and parts interactions
-document.addEventListener('click', async (e) => {
-  // Close search if clicked outside
-  if (!searchInput.contains(e.target) && !searchToggle.contains(e.target) && searchInput.classList.contains('show')) {
-    searchInput.classList.remove('show');
-  }
- 
-  // Close watch dropdown if clicked outside
-  if (!watchDropdown.contains(e.target) && !watchToggle.contains(e.target) && watchDropdown.classList.contains('show')) {
-    watchDropdown.classList.remove('show');
-    if (
-      !drawer.classList.contains('show') &&
-      !searchInput.classList.contains('show') &&
-      !pickerModal.classList.contains('show')
-    ) {
-      overlay.classList.remove('show');
-    }
-  }
-
-  // Watch button clicks in table
-  const watchBtn = e.target.closest('.watch-btn');
-  if (watchBtn) {
-    e.preventDefault();
-    e.stopPropagation();
-    
-    const vehicleId = watchBtn.dataset.id;
-    const vehicle = vehicles.find(v => String(v.id) === String(vehicleId));
-    const newWatchStatus = !vehicle?.watch;
-    
-    await updateVehicleAPI(vehicleId, 'watch', newWatchStatus);
-    return;
-  }
-
-  // Watch remove buttons in dropdown
-  const removeBtn = e.target.closest('.watch-remove');
-  if (removeBtn) {
-    e.preventDefault();
-    e.stopPropagation();
-    
-    const vehicleId = removeBtn.dataset.id;
-    await updateVehicleAPI(vehicleId, 'watch', false);
-    return;
-  }
-
-  // Parts button clicks
-  const partsBtn = e.target.closest('.parts-btn');
-  if (partsBtn) {
-    e.preventDefault();
-    e.stopPropagation();
-    
-    const vehicleId = partsBtn.dataset.id;
-    const vehicle = vehicles.find(v => String(v.id) === String(vehicleId));
-    
-    currentPickerVehicle = vehicleId;
-    
-    document.querySelectorAll('.picker-option').forEach(option => {
-      option.classList.toggle('selected', option.dataset.value === vehicle?.parts);
-    });
-    
-    pickerModal.classList.add('show');
-    overlay.classList.add('show');
-    return;
-  }
-
-  // Picker option selection
-  const pickerOption = e.target.closest('.picker-option');
-  if (pickerOption && currentPickerVehicle) {
-    e.preventDefault();
-    e.stopPropagation();
-    
-    const selectedValue = pickerOption.dataset.value;
-    
-    pickerModal.classList.remove('show');
-    overlay.classList.remove('show');
-    
-    await updateVehicleAPI(currentPickerVehicle, 'parts', selectedValue);
-    
-    currentPickerVehicle = null;
-    return;
-  }
-});
-
-// Enhanced render table function with mobile support
-function renderTable() {
-  // Clear both desktop and mobile containers
-  tableBody.innerHTML = '';
-  mobileCards.innerHTML = '';
-  
-  filteredVehicles.forEach((vehicle, index) => {
-    // Desktop table row
-    const row = document.createElement('tr');
-    row.innerHTML = `
-      <td>${index + 1}</td>
-      <td>${vehicle.customer || ''}</td>
-      <td>${vehicle.vehicle_no || ''}</td>
-      <td>${vehicle.vehicle_name || ''}</td>
-      <td>${vehicle.department || ''}</td>
-      <td>${vehicle.service || ''}</td>
-      <td>${vehicle.technician || ''}</td>
-      <td>
-        <button class="parts-btn" data-id="${vehicle.id}">
-          <span>${vehicle.parts || 'Not Arrived'}</span>
-          <i class="ph ph-caret-down" style="color: #e63946;"></i>
-        </button>
-      </td>
-      <td>${statusBadge(vehicle.status)}</td>
-      <td>
-        <span class="badge ${getPaymentBadgeClass(vehicle.payment)}">${vehicle.payment || 'Unpaid'}</span>
-      </td>
-      <td>
-        <button class="watch-btn" data-id="${vehicle.id}">
-          ${vehicle.watch ? 
-            '<i class="ph ph-eye" style="color: #e63946;"></i>' :
-            '<i class="ph ph-eye-slash" style="color: #9ca3af;"></i>'
-          }
-        </button>
-      </td>
-    `;
-    tableBody.appendChild(row);
-
-    // Mobile card
-    const card = document.createElement('div');
-    card.className = 'vehicle-card';
-    card.innerHTML = `
-      <div class="card-header">
-        <h4 class="card-title">${vehicle.vehicle_no || 'N/A'} - ${vehicle.vehicle_name || 'N/A'}</h4>
-        <span class="card-number">#${index + 1}</span>
-      </div>
-      
-      <div class="card-row">
-        <span class="card-label">Customer:</span>
-        <span class="card-value">${vehicle.customer || 'N/A'}</span>
-      </div>
-      
-      <div class="card-row">
-        <span class="card-label">Department:</span>
-        <span class="card-value">${vehicle.department || 'N/A'}</span>
-      </div>
-      
-      <div class="card-row">
-        <span class="card-label">Service:</span>
-        <span class="card-value">${vehicle.service || 'N/A'}</span>
-      </div>
-      
-      <div class="card-row">
-        <span class="card-label">Technician:</span>
-        <span class="card-value">${vehicle.technician || 'N/A'}</span>
-      </div>
-      
-      <div class="card-row">
-        <span class="card-label">Status:</span>
-        <span class="card-value">${statusBadge(vehicle.status)}</span>
-      </div>
-      
-      <div class="card-row">
-        <span class="card-label">Payment:</span>
-        <span class="card-value">
-          <span class="badge ${getPaymentBadgeClass(vehicle.payment)}">${vehicle.payment || 'Unpaid'}</span>
-        </span>
-      </div>
-      
-      <div class="card-actions">
-        <button class="parts-btn" data-id="${vehicle.id}">
-          <span>${vehicle.parts || 'Not Arrived'}</span>
-          <i class="ph ph-caret-down" style="color: #e63946;"></i>
-        </button>
-        <button class="watch-btn" data-id="${vehicle.id}">
-          ${vehicle.watch ? 
-            '<i class="ph ph-eye" style="color: #e63946;"></i>' :
-            '<i class="ph ph-eye-slash" style="color: #9ca3af;"></i>'
-          }
-        </button>
-      </div>
-    `;
-    mobileCards.appendChild(card);
-  });
-}
-
-// Update watch list
-function updateWatchList() {
-  const watchedVehicles = vehicles.filter(v => v.watch);
-  
-  if (watchedVehicles.length > 0) {
-    watchBadge.textContent = watchedVehicles.length;
-    watchBadge.style.display = 'flex';
-  } else {
-    watchBadge.style.display = 'none';
-  }
-  
-  if (watchedVehicles.length === 0) {
-    watchContent.innerHTML = '<div style="padding: 24px; text-align: center; color: rgba(255,255,255,0.75);">No vehicles in watch list</div>';
-  } else {
-    watchContent.innerHTML = watchedVehicles.map(vehicle => `
-      <div class="watch-item">
-        <div class="watch-item-info">
-          <div class="watch-item-title">${vehicle.vehicle_no} - ${vehicle.vehicle_name}</div>
-          <div class="watch-item-service">${vehicle.service}</div>
-          <div class="watch-item-tech">${vehicle.technician}</div>
-        </div>
-        <button class="watch-remove" data-id="${vehicle.id}">
-          <i class="ph ph-eye-slash" style="color: #e63946;"></i>
-        </button>
-      </div>
-    `).join('');
-  }
-}
-
-// Get payment badge class
-function getPaymentBadgeClass(payment) {
-  switch (payment) {
-    case 'Paid': return 'badge-paid';
-    case 'Advance Paid': return 'badge-advance';
-    case 'Unpaid': return 'badge-unpaid';
-    default: return 'badge-unpaid';
-  }
-}
-
-// Show toast
-function showToast(message, type) {
-  toastMessage.textContent = message;
-  toast.className = `toast toast-${type}`;
-  toast.classList.add('show');
-  
-  setTimeout(() => {
-    toast.classList.remove('show');
-  }, type === 'error' ? 5000 : 3000);
-}
-
-// Logout
-function logout() {
-  window.location.href = '/logout';
-}
-
-// Auto-refresh with responsive handling
-setInterval(async () => {
-  try {
-    const response = await fetch('/api/vehicles');
-    if (response.ok) {
-      const freshData = await response.json();
-      vehicles = freshData;
-      const currentQuery = searchField.value.trim().toLowerCase();
-      if (currentQuery) {
-        filteredVehicles = vehicles.filter(vehicle => {
-          const fields = [
-            vehicle.customer?.toLowerCase() || '',
-            vehicle.vehicle_no?.toLowerCase() || '',
-            vehicle.vehicle_name?.toLowerCase() || '',
-            vehicle.department?.toLowerCase() || '',
-            vehicle.service?.toLowerCase() || '',
-            vehicle.technician?.toLowerCase() || '',
-            vehicle.parts?.toLowerCase() || '',
-            vehicle.payment?.toLowerCase() || ''
-          ];
-          return fields.some(field => field === currentQuery);
-        });
-      } else {
-        filteredVehicles = [...freshData];
-      }
-      renderTable();
-      updateWatchList();
-    }
-  } catch (error) {
-    console.log('Auto-refresh failed:', error);
-  }
-}, 5000);
-
-// Handle window resize for responsive adjustments
-window.addEventListener('resize', () => {
-  // Re-render table if switching between desktop/mobile view
-  renderTable();
-});
-
-</script>
-</body>
-</html>""",
-        vehicles=vehicles,
-    )
-###############################################################################
-# Admin
-###############################################################################
-@app.route("/admin")
-def admin():
-    if session.get("user") != "admin":
-        return redirect("/")
-
-    # Load initial data
-    departments = load_json('departments.json')
-    technicians = load_json('technicians.json')
-    services = load_json('services.json')
-    vehicles = read_vehicles()
-    
-    STATUSES = ["Waiting", "In Service", "Done"];
-
-
-    return render_template_string(
-        r"""<!doctype html>
-<html>
-<head>
-  <meta name="viewport" content="width=device-width, initial-scale=1, user-scalable=no">
-  <title>Admin Panel</title>
-  <link rel="stylesheet" href="https://unpkg.com/@phosphor-icons/web@2.0.3/src/regular/style.css">
-  <style>
-    /* Prevent zoom on input focus */
-    input, select, textarea {
-      font-size: 16px !important;
-      transform-origin: left top;
-    }
-    
-    /* Dynamic font size and spacing based on screen size */
-    :root {
-      --base-font: clamp(12px, 2.5vw, 16px);
-      --small-font: clamp(10px, 2vw, 14px);
-      --large-font: clamp(16px, 3vw, 24px);
-      --xl-font: clamp(20px, 4vw, 30px);
-      --spacing-xs: clamp(4px, 1vw, 8px);
-      --spacing-sm: clamp(8px, 1.5vw, 12px);
-      --spacing-md: clamp(12px, 2vw, 16px);
-      --spacing-lg: clamp(16px, 3vw, 24px);
-      --spacing-xl: clamp(20px, 4vw, 32px);
-      --button-height: clamp(36px, 8vw, 44px);
-      --input-height: clamp(32px, 6vw, 40px);
-      --border-radius: clamp(6px, 1.5vw, 12px);
-      --border-radius-lg: clamp(8px, 2vw, 16px);
-    }
-
-    /* Hide scrollbars */
-    ::-webkit-scrollbar {
-      display: none;
-    }
-    * {
-      scrollbar-width: none;
-      -ms-overflow-style: none;
-    }
-    .scrollable::-webkit-scrollbar {
-      display: none;
-    }
-
-    /* Fix white flash on scroll */
-    html, body {
-      background-color: #0b0d10 !important;
-    }
-
-    body {
-      margin: 0;
-      font-family: Inter, "Segoe UI", system-ui, -apple-system, sans-serif;
-      background: radial-gradient(800px 500px at 10% 10%, #11141a 0%, rgba(0,0,0,0) 30%), linear-gradient(180deg, #0b0d10, #0f1418);
-      color: #fff;
-      min-height: 100vh;
-      overflow-x: auto;
-      font-size: var(--base-font);
-    }
-    
-    .main-content,
-    .table-wrapper {
-      will-change: transform;
-      transform: translateZ(0);
-    }
-
-    /* Top Controls - Responsive */
-    .top-controls {
-      position: fixed;
-      top: var(--spacing-md);
-      right: var(--spacing-md);
-      z-index: 50;
-      display: flex;
-      gap: var(--spacing-sm);
-      transition: opacity 0.15s ease;
-    }
-    
-    @media (max-width: 480px) {
-      .top-controls {
-        top: var(--spacing-sm);
-        right: var(--spacing-sm);
-        gap: var(--spacing-xs);
-      }
-    }
-    
-    .top-controls.fade {
-      opacity: 0;
-      transform: translateY(-10px);
-      pointer-events: none;
-    }
-    
-    .control-btn {
-      width: var(--button-height);
-      height: var(--button-height);
-      border-radius: var(--border-radius);
-      display: flex;
-      align-items: center;
-      justify-content: center;
-      background: rgba(255,255,255,.06);
-      border: 1px solid rgba(255,255,255,.08);
-      backdrop-filter: blur(8px);
-      cursor: pointer;
-      transition: transform 0.3s ease;
-      position: relative;
-    }
-    .control-btn:hover {
-      transform: translateY(-2px);
-    }
-
-    /* Search - Responsive */
-    .search-container {
-      display: flex;
-      align-items: center;
-      gap: var(--spacing-xs);
-    }
-    .search-input-container {
-      display: none;
-      align-items: center;
-      background: rgba(255,255,255,.06);
-      border: 1px solid rgba(255,255,255,.08);
-      border-radius: var(--border-radius);
-      padding: var(--spacing-sm) var(--spacing-md);
-      backdrop-filter: blur(8px);
-      transition: all 0.3s ease;
-      animation: slideInFromRight 0.3s ease;
-    }
-    .search-input-container.show {
-      display: flex;
-    }
-    .search-input {
-      background: transparent;
-      border: none;
-      color: #fff;
-      outline: none;
-      width: clamp(200px, 40vw, 256px);
-      margin-left: var(--spacing-xs);
-      font-size: var(--base-font) !important;
-    }
-    
-    @media (max-width: 480px) {
-      .search-input {
-        width: clamp(150px, 60vw, 200px);
-      }
-    }
-    
-    .search-input::placeholder {
-      color: rgba(255,255,255,0.5);
-    }
-    .search-clear {
-      margin-left: var(--spacing-xs);
-      color: rgba(255,255,255,0.75);
-      background: none;
-      border: none;
-      cursor: pointer;
-    }
-
-    /* Top Controls Fade Animation */
-    .top-controls.fade .search-input-container {
-      opacity: 0.5;
-      transition: opacity 0.3s ease;
-    }
-
-    /* Watch List - Enhanced responsiveness for ultra small screens */
-    .watch-badge {
-      position: absolute;
-      top: -4px;
-      right: -4px;
-      width: clamp(16px, 4vw, 20px);
-      height: clamp(16px, 4vw, 20px);
-      border-radius: 50%;
-      background: #E63946;
-      color: #fff;
-      font-size: clamp(10px, 2.5vw, 12px);
-      font-weight: 600;
-      display: flex;
-      align-items: center;
-      justify-content: center;
-    }
-
-    .watch-dropdown {
-      position: absolute;
-      top: 100%;
-      right: 0;
-      margin-top: var(--spacing-xs);
-      width: clamp(280px, 80vw, 384px);
-      background: #0e1116;
-      border: 1px solid #1b1f27;
-      border-radius: var(--border-radius-lg);
-      backdrop-filter: blur(8px);
-      box-shadow: 0 25px 50px rgba(0,0,0,0.25);
-      z-index: 60;
-      display: none;
-      opacity: 0;
-      transform: translateY(-8px);
-      transition: opacity 0.3s ease, transform 0.3s ease;
-    }
-    
-    @media (max-width: 480px) {
-  .watch-dropdown {
-    width: min(320px, calc(100vw - 32px));
-    right: 0; /* Keep it aligned to the right edge of button */
-  }
-}
-
-@media (max-width: 360px) {
-  .watch-dropdown {
-    width: min(280px, calc(100vw - 24px));
-  }
-}
-
-@media (max-width: 320px) {
-  .watch-dropdown {
-    width: min(260px, calc(100vw - 16px));
-    margin-top: 4px;
-  }
-}
-    .watch-dropdown.show {
-      display: block;
-      opacity: 1;
-      transform: translateY(0);
-    }
-    .watch-dropdown-header {
-      padding: var(--spacing-lg);
-      border-bottom: 1px solid #1b1f27;
-    }
-    
-    @media (max-width: 360px) {
-      .watch-dropdown-header {
-        padding: var(--spacing-md);
-      }
-    }
-    
-    @media (max-width: 320px) {
-      .watch-dropdown-header {
-        padding: 12px;
-      }
-    }
-    
-    .watch-dropdown-header h3 {
-      font-size: var(--large-font);
-      font-weight: 600;
-      color: #fff;
-      margin: 0;
-    }
-    
-    @media (max-width: 320px) {
-      .watch-dropdown-header h3 {
-        font-size: 16px;
-      }
-    }
-    
-    .watch-dropdown-content {
-      max-height: clamp(250px, 60vh, 384px);
-      overflow-y: auto;
-      scroll-behavior: smooth;
-    }
-    
-    @media (max-width: 360px) {
-      .watch-dropdown-content {
-        max-height: clamp(200px, 50vh, 300px);
-      }
-    }
-    
-    @media (max-width: 320px) {
-      .watch-dropdown-content {
-        max-height: 200px;
-      }
-    }
-    
-    .watch-dropdown-content:hover {
-      overscroll-behavior: contain;
-    }
-    .watch-item {
-      padding: var(--spacing-md);
-      border-bottom: 1px solid rgba(27,31,39,0.3);
-      display: flex;
-      justify-content: space-between;
-      align-items: flex-start;
-      transition: transform 0.2s ease;
-    }
-    
-    @media (max-width: 360px) {
-      .watch-item {
-        padding: var(--spacing-sm);
-      }
-    }
-    
-    @media (max-width: 320px) {
-      .watch-item {
-        padding: 8px;
-      }
-    }
-    
-    .watch-item:hover {
-      transform: scale(1.02);
-    }
-    .watch-item-info {
-      flex: 1;
-    }
-    .watch-item-title {
-      color: #fff;
-      font-weight: 600;
-      margin-bottom: 4px;
-      font-size: var(--base-font);
-    }
-    
-    @media (max-width: 320px) {
-      .watch-item-title {
-        font-size: 12px;
-      }
-    }
-    
-    .watch-item-service {
-      color: rgba(255,255,255,0.75);
-      font-size: var(--small-font);
-      margin-bottom: 4px;
-    }
-    
-    @media (max-width: 320px) {
-      .watch-item-service {
-        font-size: 10px;
-      }
-    }
-    
-    .watch-item-tech {
-      color: rgba(255,255,255,0.6);
-      font-size: var(--small-font);
-    }
-    
-    @media (max-width: 320px) {
-      .watch-item-tech {
-        font-size: 10px;
-      }
-    }
-    
-    .watch-remove {
-      padding: var(--spacing-xs);
-      background: none;
-      border: none;
-      border-radius: 4px;
-      cursor: pointer;
-      transition: transform 0.2s ease;
-    }
-    
-    @media (max-width: 320px) {
-      .watch-remove {
-        padding: 4px;
-      }
-    }
-    
-    .watch-remove:hover {
-      transform: scale(1.1);
-    }
-
-    /* Overlay */
-    .overlay {
-      position: fixed;
-      inset: 0;
-      background: rgba(0,0,0,0);
-      backdrop-filter: blur(0px);
-      z-index: 40;
-      opacity: 0;
-      pointer-events: none;
-      transition: all 0.3s ease;
-    }
-    .overlay.show {
-      backdrop-filter: blur(4px);
-      opacity: 1;
-      pointer-events: auto;
-    }
-
-    /* Drawer - Responsive */
-    .drawer {
-      position: fixed;
-      top: 0;
-      right: -100%;
-      width: clamp(280px, 80vw, 320px);
-      height: 100vh;
-      background: #0e1116;
-      border-left: 1px solid #1b1f27;
-      box-shadow: -16px 0 48px rgba(0,0,0,0.5);
-      z-index: 60;
-      transition: right 0.3s cubic-bezier(0.22, 1, 0.36, 1);
-    }
-    .drawer.show {
-      right: 0;
-    }
-    .drawer-header {
-      padding: var(--spacing-lg);
-      border-bottom: 1px solid #1b1f27;
-    }
-    .drawer-header h3 {
-      font-size: var(--large-font);
-      font-weight: 600;
-      color: #fff;
-      margin: 0; 
-    }
-    .logout-btn {
-      margin: var(--spacing-lg);
-      padding: var(--spacing-sm) var(--spacing-md);
-      border-radius: var(--border-radius);
-      border: none;
-      background: linear-gradient(90deg, #e63946, #d2353f);
-      color: #fff;
-      font-weight: 900;
-      cursor: pointer;
-      width: calc(100% - calc(var(--spacing-lg) * 2));
-      transition: transform 0.3s ease;
-      font-size: var(--base-font);
-      height: var(--input-height);
-    }
-    .logout-btn:hover {
-      transform: translateY(-2px);
-    }
-
-    /* Main Content - Responsive */
-    .main-content {
-      padding: var(--spacing-lg);
-      padding-top: calc(var(--button-height) + var(--spacing-xl));
-      max-width: none;
-      margin: 0 auto;
-    }
-    
-    @media (max-width: 480px) {
-      .main-content {
-        padding: var(--spacing-md);
-        padding-top: calc(var(--button-height) + var(--spacing-lg));
-      }
-    }
-
-    .page-title {
-      font-size: var(--xl-font);
-      font-weight: 700;
-      color: #fff;
-      margin-bottom: var(--spacing-xl);
-    }
-
-    /* CRUD Panels - Responsive */
-    .crud-panels {
-      display: grid;
-      grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-      gap: var(--spacing-lg);
-      margin-bottom: var(--spacing-xl);
-    }
-    
-    @media (max-width: 768px) {
-      .crud-panels {
-        grid-template-columns: 1fr;
-        gap: var(--spacing-md);
-      }
-    }
-
-    .crud-panel {
-      background: rgba(255,255,255,.06);
-      border: 1px solid rgba(255,255,255,.08);
-      border-radius: var(--border-radius-lg);
-      backdrop-filter: blur(8px);
-      box-shadow: 0 25px 50px rgba(0,0,0,0.25);
-      overflow: hidden;
-    }
-
-    .crud-panel-header {
-      padding: var(--spacing-lg);
-      border-bottom: 1px solid rgba(255,255,255,0.1);
-      display: flex;
-      align-items: center;
-      gap: var(--spacing-xs);
-    }
-
-    .crud-panel-title {
-      font-size: var(--large-font);
-      font-weight: 600;
-      color: #fff;
-      margin: 0;
-      display: flex;
-      align-items: center;
-      gap: var(--spacing-xs);
-    }
-
-    .crud-panel-content {
-      padding: var(--spacing-lg);
-    }
-
-    .crud-input-group {
-      display: flex;
-      gap: var(--spacing-xs);
-      margin-bottom: var(--spacing-md);
-    }
-    
-    @media (max-width: 480px) {
-      .crud-input-group {
-        flex-direction: column;
-        gap: var(--spacing-sm);
-      }
-    }
-
-    .crud-input {
-      flex: 1;
-      padding: var(--spacing-sm) var(--spacing-md);
-      background: rgba(255,255,255,.06);
-      border: 1px solid rgba(255,255,255,.08);
-      border-radius: var(--border-radius);
-      color: #fff;
-      outline: none;
-      font-size: var(--base-font) !important;
-      height: var(--input-height);
-      box-sizing: border-box;
-    }
-
-    .crud-input::placeholder {
-      color: rgba(255,255,255,0.5);
-    }
-
-    .crud-btn {
-      padding: var(--spacing-sm) var(--spacing-md);
-      border-radius: var(--border-radius);
-      border: none;
-      font-weight: 600;
-      cursor: pointer;
-      transition: all 0.2s ease;
-      font-size: var(--base-font);
-      height: var(--input-height);
-      display: flex;
-      align-items: center;
-      justify-content: center;
-    }
-
-    .crud-btn-add {
-      background: #10b981;
-      color: #fff;
-      min-width: var(--button-height);
-    }
-
-    .crud-btn-add:hover {
-      background: #059669;
-    }
-
-    .crud-btn-delete {
-      background: #ef4444;
-      color: #fff;
-    }
-
-    .crud-btn-delete:hover {
-      background: #dc2626;
-    }
-
-    /* CRUD Lists - Responsive */
-    .crud-list {
-      max-height: clamp(120px, 25vh, 150px);
-      overflow-y: auto;
-      scroll-behavior: smooth;
-    }
-
-    .crud-list:hover {
-      overscroll-behavior: contain;
-    }
-
-    .crud-item {
-      display: flex;
-      align-items: center;
-      justify-content: space-between;
-      padding: var(--spacing-xs) var(--spacing-sm);
-      margin-bottom: 4px;
-      background: rgba(255,255,255,0.03);
-      border-radius: var(--border-radius);
-      transition: all 0.2s ease;
-    }
-
-    .crud-item:hover {
-      background: rgba(255,255,255,0.08);
-    }
-
-    .crud-item-text {
-      color: rgba(255,255,255,0.9);
-      flex: 1;
-      font-size: var(--small-font);
-    }
-
-    .crud-item-delete {
-      padding: 4px;
-      background: none;
-      border: none;
-      cursor: pointer;
-      color: #ef4444;
-      transition: color 0.2s ease;
-    }
-
-    .crud-item-delete:hover {
-      color: #dc2626;
-    }
-
-    /* Table Container - Responsive */
-    .table-container {
-      background: rgba(255,255,255,.06);
-      border: 1px solid rgba(255,255,255,.08);
-      border-radius: var(--border-radius-lg);
-      backdrop-filter: blur(8px);
-      box-shadow: 0 25px 50px rgba(0,0,0,0.25);
-      overflow: hidden;
-      width: 100%;
-    }
-
-    /* Desktop Table */
-    .table-wrapper {
-      overflow-x: auto;
-      overflow-y: visible;
-    }
-    
-    @media (min-width: 1200px) {
-      .table-wrapper {
-        min-width: 1400px;
-      }
-    }
-
-    table {
-      width: 100%;
-      border-collapse: collapse;
-      min-width: 1400px;
-    }
-    
-    @media (max-width: 1199px) {
-      table {
-        display: none;
-      }
-    }
-
-    th {
-      text-align: left;
-      padding: var(--spacing-md) var(--spacing-sm);
-      color: #fff;
-      font-weight: 600;
-      border-bottom: 1px solid rgba(255,255,255,0.1);
-      white-space: nowrap;
-      font-size: var(--small-font);
-    }
-
-    th:nth-child(1) { min-width: 60px; }
-    th:nth-child(2) { min-width: 150px; }
-    th:nth-child(3) { min-width: 120px; }
-    th:nth-child(4) { min-width: 150px; }
-    th:nth-child(5) { min-width: 120px; }
-    th:nth-child(6) { min-width: 120px; }
-    th:nth-child(7) { min-width: 120px; }
-    th:nth-child(8) { min-width: 140px; }
-    th:nth-child(9) { min-width: 120px; }
-    th:nth-child(10) { min-width: 120px; }
-    th:nth-child(11) { min-width: 80px; }
-    th:nth-child(12) { min-width: 80px; }
-    th:nth-child(13) { min-width: 100px; }
-
-    tr {
-      transition: all 0.2s ease-out;
-    }
-    tr:not(:last-child) {
-      border-bottom: 1px solid rgba(255,255,255,0.05);
-    }
-    tbody tr:hover {
-      transform: scale(1.01);
-      box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-    }
-
-    td {
-      padding: var(--spacing-md) var(--spacing-sm);
-      color: rgba(255,255,255,0.9);
-      white-space: nowrap;
-    }
-
-    /* Card Layout for Mobile/Tablet */
-    .cards-container {
-      display: none;
-    }
-    
-    @media (max-width: 1199px) {
-      .cards-container {
-        display: block;
-      }
-    }
-
-    .vehicle-card {
-      background: rgba(255,255,255,.04);
-      border: 1px solid rgba(255,255,255,.06);
-      border-radius: var(--border-radius);
-      margin-bottom: var(--spacing-md);
-      padding: var(--spacing-md);
-      transition: all 0.2s ease;
-    }
-    
-    .vehicle-card:hover {
-      transform: translateY(-2px);
-      box-shadow: 0 8px 24px rgba(0,0,0,0.2);
-    }
-
-    .card-header {
-      display: flex;
-      justify-content: space-between;
-      align-items: flex-start;
-      margin-bottom: var(--spacing-md);
-      flex-wrap: wrap;
-      gap: var(--spacing-sm);
-    }
-
-    .card-title {
-      font-size: var(--large-font);
-      font-weight: 600;
-      color: #fff;
-      margin: 0;
-    }
-
-    .card-subtitle {
-      font-size: var(--small-font);
-      color: rgba(255,255,255,0.75);
-      margin: var(--spacing-xs) 0 0 0;
-    }
-
-    .card-actions {
-      display: flex;
-      gap: var(--spacing-xs);
-      flex-shrink: 0;
-    }
-
-    .card-content {
-      display: grid;
-      grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-      gap: var(--spacing-md);
-    }
-    
-    @media (max-width: 768px) {
-      .card-content {
-        grid-template-columns: 1fr;
-        gap: var(--spacing-sm);
-      }
-    }
-
-    .card-field {
-      display: flex;
-      flex-direction: column;
-      gap: var(--spacing-xs);
-    }
-
-    .card-label {
-      font-size: var(--small-font);
-      color: rgba(255,255,255,0.6);
-      font-weight: 500;
-      text-transform: uppercase;
-      letter-spacing: 0.5px;
-    }
-
-    /* Hide field positioning for small screens */
-    .card-hide-field {
-      display: flex;
-      flex-direction: column;
-      gap: var(--spacing-xs);
-      grid-column: 1 / -1;
-      margin-top: var(--spacing-sm);
-      padding-top: var(--spacing-sm);
-      border-top: 1px solid rgba(255,255,255,0.1);
-    }
-
-    /* Admin Input Fields - Responsive */
-    .admin-input {
-      background: rgba(255,255,255,.06);
-      border: 1px solid rgba(255,255,255,.08);
-      border-radius: var(--border-radius);
-      color: #fff;
-      padding: var(--spacing-xs) var(--spacing-sm);
-      outline: none;
-      width: 95%;
-      max-width: 95%;
-      font-size: var(--base-font) !important;
-      height: var(--input-height);
-      box-sizing: border-box;
-    }
-
-    .admin-input::placeholder {
-      color: rgba(255,255,255,0.5);
-    }
-
-    /* Picker Modal Buttons - Responsive */
-    .picker-btn {
-      display: flex;
-      align-items: center;
-      justify-content: space-between;
-      width: 120px;
-      max-width: 120px;
-      padding: var(--spacing-xs) var(--spacing-sm);
-      background: rgba(255,255,255,.06);
-      border: 1px solid rgba(255,255,255,.08);
-      border-radius: var(--border-radius);
-      color: #fff;
-      font-weight: 600;
-      cursor: pointer;
-      transition: all 0.2s ease;
-      backdrop-filter: blur(8px);
-      font-size: var(--small-font);
-      height: var(--input-height);
-      box-sizing: border-box;
-    }
-    
-    @media (max-width: 768px) {
-      .picker-btn {
-        width: 100%;
-        max-width: 100%;
-        min-height: var(--button-height);
-      }
-    }
-    
-    .picker-btn:hover {
-      background: rgba(255,255,255,.1);
-    }
-
-    /* Watch and Visibility Buttons - Responsive */
-    .watch-btn, .visibility-btn {
-      padding: var(--spacing-xs);
-      background: none;
-      border: none;
-      border-radius: var(--border-radius);
-      cursor: pointer;
-      transition: transform 0.2s ease;
-      min-width: var(--button-height);
-      min-height: var(--button-height);
-      display: flex;
-      align-items: center;
-      justify-content: center;
-    }
-    .watch-btn:hover, .visibility-btn:hover {
-      transform: scale(1.1);
-    }
-
-    .delete-btn {
-      padding: var(--spacing-xs) var(--spacing-sm);
-      background: #ef4444;
-      border: none;
-      border-radius: var(--border-radius);
-      color: #fff;
-      font-size: var(--small-font);
-      cursor: pointer;
-      transition: all 0.2s ease;
-      height: var(--input-height);
-      display: flex;
-      align-items: center;
-      justify-content: center;
-    }
-    .delete-btn:hover {
-      background: #dc2626;
-      transform: translateY(-1px);
-    }
-
-    /* Picker Modal - Responsive */
-    .picker-modal {
-      position: fixed;
-      inset: 0;
-      display: flex;
-      align-items: center;
-      justify-content: center;
-      z-index: 70;
-      opacity: 0;
-      pointer-events: none;
-      transition: all 0.3s ease;
-      padding: var(--spacing-md);
-    }
-    .picker-modal.show {
-      opacity: 1;
-      pointer-events: auto;
-    }
-    .picker-content {
-      position: relative;
-      width: 100%;
-      max-width: clamp(300px, 80vw, 512px);
-      max-height: clamp(300px, 70vh, 384px);
-      background: #000;
-      border: 1px solid #1a1a1a;
-      border-radius: var(--border-radius-lg);
-      padding: var(--spacing-sm);
-      box-shadow: 0 25px 50px rgba(0,0,0,0.6);
-      transform: scale(0.95);
-      transition: transform 0.3s ease;
-    }
-    .picker-modal.show .picker-content {
-      transform: scale(1);
-    }
-
-    .picker-header {
-      font-weight: 800;
-      font-size: var(--small-font);
-      color: #bbb;
-      padding: var(--spacing-xs);
-      text-transform: uppercase;
-      letter-spacing: 0.08em;
-    }
-    .picker-options {
-      overflow: auto;
-      max-height: clamp(200px, 50vh, 256px);
-      margin-top: var(--spacing-xs);
-      padding-right: var(--spacing-xs);
-    }
-    .picker-option {
-      width: 90%;
-      min-height: clamp(36px, 8vw, 44px);
-      margin: var(--spacing-xs) auto;
-      border-radius: var(--border-radius);
-      background: #0f0f0f;
-      border: 1px solid #1b1b1b;
-      color: #fff;
-      font-size: var(--base-font);
-      display: flex;
-      justify-content: center;
-      align-items: center;
-      cursor: pointer;
-      text-align: center;
-      transition: all 0.2s ease;
-      padding: var(--spacing-xs);
-      box-sizing: border-box;
-    }
-    .picker-option:hover {
-      background: #131313;
-    }
-    .picker-option.selected {
-      outline: 2px solid #fff;
-    }
-    .picker-actions {
-      display: flex;
-      justify-content: flex-end;
-      gap: var(--spacing-sm);
-      padding-top: var(--spacing-xs);
-    }
-    .picker-cancel {
-      background: transparent;
-      border: 1px solid #222;
-      color: #fff;
-      padding: var(--spacing-xs) var(--spacing-sm);
-      border-radius: var(--border-radius);
-      cursor: pointer;
-      transition: all 0.2s ease;
-      font-size: var(--base-font);
-      min-height: var(--input-height);
-    }
-    .picker-cancel:hover {
-      background: #222;
-    }
-
-    /* Toast Notification System - Responsive */
-    .toast {
-      position: fixed;
-      top: 50%;
-      left: 50%;
-      transform: translate(-50%, -50%);
-      padding: var(--spacing-lg) var(--spacing-xl);
-      border-radius: var(--border-radius-lg);
-      font-size: var(--small-font);
-      font-weight: 500;
-      display: flex;
-      align-items: center;
-      justify-content: center;
-      box-shadow: 0 25px 50px rgba(0,0,0,0.25);
-      z-index: 100;
-      width: clamp(280px, 80vw, 384px);
-      opacity: 0;
-      pointer-events: none;
-      transition: all 0.35s ease;
-    }
-    .toast.show {
-      opacity: 1;
-      pointer-events: auto;
-      transform: translate(-50%, -50%) scale(1.02);
-    }
-    .toast-success {
-      background: linear-gradient(135deg, #10b981, #059669);
-      color: #fff;
-    }
-    .toast-error {
-      background: #ef4444;
-      color: #fff;
-    }
-
-    /* No Results - Responsive */
-    .no-results {
-      text-align: center;
-      color: rgba(255,255,255,0.75);
-      margin-top: var(--spacing-xl);
-      font-size: var(--base-font);
-    }
-
-    .ph {
-      font-size: clamp(20px, 5vw, 28px) !important;
-      color: #fff !important;
-    }
-
-    @keyframes slideInFromRight {
-      from {
-        transform: translateX(16px);
-        opacity: 0;
-      }
-      to {
-        transform: translateX(0);
-        opacity: 1;
-      }
-    }
-  </style>
-</head>
-<body>
-
-<!-- Top Controls -->
-<div class="top-controls">
-  <!-- Search -->
-  <div class="search-container">
-    <div id="searchInput" class="search-input-container">
-      <i class="ph ph-magnifying-glass"></i>
-      <input id="searchField" class="search-input" placeholder="Search" />
-      <button id="searchClear" class="search-clear" style="display: none;">✕</button>
-    </div>
-    <button id="searchToggle" class="control-btn">
-      <i class="ph ph-magnifying-glass"></i>
-    </button>
-  </div>
-
-  <!-- Watch List -->
-  <div class="watch-container" style="position: relative;">
-    <button id="watchToggle" class="control-btn">
-      <i class="ph ph-eye"></i>
-      <span id="watchBadge" class="watch-badge" style="display: none;">0</span>
-    </button>
-    <div id="watchDropdown" class="watch-dropdown">
-      <div class="watch-dropdown-header">
-        <h3>Watch List</h3>
-      </div>
-      <div id="watchContent" class="watch-dropdown-content">
-        <div style="padding: 24px; text-align: center; color: rgba(255,255,255,0.75);">
-          No vehicles in watch list
-        </div>
-      </div>
-    </div>
-  </div>
-
-  <!-- Menu -->
-  <button id="menuToggle" class="control-btn">
-    <i class="ph ph-list"></i>
-  </button>
-</div>
-
-<!-- Overlay -->
-<div id="overlay" class="overlay"></div>
-
-<!-- Drawer -->
-<div id="drawer" class="drawer">
-  <div class="drawer-header">
-    <h3>MENU</h3>
-  </div>
-  <button class="logout-btn" onclick="logout()">Logout</button>
-</div>
-
-<!-- Main Content -->
-<div class="main-content">
-  <h1 class="page-title">Admin Panel</h1>
-  
-  <!-- CRUD Panels -->
-  <div class="crud-panels">
-    <!-- Departments Panel -->
-    <div class="crud-panel">
-      <div class="crud-panel-header">
-        <h3 class="crud-panel-title">
-          <i class="ph ph-list"></i>
-          Departments
-        </h3>
-      </div>
-      <div class="crud-panel-content">
-        <div class="crud-input-group">
-          <input id="deptInput" class="crud-input" placeholder="New Department" />
-          <button id="addDept" class="crud-btn crud-btn-add">
-            <i class="ph ph-plus"></i>
-          </button>
-        </div>
-        <div id="deptList" class="crud-list"></div>
-      </div>
-    </div>
-
-    <!-- Technicians Panel -->
-    <div class="crud-panel">
-      <div class="crud-panel-header">
-        <h3 class="crud-panel-title">
-          <i class="ph ph-wrench"></i>
-          Technicians
-        </h3>
-      </div>
-      <div class="crud-panel-content">
-        <div class="crud-input-group">
-          <input id="techInput" class="crud-input" placeholder="New Technician" />
-          <button id="addTech" class="crud-btn crud-btn-add">
-            <i class="ph ph-plus"></i>
-          </button>
-        </div>
-        <div id="techList" class="crud-list"></div>
-      </div>
-    </div>
-
-    <!-- Services Panel -->
-    <div class="crud-panel">
-      <div class="crud-panel-header">
-        <h3 class="crud-panel-title">
-          <i class="ph ph-gear"></i>
-          Services
-        </h3>
-      </div>
-      <div class="crud-panel-content">
-        <div class="crud-input-group">
-          <input id="serviceInput" class="crud-input" placeholder="New Service" />
-          <button id="addService" class="crud-btn crud-btn-add">
-            <i class="ph ph-plus"></i>
-          </button>
-        </div>
-        <div id="serviceList" class="crud-list"></div>
-      </div>
-    </div>
-  </div>
-
-  <!-- Desktop Table -->
-  <div class="table-container">
-    <div class="table-wrapper">
-      <table>
-        <thead>
-          <tr>
-            <th>S.No</th>
-            <th>Customer</th>
-            <th>Vehicle No</th>
-            <th>Vehicle Name</th>
-            <th>Department</th>
-            <th>Service</th>
-            <th>Technician</th>
-            <th>Parts Status</th>
-            <th>Status</th>
-            <th>Payment</th>
-            <th>Watch</th>
-            <th>Actions</th>
-            <th style="display: flex; align-items: center; gap: 6px;">
-            <i class="ph ph-eye" style="font-size: 16px !important;"></i>
-             Hide
-            </th>
-          </tr>
-        </thead>
-        <tbody id="tableBody"></tbody>
-      </table>
-    </div>
-    
-    <!-- Mobile/Tablet Cards -->
-    <div id="cardsContainer" class="cards-container"></div>
-  </div>
-
-  <div id="noResults" class="no-results" style="display: none;">
-    No vehicles found matching "<span id="searchTerm"></span>"
-  </div>
-</div>
-
-<!-- Picker Modal -->
-<div id="pickerModal" class="picker-modal">
-  <div class="overlay"></div>
-  <div class="picker-content">
-    <div id="pickerHeader" class="picker-header">Select Option</div>
-    <div id="pickerOptions" class="picker-options">
-      <!-- Options will be populated dynamically -->
-    </div>
-    <div class="picker-actions">
-      <button id="pickerCancel" class="picker-cancel">Cancel</button>
-    </div>
-  </div>
-</div>
-
-<!-- Toast -->
-<div id="toast" class="toast">
-  <span id="toastMessage"></span>
-</div>
-
-<script>
-// Global variables
-let vehicles = {{ vehicles|tojson }};
-let departments = {{ departments|tojson }};
-let technicians = {{ technicians|tojson }};
-let services = {{ services|tojson }};
-let statuses = {{ statuses|tojson }};
-let filteredVehicles = [...vehicles];
-let isUserEditing = false;
-let autoRefreshPaused = false;
-let editTimeout = null;
-let currentPickerVehicle = null;
-let currentPickerField = null;
-
-const payments = ["Paid", "Advance Paid", "Unpaid"];
-const partsOptions = ["Arrived", "Not Arrived"];
-
-// DOM elements
-const searchToggle = document.getElementById('searchToggle');
-const searchInput = document.getElementById('searchInput');
-const searchField = document.getElementById('searchField');
-const searchClear = document.getElementById('searchClear');
-const watchToggle = document.getElementById('watchToggle');
-const watchDropdown = document.getElementById('watchDropdown');
-const watchBadge = document.getElementById('watchBadge');
-const watchContent = document.getElementById('watchContent');
-const menuToggle = document.getElementById('menuToggle');
-const overlay = document.getElementById('overlay');
-const drawer = document.getElementById('drawer');
-const tableBody = document.getElementById('tableBody');
-const cardsContainer = document.getElementById('cardsContainer');
-const noResults = document.getElementById('noResults');
-const searchTerm = document.getElementById('searchTerm');
-const pickerModal = document.getElementById('pickerModal');
-const pickerHeader = document.getElementById('pickerHeader');
-const pickerOptions = document.getElementById('pickerOptions');
-const pickerCancel = document.getElementById('pickerCancel');
-const toast = document.getElementById('toast');
-const toastMessage = document.getElementById('toastMessage');
-
-// CRUD elements
-const deptInput = document.getElementById('deptInput');
-const addDept = document.getElementById('addDept');
-const deptList = document.getElementById('deptList');
-const techInput = document.getElementById('techInput');
-const addTech = document.getElementById('addTech');
-const techList = document.getElementById('techList');
-const serviceInput = document.getElementById('serviceInput');
-const addService = document.getElementById('addService');
-const serviceList = document.getElementById('serviceList');
-
-// Initialize
-updateWatchList();
-renderTable();
-renderCRUDLists();
-
-// Auto-refresh pause system for smooth editing
-let ticking = false;
-const topControls = document.querySelector('.top-controls');
-
-function updateScrollControls() {
-  const scrollY = window.scrollY || window.pageYOffset;
-  if (scrollY > 20) {
-    topControls.classList.add('fade');
-  } else {
-    topControls.classList.remove('fade');
-  }
-  ticking = false;
-}
-
-window.addEventListener('scroll', () => {
-  if (!ticking) {
-    requestAnimationFrame(updateScrollControls);
-    ticking = true;
-  }
-}, { passive: true });
-
-// Enhanced auto-refresh pause for ALL input interactions
-document.addEventListener('focusin', (e) => {
-  if (e.target.tagName === 'INPUT' || e.target.tagName === 'SELECT' || e.target.tagName === 'TEXTAREA') {
-    isUserEditing = true;
-    autoRefreshPaused = true;
-    clearTimeout(editTimeout);
-    console.log('Auto-refresh PAUSED - User editing');
-  }
-});
-
-document.addEventListener('focusout', (e) => {
-  if (e.target.tagName === 'INPUT' || e.target.tagName === 'SELECT' || e.target.tagName === 'TEXTAREA') {
-    clearTimeout(editTimeout);
-    editTimeout = setTimeout(() => {
-      isUserEditing = false;
-      autoRefreshPaused = false;
-      console.log('Auto-refresh RESUMED - User stopped editing');
-    }, 3000); // 3 second delay after focus out
-  }
-});
-
-// Also pause on any button/picker interactions
-function pauseAutoRefresh() {
-  isUserEditing = true;
-  autoRefreshPaused = true;
-  clearTimeout(editTimeout);
-  editTimeout = setTimeout(() => {
-    isUserEditing = false;
-    autoRefreshPaused = false;
-    console.log('Auto-refresh RESUMED - After interaction');
-  }, 3000);
-}
-
-// API Functions with unified endpoint for live sync
-async function updateVehicleAPI(vehicleId, key, value) {
-  if (!vehicleId || !key || value === undefined || value === null) {
-    return false;
-  }
-
-  try {
-    const response = await fetch('/api/update', {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({
-        id: String(vehicleId),
-        key: key,
-        value: value
-      })
-    });
-
-    const result = await response.json();
-    if (result.success) {
-      const vehicle = vehicles.find(v => String(v.id) === String(vehicleId));
-      if (vehicle) {
-        vehicle[key] = value;
-      }
-      renderTable();
-      updateWatchList();
-
-      const messages = {
-        customer: 'Customer updated successfully',
-        vehicle_no: 'Vehicle number updated successfully',
-        vehicle_name: 'Vehicle name updated successfully',
-        department: 'Department updated successfully',
-        service: 'Service updated successfully',
-        technician: 'Technician updated successfully',
-        parts: 'Parts status updated successfully',
-        status: 'Status updated successfully',
-        payment: 'Payment updated successfully',
-        watch: 'Watch status updated successfully',
-        visible: 'Visibility updated successfully'
-      };
-      showToast(messages[key] || 'Updated successfully', 'success');
-      return true;
-    } else {
-      showToast(result.error || result.message || 'Update failed', 'error');
-      return false;
-    }
-  } catch (error) {
-    showToast('Network error. Please check your connection.', 'error');
-    return false;
-  }
-}
-
-async function addDepartment() {
-  const name = deptInput.value.trim();
-  if (!name) {
-    showToast('Please enter a department name', 'error');
-    return;
-  }
-  
-  try {
-    const response = await fetch('/api/add_department', {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({ department: name })
-    });
-    
-    const result = await response.json();
-    if (result.success) {
-      departments.push(name);
-      deptInput.value = '';
-      renderCRUDLists();
-      renderTable();
-      showToast('Department added successfully', 'success');
-    } else {
-      showToast(result.message || 'Failed to add department', 'error');
-    }
-  } catch (error) {
-    showToast('Network error occurred', 'error');
-  }
-}
-
-async function deleteDepartment(name) {
-  try {
-    const response = await fetch('/api/delete_department', {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({ department: name })
-    });
-    
-    const result = await response.json();
-    if (result.success) {
-      departments = departments.filter(d => d !== name);
-      renderCRUDLists();
-      renderTable();
-      showToast('Department deleted successfully', 'success');
-    } else {
-      showToast(result.message || 'Failed to delete department', 'error');
-    }
-  } catch (error) {
-    showToast('Network error occurred', 'error');
-  }
-}
-
-async function addTechnician() {
-  const name = techInput.value.trim();
-  if (!name) {
-    showToast('Please enter a technician name', 'error');
-    return;
-  }
-  
-  try {
-    const response = await fetch('/api/add_technician', {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({ technician: name })
-    });
-    
-    const result = await response.json();
-    if (result.success) {
-      technicians.push(name);
-      techInput.value = '';
-      renderCRUDLists();
-      renderTable();
-      showToast('Technician added successfully', 'success');
-    } else {
-      showToast(result.message || 'Failed to add technician', 'error');
-    }
-  } catch (error) {
-    showToast('Network error occurred', 'error');
-  }
-}
-
-async function deleteTechnician(name) {
-  try {
-    const response = await fetch('/api/delete_technician', {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({ technician: name })
-    });
-    
-    const result = await response.json();
-    if (result.success) {
-      technicians = technicians.filter(t => t !== name);
-      renderCRUDLists();
-      renderTable();
-      showToast('Technician deleted successfully', 'success');
-    } else {
-      showToast(result.message || 'Failed to delete technician', 'error');
-    }
-  } catch (error) {
-    showToast('Network error occurred', 'error');
-  }
-}
-
-async function addServiceItem() {
-  const name = serviceInput.value.trim();
-  if (!name) {
-    showToast('Please enter a service name', 'error');
-    return;
-  }
-  
-  try {
-    const response = await fetch('/api/add_service', {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({ service: name })
-    });
-    
-    const result = await response.json();
-    if (result.success) {
-      services.push(name);
-      serviceInput.value = '';
-      renderCRUDLists();
-      renderTable();
-      showToast('Service added successfully', 'success');
-    } else {
-      showToast(result.message || 'Failed to add service', 'error');
-    }
-  } catch (error) {
-    showToast('Network error occurred', 'error');
-  }
-}
-
-async function deleteService(name) {
-  try {
-    const response = await fetch('/api/delete_service', {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({ service: name })
-    });
-    
-    const result = await response.json();
-    if (result.success) {
-      services = services.filter(s => s !== name);
-      renderCRUDLists();
-      renderTable();
-      showToast('Service deleted successfully', 'success');
-    } else {
-      showToast(result.message || 'Failed to delete service', 'error');
-    }
-  } catch (error) {
-    showToast('Network error occurred', 'error');
-  }
-}
-
-async function deleteVehicle(vehicleId) {
-  try {
-    const response = await fetch('/api/delete_vehicle', {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({ id: String(vehicleId) })
-    });
-    
-    const result = await response.json();
-    if (result.success) {
-      vehicles = vehicles.filter(v => String(v.id) !== String(vehicleId));
-      filteredVehicles = filteredVehicles.filter(v => String(v.id) !== String(vehicleId));
-      renderTable();
-      updateWatchList();
-      showToast('Vehicle deleted successfully', 'success');
-    } else {
-      showToast(result.message || 'Delete failed', 'error');
-    }
-  } catch (error) {
-    showToast('Network error occurred', 'error');
-  }
-}
-
-async function fetchAllData() {
-  if (isUserEditing || autoRefreshPaused) {
-    console.log('Skipping refresh - user is editing');
-    return;
-  }
-  
-  try {
-    const [deptRes, techRes, servRes, vehicleRes] = await Promise.all([
-      fetch('/api/departments'),
-      fetch('/api/technicians'), 
-      fetch('/api/services'),
-      fetch('/api/vehicles')
-    ]);
-    
-    if (deptRes.ok) departments = await deptRes.json();
-    if (techRes.ok) technicians = await techRes.json();
-    if (servRes.ok) services = await servRes.json();
-    if (vehicleRes.ok) {
-      vehicles = await vehicleRes.json();
-      
-      const currentQuery = searchField.value.trim().toLowerCase();
-      if (currentQuery) {
-        applySearch();
-      } else {
-        filteredVehicles = [...vehicles];
-      }
-    }
-    
-    renderCRUDLists();
-    renderTable();
-    updateWatchList();
-  } catch (error) {
-    console.log('Auto-refresh failed:', error);
-  }
-}
-
-// Search functionality with exact matching
-searchToggle.addEventListener('click', () => {
-  const isVisible = searchInput.classList.contains('show');
-  if (isVisible) {
-    searchInput.classList.remove('show');
-  } else {
-    searchInput.classList.add('show');
-    setTimeout(() => searchField.focus(), 200);
-  }
-});
-
-searchField.addEventListener('input', () => {
-  const query = searchField.value.trim();
-  if (query) {
-    searchClear.style.display = 'block';
-  } else {
-    searchClear.style.display = 'none';
-    filteredVehicles = [...vehicles];
-    renderTable();
-    noResults.style.display = 'none';
-  }
-});
-
-function applySearch() {
-  const query = searchField.value.trim().toLowerCase();
-  if (!query) {
-    filteredVehicles = [...vehicles];
-    renderTable();
-    noResults.style.display = 'none';
-    return;
-  }
-
-  filteredVehicles = vehicles.filter(vehicle => {
-    const fields = [
-      vehicle.customer?.toLowerCase() || '',
-      vehicle.vehicle_no?.toLowerCase() || '',
-      vehicle.vehicle_name?.toLowerCase() || '',
-      vehicle.department?.toLowerCase() || '',
-      vehicle.service?.toLowerCase() || '',
-      vehicle.technician?.toLowerCase() || '',
-      vehicle.parts?.toLowerCase() || '',
-      vehicle.payment?.toLowerCase() || '',
-      vehicle.status?.toLowerCase() || ''
-    ];
-    return fields.some(field => field === query);
-  });
-
-  renderTable();
-  
-  if (filteredVehicles.length === 0) {
-    searchTerm.textContent = searchField.value.trim();
-    noResults.style.display = 'block';
-  } else {
-    noResults.style.display = 'none';
-  }
-}
-
-searchField.addEventListener('keyup', applySearch);
-
-searchClear.addEventListener('click', () => {
-  searchField.value = '';
-  searchClear.style.display = 'none';
-  filteredVehicles = [...vehicles];
-  renderTable();
-  noResults.style.display = 'none';
-});
-
-// Watch list functionality  
-watchToggle.addEventListener('click', () => {
-  const isVisible = watchDropdown.classList.contains('show');
-  if (isVisible) {
-    watchDropdown.classList.remove('show');
-    overlay.classList.remove('show');
-  } else {
-    if (drawer.classList.contains('show')) {
-      drawer.classList.remove('show');
-    }
-    watchDropdown.classList.add('show');
-    overlay.classList.add('show');
-  }
-});
-
-// Menu functionality
-menuToggle.addEventListener('click', () => {
-  if (watchDropdown.classList.contains('show')) {
-    watchDropdown.classList.remove('show');
-  }
-  drawer.classList.add('show');
-  overlay.classList.add('show');
-});
-
-// Overlay click handler
-overlay.addEventListener('click', () => {
-  let hasOpenDropdowns = false;
-  
-  if (watchDropdown.classList.contains('show')) {
-    watchDropdown.classList.remove('show');
-    hasOpenDropdowns = true;
-  }
-  
-  if (drawer.classList.contains('show')) {
-    drawer.classList.remove('show');
-    hasOpenDropdowns = true;
-  }
-  
-  if (searchInput.classList.contains('show')) {
-    searchInput.classList.remove('show');
-    hasOpenDropdowns = true;
-  }
-  
-  if (pickerModal.classList.contains('show')) {
-    pickerModal.classList.remove('show');
-    hasOpenDropdowns = true;
-  }
-  
-  if (hasOpenDropdowns) {
-    overlay.classList.remove('show');
-  }
-});
-
-// Picker modal functionality
-pickerCancel.addEventListener('click', () => {
-  pickerModal.classList.remove('show');
-  overlay.classList.remove('show');
-  currentPickerVehicle = null;
-  currentPickerField = null;
-});
-
-function openPicker(vehicleId, field, options, currentValue) {
-  pauseAutoRefresh();
-  
-  currentPickerVehicle = vehicleId;
-  currentPickerField = field;
-  
-  const titles = {
-    department: 'Select Department',
-    service: 'Select Service', 
-    technician: 'Select Technician',
-    parts: 'Select Parts Status',
-    status: 'Select Status',
-    payment: 'Select Payment'
-  };
-  
-  pickerHeader.textContent = titles[field] || 'Select Option';
-  
-  pickerOptions.innerHTML = options.map(option => `
-    <div class="picker-option ${option === currentValue ? 'selected' : ''}" data-value="${option}">
-      ${option}
-    </div>
-  `).join('');
-  
-  pickerModal.classList.add('show');
-  overlay.classList.add('show');
-}
-
-// CRUD Event Listeners
-addDept.addEventListener('click', addDepartment);
-deptInput.addEventListener('keypress', (e) => {
-  if (e.key === 'Enter') addDepartment();
-});
-
-addTech.addEventListener('click', addTechnician);
-techInput.addEventListener('keypress', (e) => {
-  if (e.key === 'Enter') addTechnician();
-});
-
-addService.addEventListener('click', addServiceItem);
-serviceInput.addEventListener('keypress', (e) => {
-  if (e.key === 'Enter') addServiceItem();
-});
-
-// Master click handler
-document.addEventListener('click', async (e) => {
-  // Close dropdowns if clicked outside
-  if (!searchInput.contains(e.target) && !searchToggle.contains(e.target) && searchInput.classList.contains('show')) {
-    searchInput.classList.remove('show');
-  }
-  
-  if (!watchDropdown.contains(e.target) && !watchToggle.contains(e.target) && watchDropdown.classList.contains('show')) {
-    watchDropdown.classList.remove('show');
-    overlay.classList.remove('show');
-  }
-
-  // CRUD delete buttons
-  const deptDeleteBtn = e.target.closest('[data-delete-dept]');
-  if (deptDeleteBtn) {
-    e.preventDefault();
-    e.stopPropagation();
-    const name = deptDeleteBtn.dataset.deleteDept;
-    if (confirm(`Are you sure you want to delete department "${name}"?`)) {
-      await deleteDepartment(name);
-    }
-    return;
-  }
-
-  const techDeleteBtn = e.target.closest('[data-delete-tech]');
-  if (techDeleteBtn) {
-    e.preventDefault();
-    e.stopPropagation();
-    const name = techDeleteBtn.dataset.deleteTech;
-    if (confirm(`Are you sure you want to delete technician "${name}"?`)) {
-      await deleteTechnician(name);
-    }
-    return;
-  }
-
-  const serviceDeleteBtn = e.target.closest('[data-delete-service]');
-  if (serviceDeleteBtn) {
-    e.preventDefault();
-    e.stopPropagation();
-    const name = serviceDeleteBtn.dataset.deleteService;
-    if (confirm(`Are you sure you want to delete service "${name}"?`)) {
-      await deleteService(name);
-    }
-    return;
-  }
-
-  // Picker buttons for all select fields
-  const pickerBtn = e.target.closest('.picker-btn');
-  if (pickerBtn) {
-    e.preventDefault();
-    e.stopPropagation();
-    
-    const vehicleId = pickerBtn.dataset.id;
-    const field = pickerBtn.dataset.field;
-    if (!vehicleId || !field) return;
-    
-    const vehicle = vehicles.find(v => String(v.id) === String(vehicleId));
-    if (!vehicle) return;
-    
-    let options = [];
-    let currentValue = '';
-    
-    switch (field) {
-      case 'department':
-        options = departments;
-        currentValue = vehicle.department || departments[0];
-        break;
-      case 'service':
-        options = services;
-        currentValue = vehicle.service || services[0];
-        break;
-      case 'technician':
-        options = technicians;
-        currentValue = vehicle.technician || technicians[0];
-        break;
-      case 'parts':
-        options = partsOptions;
-        currentValue = vehicle.parts || 'Not Arrived';
-        break;
-      case 'status':
-        options = statuses;
-        currentValue = vehicle.status || statuses[0];
-        break;
-      case 'payment':
-        options = payments;
-        currentValue = vehicle.payment || 'Unpaid';
-        break;
-    }
-    
-    openPicker(vehicleId, field, options, currentValue);
-    return;
-  }
-
-  // Picker option selection
-  const pickerOption = e.target.closest('.picker-option');
-  if (pickerOption && currentPickerVehicle && currentPickerField) {
-    e.preventDefault();
-    e.stopPropagation();
-    
-    const selectedValue = pickerOption.dataset.value;
-    
-    // Close modal
-    pickerModal.classList.remove('show');
-    overlay.classList.remove('show');
-    
-    // Update field
-    await updateVehicleAPI(currentPickerVehicle, currentPickerField, selectedValue);
-    
-    currentPickerVehicle = null;
-    currentPickerField = null;
-    return;
-  }
-
-  // Watch button clicks
-  const watchBtn = e.target.closest('.watch-btn');
-  if (watchBtn) {
-    e.preventDefault();
-    e.stopPropagation();
-    pauseAutoRefresh();
-    
-    const vehicleId = watchBtn.dataset.id;
-    if (!vehicleId) return;
-    
-    const vehicle = vehicles.find(v => String(v.id) === String(vehicleId));
-    if (!vehicle) return;
-    
-    const newWatchStatus = !vehicle.watch;
-    await updateVehicleAPI(vehicleId, 'watch', newWatchStatus);
-    return;
-  }
-
-  // Visibility button (hide/show for display route)
-  const visibilityBtn = e.target.closest('.visibility-btn');
-  if (visibilityBtn) {
-    e.preventDefault();
-    e.stopPropagation();
-    pauseAutoRefresh();
-    
-    const vehicleId = visibilityBtn.dataset.id;
-    if (!vehicleId) return;
-    
-    const vehicle = vehicles.find(v => String(v.id) === String(vehicleId));
-    if (!vehicle) return;
-    
-    const newVisibility = !vehicle.visible;
-    await updateVehicleAPI(vehicleId, 'visible', newVisibility);
-    return;
-  }
-
-  // Delete vehicle button
-  const deleteBtn = e.target.closest('.delete-btn');
-  if (deleteBtn) {
-    e.preventDefault();
-    e.stopPropagation();
-    pauseAutoRefresh();
-    
-    const vehicleId = deleteBtn.dataset.id;
-    const vehicle = vehicles.find(v => String(v.id) === String(vehicleId));
-    const vehicleInfo = vehicle ? `${vehicle.vehicle_no} - ${vehicle.vehicle_name}` : 'this vehicle';
-    
-    if (confirm(`Are you sure you want to delete ${vehicleInfo}?`)) {
-      await deleteVehicle(vehicleId);
-    }
-    return;
-  }
-
-  // Watch remove buttons in dropdown
-  const removeBtn = e.target.closest('.watch-remove');
-  if (removeBtn) {
-    e.preventDefault();
-    e.stopPropagation();
-    pauseAutoRefresh();
-    
-    const vehicleId = removeBtn.dataset.id;
-    await updateVehicleAPI(vehicleId, 'watch', false);
-    return;
-  }
-});
-
-// Handle input changes for text fields only with debouncing
-document.addEventListener('input', async (e) => {
-  const input = e.target;
-  if (!input.classList.contains('admin-input')) return;
-  
-  pauseAutoRefresh();
-  
-  const vehicleId = input.dataset.id;
-  const field = input.dataset.field;
-  const value = input.value;
-  
-  if (vehicleId && field) {
-    // Debounce the API call to avoid too many requests while typing
-    clearTimeout(input.updateTimeout);
-    input.updateTimeout = setTimeout(async () => {
-      await updateVehicleAPI(vehicleId, field, value);
-    }, 1500); // Wait 1.5 seconds after user stops typing
-  }
-});
-
-// Render functions
-function renderCRUDLists() {
-  // Departments
-  deptList.innerHTML = departments.map(dept => `
-    <div class="crud-item">
-      <span class="crud-item-text">${dept}</span>
-      <button class="crud-item-delete" data-delete-dept="${dept}">
-        <i class="ph ph-trash"></i>
-      </button>
-    </div>
-  `).join('');
-
-  // Technicians
-  techList.innerHTML = technicians.map(tech => `
-    <div class="crud-item">
-      <span class="crud-item-text">${tech}</span>
-      <button class="crud-item-delete" data-delete-tech="${tech}">
-        <i class="ph ph-trash"></i>
-      </button>
-    </div>
-  `).join('');
-
-  // Services
-  serviceList.innerHTML = services.map(service => `
-    <div class="crud-item">
-      <span class="crud-item-text">${service}</span>
-      <button class="crud-item-delete" data-delete-service="${service}">
-        <i class="ph ph-trash"></i>
-      </button>
-    </div>
-  `).join('');
-}
-
-function renderTable() {
-  // Desktop Table
-  tableBody.innerHTML = '';
-  
-  filteredVehicles.forEach((vehicle, index) => {
-    const row = document.createElement('tr');
-    row.innerHTML = `
-      <td>${index + 1}</td>
-      <td>
-        <input class="admin-input" data-id="${vehicle.id}" data-field="customer" value="${vehicle.customer || ''}" placeholder="Customer Name" />
-      </td>
-      <td>
-        <input class="admin-input" data-id="${vehicle.id}" data-field="vehicle_no" value="${vehicle.vehicle_no || ''}" placeholder="Vehicle No" />
-      </td>
-      <td>
-        <input class="admin-input" data-id="${vehicle.id}" data-field="vehicle_name" value="${vehicle.vehicle_name || ''}" placeholder="Vehicle Name" />
-      </td>
-      <td>
-        <button class="picker-btn" data-id="${vehicle.id}" data-field="department">
-          <span>${vehicle.department || (departments[0] || 'N/A')}</span>
-          <i class="ph ph-caret-down" style="color: #e63946;"></i>
-        </button>
-      </td>
-      <td>
-        <button class="picker-btn" data-id="${vehicle.id}" data-field="service">
-          <span>${vehicle.service || (services[0] || 'N/A')}</span>
-          <i class="ph ph-caret-down" style="color: #e63946;"></i>
-        </button>
-      </td>
-      <td>
-        <button class="picker-btn" data-id="${vehicle.id}" data-field="technician">
-          <span>${vehicle.technician || (technicians[0] || 'N/A')}</span>
-          <i class="ph ph-caret-down" style="color: #e63946;"></i>
-        </button>
-      </td>
-      <td>
-        <button class="picker-btn" data-id="${vehicle.id}" data-field="parts">
-          <span>${vehicle.parts || 'Not Arrived'}</span>
-          <i class="ph ph-caret-down" style="color: #e63946;"></i>
-        </button>
-      </td>
-      <td>
-        <button class="picker-btn" data-id="${vehicle.id}" data-field="status">
-          <span>${vehicle.status || (statuses[0] || 'N/A')}</span>
-          <i class="ph ph-caret-down" style="color: #e63946;"></i>
-        </button>
-      </td>
-      <td>
-        <button class="picker-btn" data-id="${vehicle.id}" data-field="payment">
-          <span>${vehicle.payment || 'Unpaid'}</span>
-          <i class="ph ph-caret-down" style="color: #e63946;"></i>
-        </button>
-      </td>
-      <td>
-        <button class="watch-btn" data-id="${vehicle.id}">
-          ${vehicle.watch ? 
-            '<i class="ph ph-eye" style="color: #e63946;"></i>' :
-            '<i class="ph ph-eye-slash" style="color: #9ca3af;"></i>'
-          }
-        </button>
-      </td>
-      <td>
-        <button class="delete-btn" data-id="${vehicle.id}">
-          Delete
-        </button>
-      </td>
-      <td>
-        <button class="visibility-btn" data-id="${vehicle.id}">
-          ${vehicle.visible !== false ? 
-            '<i class="ph ph-eye" style="color: #10b981;"></i>' :
-            '<i class="ph ph-eye-slash" style="color: #ef4444;"></i>'
-          }
-        </button>
-      </td>
-    `;
-    tableBody.appendChild(row);
-  });
-
-  // Mobile/Tablet Cards with swapped positions
-  cardsContainer.innerHTML = '';
-  
-  filteredVehicles.forEach((vehicle, index) => {
-    const card = document.createElement('div');
-    card.className = 'vehicle-card';
-    card.innerHTML = `
-      <div class="card-header">
-        <div>
-          <h3 class="card-title">#${index + 1} - ${vehicle.vehicle_no || 'N/A'}</h3>
-          <p class="card-subtitle">${vehicle.vehicle_name || 'No Name'}</p>
-        </div>
-        <div class="card-actions">
-          <button class="watch-btn" data-id="${vehicle.id}">
-            ${vehicle.watch ? 
-              '<i class="ph ph-eye" style="color: #e63946;"></i>' :
-              '<i class="ph ph-eye-slash" style="color: #9ca3af;"></i>'
-            }
-          </button>
-          <button class="delete-btn" data-id="${vehicle.id}">
-            Delete
-          </button>
-        </div>
-      </div>
-      
-      <div class="card-content">
-        <div class="card-field">
-          <label class="card-label">Customer</label>
-          <input class="admin-input" data-id="${vehicle.id}" data-field="customer" value="${vehicle.customer || ''}" placeholder="Customer Name" />
-        </div>
-        
-        <div class="card-field">
-          <label class="card-label">Vehicle Number</label>
-          <input class="admin-input" data-id="${vehicle.id}" data-field="vehicle_no" value="${vehicle.vehicle_no || ''}" placeholder="Vehicle No" />
-        </div>
-        
-        <div class="card-field">
-          <label class="card-label">Vehicle Name</label>
-          <input class="admin-input" data-id="${vehicle.id}" data-field="vehicle_name" value="${vehicle.vehicle_name || ''}" placeholder="Vehicle Name" />
-        </div>
-        
-        <div class="card-field">
-          <label class="card-label">Department</label>
-          <button class="picker-btn" data-id="${vehicle.id}" data-field="department">
-            <span>${vehicle.department || (departments[0] || 'N/A')}</span>
-            <i class="ph ph-caret-down" style="color: #e63946;"></i>
-          </button>
-        </div>
-        
-        <div class="card-field">
-          <label class="card-label">Service</label>
-          <button class="picker-btn" data-id="${vehicle.id}" data-field="service">
-            <span>${vehicle.service || (services[0] || 'N/A')}</span>
-            <i class="ph ph-caret-down" style="color: #e63946;"></i>
-          </button>
-        </div>
-        
-        <div class="card-field">
-          <label class="card-label">Technician</label>
-          <button class="picker-btn" data-id="${vehicle.id}" data-field="technician">
-            <span>${vehicle.technician || (technicians[0] || 'N/A')}</span>
-            <i class="ph ph-caret-down" style="color: #e63946;"></i>
-          </button>
-        </div>
-        
-        <div class="card-field">
-          <label class="card-label">Parts Status</label>
-          <button class="picker-btn" data-id="${vehicle.id}" data-field="parts">
-            <span>${vehicle.parts || 'Not Arrived'}</span>
-            <i class="ph ph-caret-down" style="color: #e63946;"></i>
-          </button>
-        </div>
-        
-        <div class="card-field">
-          <label class="card-label">Status</label>
-          <button class="picker-btn" data-id="${vehicle.id}" data-field="status">
-            <span>${vehicle.status || (statuses[0] || 'N/A')}</span>
-            <i class="ph ph-caret-down" style="color: #e63946;"></i>
-          </button>
-        </div>
-        
-        <div class="card-field">
-          <label class="card-label">Payment</label>
-          <button class="picker-btn" data-id="${vehicle.id}" data-field="payment">
-            <span>${vehicle.payment || 'Unpaid'}</span>
-            <i class="ph ph-caret-down" style="color: #e63946;"></i>
-          </button>
-        </div>
-        
-        <div class="card-hide-field">
-          <label class="card-label">Hide</label>
-          <button class="visibility-btn" data-id="${vehicle.id}">
-            ${vehicle.visible !== false ? 
-              '<i class="ph ph-eye" style="color: #10b981;"></i>' :
-              '<i class="ph ph-eye-slash" style="color: #ef4444;"></i>'
-            }
-          </button>
-        </div>
-      </div>
-    `;
-    cardsContainer.appendChild(card);
-  });
-}
-
-function updateWatchList() {
-  const watchedVehicles = vehicles.filter(v => v.watch);
-  
-  if (watchedVehicles.length > 0) {
-    watchBadge.textContent = watchedVehicles.length;
-    watchBadge.style.display = 'flex';
-  } else {
-    watchBadge.style.display = 'none';
-  }
-  
-  if (watchedVehicles.length === 0) {
-    watchContent.innerHTML = '<div style="padding: 24px; text-align: center; color: rgba(255,255,255,0.75);">No vehicles in watch list</div>';
-  } else {
-    watchContent.innerHTML = watchedVehicles.map(vehicle => `
-      <div class="watch-item">
-        <div class="watch-item-info">
-          <div class="watch-item-title">${vehicle.vehicle_no || 'N/A'} - ${vehicle.vehicle_name || 'N/A'}</div>
-          <div class="watch-item-service">${vehicle.service || 'N/A'}</div>
-          <div class="watch-item-tech">${vehicle.technician || 'N/A'}</div>
-        </div>
-        <button class="watch-remove" data-id="${vehicle.id}">
-          <i class="ph ph-eye-slash" style="color: #e63946;"></i>
-        </button>
-      </div>
-    `).join('');
-  }
-}
-
-// Toast notification system
-function showToast(message, type) {
-  toastMessage.textContent = message;
-  toast.className = `toast toast-${type}`;
-  toast.classList.add('show');
-  
-  setTimeout(() => {
-    toast.classList.remove('show');
-  }, type === 'error' ? 5000 : 3000);
-}
-
-function logout() {
-  window.location.href = '/logout';
-}
-
-// Auto-refresh every 5 seconds with pause detection
-setInterval(fetchAllData, 5000);
-</script>
-</body>
-</html>
-""",
-vehicles=vehicles,
-departments=departments,
-technicians=technicians,
-services=services,
-statuses=STATUSES,
-)
-###############################################################################
-# Dashboard (read-only)
-###############################################################################
-from flask import render_template_string, redirect, session
-# assuming you have read_vehicles() available as in staff route
-# from your_module import read_vehicles
-
-@app.route("/dashboard")
-def dashboard():
-    if session.get("user") != "dashboard":
-        return redirect("/")
-
-    vehicles = read_vehicles()
-
-    return render_template_string(
-        r"""<!doctype html>
-<html>
-<head>
-  <meta name="viewport" content="width=device-width, initial-scale=1, maximum-scale=1, user-scalable=no">
-  <title>Dashboard</title>
-  <link rel="stylesheet" href="https://unpkg.com/@phosphor-icons/web@2.0.3/src/regular/style.css">
-  <style>
-      /* Hide scrollbars */
-    ::-webkit-scrollbar {
-      display: none;
-    }
-    * {
-      scrollbar-width: none;
-      -ms-overflow-style: none;
-    }
-    .scrollable::-webkit-scrollbar {
-      display: none;
-    }
-
-    body {
-      margin: 0;
-      font-family: Inter, "Segoe UI", system-ui, -apple-system, sans-serif;
-      background: radial-gradient(800px 500px at 10% 10%, #11141a 0%, rgba(0,0,0,0) 30%), linear-gradient(180deg, #0b0d10, #0f1418);
-      color: #fff;
-      min-height: 100vh;
-      overflow-x: hidden;
-      -webkit-overflow-scrolling: touch;
-      overscroll-behavior: none;
-      background-attachment: fixed;
-    }
-    
-    html {
-      -webkit-overflow-scrolling: touch;
-      overscroll-behavior: none;
-    }
-
-    /* Top Controls - Responsive */
-    .top-controls {
-      position: fixed;
-      top: 16px;
-      right: 16px;
-      z-index: 50;
-      display: flex;
-      gap: 12px;
-      transition: opacity 0.15s ease;
-    }
-    
-    @media (max-width: 480px) {
-      .top-controls {
-        top: 8px;
-        right: 8px;
-        gap: 8px;
-      }
-    }
-    
-    @media (max-width: 360px) {
-      .top-controls {
-        top: 4px;
-        right: 4px;
-        gap: 6px;
-      }
-    }
-    
-    .top-controls.fade {
-      opacity: 0;
-      transform: translateY(-10px);
-      pointer-events: none;
-    }
-
-    .top-controls.fade .search-input-container {
-      opacity: 0.5;
-      transition: opacity 0.3s ease;
-    }
-    
-    .control-btn {
-      width: 44px;
-      height: 44px;
-      border-radius: 12px;
-      display: flex;
-      align-items: center;
-      justify-content: center;
-      background: rgba(255,255,255,.06);
-      border: 1px solid rgba(255,255,255,.08);
-      backdrop-filter: blur(8px);
-      cursor: pointer;
-      transition: transform 0.3s ease;
-      position: relative;
-    }
-    
-    @media (max-width: 480px) {
-      .control-btn {
-        width: 40px;
-        height: 40px;
-        border-radius: 10px;
-      }
-    }
-    
-    @media (max-width: 360px) {
-      .control-btn {
-        width: 36px;
-        height: 36px;
-        border-radius: 8px;
-      }
-    }
-    
-    .control-btn:hover {
-      transform: translateY(-2px);
-    }
-
-    /* Search - Responsive */
-    .search-container {
-      display: flex;
-      align-items: center;
-      gap: 8px;
-    }
-    
-    .search-input-container {
-      display: none;
-      align-items: center;
-      background: rgba(255,255,255,.06);
-      border: 1px solid rgba(255,255,255,.08);
-      border-radius: 12px;
-      padding: 12px 16px;
-      backdrop-filter: blur(8px);
-      transition: all 0.3s ease;
-      animation: slideInFromRight 0.3s ease;
-    }
-    
-    @media (max-width: 768px) {
-      .search-input-container {
-        padding: 10px 12px;
-        border-radius: 10px;
-      }
-    }
-    
-    @media (max-width: 480px) {
-      .search-input-container {
-        padding: 8px 10px;
-        border-radius: 8px;
-      }
-    }
-    
-    .search-input-container.show {
-      display: flex;
-    }
-    
-    .search-input {
-      background: transparent;
-      border: none;
-      color: #fff;
-      outline: none;
-      width: 256px;
-      margin-left: 8px;
-    }
-    
-    @media (max-width: 768px) {
-      .search-input {
-        width: 200px;
-      }
-    }
-    
-    @media (max-width: 480px) {
-      .search-input {
-        width: 150px;
-        margin-left: 6px;
-      }
-    }
-    
-    @media (max-width: 360px) {
-      .search-input {
-        width: 120px;
-        margin-left: 4px;
-      }
-    }
-    
-    .search-input::placeholder {
-      color: rgba(255,255,255,0.5);
-    }
-    
-    .search-clear {
-      margin-left: 8px;
-      color: rgba(255,255,255,0.75);
-      background: none;
-      border: none;
-      cursor: pointer;
-    }
-
-    /* Watch List - Responsive */
-    .watch-badge {
-      position: absolute;
-      top: -4px;
-      right: -4px;
-      width: 20px;
-      height: 20px;
-      border-radius: 50%;
-      background: #E63946;
-      color: #fff;
-      font-size: 12px;
-      font-weight: 600;
-      display: flex;
-      align-items: center;
-      justify-content: center;
-    }
-    
-    @media (max-width: 480px) {
-      .watch-badge {
-        width: 18px;
-        height: 18px;
-        font-size: 10px;
-        top: -3px;
-        right: -3px;
-      }
-    }
-
-    .watch-dropdown {
-      position: absolute;
-      top: 100%;
-      right: 0;
-      margin-top: 8px;
-      width: 384px;
-      background: #0e1116;
-      border: 1px solid #1b1f27;
-      border-radius: 16px;
-      backdrop-filter: blur(8px);
-      box-shadow: 0 25px 50px rgba(0,0,0,0.25);
-      z-index: 60;
-      display: none;
-      opacity: 0;
-      transform: translateY(-8px);
-      transition: opacity 0.3s ease, transform 0.3s ease;
-    }
-    
-    @media (max-width: 768px) {
-      .watch-dropdown {
-        width: 320px;
-        border-radius: 12px;
-      }
-    }
-    
-    @media (max-width: 480px) {
-      .watch-dropdown {
-        width: 280px;
-        border-radius: 10px;
-        margin-top: 6px;
-      }
-    }
-    
-    @media (max-width: 360px) {
-      .watch-dropdown {
-        width: 250px;
-        border-radius: 8px;
-        margin-top: 4px;
-      }
-    }
-    
-    .watch-dropdown.show {
-      display: block;
-      opacity: 1;
-      transform: translateY(0);
-    }
-    
-    .watch-dropdown-header {
-      padding: 20px;
-      border-bottom: 1px solid #1b1f27;
-    }
-    
-    @media (max-width: 480px) {
-      .watch-dropdown-header {
-        padding: 16px;
-      }
-    }
-    
-    @media (max-width: 360px) {
-      .watch-dropdown-header {
-        padding: 12px;
-      }
-    }
-    
-    .watch-dropdown-header h3 {
-      font-size: 18px;
-      font-weight: 600;
-      color: #fff;
-      margin: 0;
-    }
-    
-    @media (max-width: 480px) {
-      .watch-dropdown-header h3 {
-        font-size: 16px;
-      }
-    }
-    
-    .watch-dropdown-content {
-      max-height: 384px;
-      overflow-y: auto;
-      scroll-behavior: smooth;
-    }
-    
-    @media (max-width: 480px) {
-      .watch-dropdown-content {
-        max-height: 300px;
-      }
-    }
-
-    .watch-dropdown-content:hover {
-      overscroll-behavior: contain;
-    }
-    
-    .watch-item {
-      padding: 16px;
-      border-bottom: 1px solid rgba(27,31,39,0.3);
-      display: flex;
-      justify-content: space-between;
-      align-items: flex-start;
-      transition: transform 0.2s ease;
-    }
-    
-    @media (max-width: 480px) {
-      .watch-item {
-        padding: 12px;
-      }
-    }
-    
-    .watch-item:hover {
-      transform: scale(1.02);
-    }
-    
-    .watch-item-info {
-      flex: 1;
-    }
-    
-    .watch-item-title {
-      color: #fff;
-      font-weight: 600;
-      margin-bottom: 4px;
-    }
-    
-    @media (max-width: 480px) {
-      .watch-item-title {
-        font-size: 14px;
-      }
-    }
-    
-    .watch-item-service {
-      color: rgba(255,255,255,0.75);
-      font-size: 14px;
-      margin-bottom: 4px;
-    }
-    
-    @media (max-width: 480px) {
-      .watch-item-service {
-        font-size: 12px;
-      }
-    }
-    
-    .watch-item-tech {
-      color: rgba(255,255,255,0.6);
-      font-size: 12px;
-    }
-    
-    @media (max-width: 480px) {
-      .watch-item-tech {
-        font-size: 10px;
-      }
-    }
-    
-    .watch-remove {
-      padding: 8px;
-      background: none;
-      border: none;
-      border-radius: 4px;
-      cursor: pointer;
-      transition: transform 0.2s ease;
-    }
-    
-    .watch-remove:hover {
-      transform: scale(1.1);
-    }
-
-    /* Overlay */
-    .overlay {
-      position: fixed;
-      inset: 0;
-      background: rgba(0,0,0,0);
-      backdrop-filter: blur(0px);
-      z-index: 40;
-      opacity: 0;
-      pointer-events: none;
-      transition: all 0.3s ease;
-    }
-    
-    .overlay.show {
-      backdrop-filter: blur(4px);
-      opacity: 1;
-      pointer-events: auto;
-    }
-
-    /* Drawer - Responsive */
-    .drawer {
-      position: fixed;
-      top: 0;
-      right: -320px;
-      width: 320px;
-      height: 100vh;
-      background: #0e1116;
-      border-left: 1px solid #1b1f27;
-      box-shadow: -16px 0 48px rgba(0,0,0,0.5);
-      z-index: 50;
-      transition: right 0.3s cubic-bezier(0.22, 1, 0.36, 1);
-    }
-    
-    @media (max-width: 480px) {
-      .drawer {
-        width: 280px;
-        right: -280px;
-      }
-    }
-    
-    @media (max-width: 360px) {
-      .drawer {
-        width: 250px;
-        right: -250px;
-      }
-    }
-    
-    .drawer.show {
-      right: 0;
-    }
-    
-    .drawer-header {
-      padding: 20px;
-      border-bottom: 1px solid #1b1f27;
-    }
-    
-    @media (max-width: 480px) {
-      .drawer-header {
-        padding: 16px;
-      }
-    }
-    
-    .drawer-header h3 {
-      font-size: 18px;
-      font-weight: 600;
-      color: #fff;
-      margin: 0;
-    }
-    
-    @media (max-width: 480px) {
-      .drawer-header h3 {
-        font-size: 16px;
-      }
-    }
-    
-    .logout-btn {
-      margin: 20px;
-      padding: 12px 16px;
-      border-radius: 12px;
-      border: none;
-      background: linear-gradient(90deg, #e63946, #d2353f);
-      color: #fff;
-      font-weight: 900;
-      cursor: pointer;
-      width: calc(100% - 40px);
-      transition: transform 0.3s ease;
-    }
-    
-    @media (max-width: 480px) {
-      .logout-btn {
-        margin: 16px;
-        padding: 10px 14px;
-        border-radius: 10px;
-        width: calc(100% - 32px);
-      }
-    }
-    
-    .logout-btn:hover {
-      transform: translateY(-2px);
-    }
-
-    /* Main Content - Responsive */
-    .main-content {
-      padding: 24px;
-      padding-top: 80px;
-      max-width: 1280px;
-      margin: 0 auto;
-    }
-    
-    @media (max-width: 768px) {
-      .main-content {
-        padding: 20px;
-        padding-top: 70px;
-      }
-    }
-    
-    @media (max-width: 480px) {
-      .main-content {
-        padding: 16px;
-        padding-top: 60px;
-      }
-    }
-    
-    @media (max-width: 360px) {
-      .main-content {
-        padding: 12px;
-        padding-top: 50px;
-      }
-    }
+JSON_MIMETYPE = "application/json"
+MSGPACK_MIMETYPE = "application/msgpack"
+CBOR_MIMETYPE = "application/cbor"
+NDJSON_MIMETYPE = "application/x-ndjson"
 
-    .page-title {
-      font-size: 30px;
-      font-weight: 700;
-      color: #fff;
-      margin-bottom: 32px;
-    }
-    
-    @media (max-width: 768px) {
-      .page-title {
-        font-size: 26px;
-        margin-bottom: 24px;
-      }
-    }
-    
-    @media (max-width: 480px) {
-      .page-title {
-        font-size: 22px;
-        margin-bottom: 20px;
-      }
-    }
-    
-    @media (max-width: 360px) {
-      .page-title {
-        font-size: 20px;
-        margin-bottom: 16px;
-      }
-    }
+# JSON lists longer than this are streamed instead of built in one piece
+STREAM_THRESHOLD = int(os.getenv("STREAM_THRESHOLD", "1000"))
+STREAM_CHUNK_RECORDS = 500
 
-    /* Table Container - Responsive */
-    .table-container {
-      background: rgba(255,255,255,.06);
-      border: 1px solid rgba(255,255,255,.08);
-      border-radius: 16px;
-      backdrop-filter: blur(8px);
-      box-shadow: 0 25px 50px rgba(0,0,0,0.25);
-      overflow: hidden;
-    }
-    
-    @media (max-width: 768px) {
-      .table-container {
-        border-radius: 12px;
-      }
-    }
-    
-    @media (max-width: 480px) {
-      .table-container {
-        border-radius: 10px;
-      }
-    }
+# Cursor pagination (see paginate_vehicles)
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
 
-    .table-wrapper {
-      overflow-x: auto;
-    }
+USERS: Dict[str, str] = {
+    "admin": "admin123",
+    "staff": "staff123",
+    "dashboard": "dashboard123",
+    "display": "display123",
+    "reception": "reception123",
+}
 
-    /* Desktop Table */
-    .desktop-table {
-      width: 100%;
-      border-collapse: collapse;
-      display: table;
-    }
-    
-    .desktop-table th {
-      text-align: left;
-      padding: 16px;
-      color: #fff;
-      font-weight: 600;
-      border-bottom: 1px solid rgba(255,255,255,0.1);
-    }
-    
-    @media (max-width: 768px) {
-      .desktop-table th {
-        padding: 12px 8px;
-        font-size: 14px;
-      }
-    }
-    
-    .desktop-table tr {
-      transition: all 0.2s ease-out;
-    }
-    
-    .desktop-table tr:not(:last-child) {
-      border-bottom: 1px solid rgba(255,255,255,0.05);
-    }
-    
-    .desktop-table tbody tr:hover {
-      transform: scale(1.01);
-      box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-    }
+###############################################################################
+# Helpers
+###############################################################################
 
-    .desktop-table td {
-      padding: 16px;
-      color: rgba(255,255,255,0.9);
-    }
-    
-    @media (max-width: 768px) {
-      .desktop-table td {
-        padding: 12px 8px;
-        font-size: 14px;
-      }
-    }
+# ---------- Serialization ----------
+# orjson is used when installed; everything falls back to the stdlib json module.
+
+def json_dumps(data: Any, *, indent: bool = False, sort_keys: bool = False,
+               default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, compact unless indent is set."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(data, default=default, option=option)
+    if indent:
+        text = json.dumps(data, indent=2, ensure_ascii=False, sort_keys=sort_keys, default=default)
+    else:
+        text = json.dumps(data, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys, default=default)
+    return text.encode("utf-8")
+
+
+def json_loads(raw: Any) -> Any:
+    """Parse JSON from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider (jsonify, request.get_json, |tojson) on top of json_dumps."""
+
+    # Keep records in their stored field order; sorting is pure overhead here
+    sort_keys = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if orjson is None:
+            return super().dumps(obj, **kwargs)
+        return json_dumps(
+            obj,
+            indent=bool(kwargs.get("indent")),
+            sort_keys=kwargs.get("sort_keys", self.sort_keys),
+            default=kwargs.get("default", self.default),
+        ).decode("utf-8")
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return json_loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        with timed("serialize"):
+            body = json_dumps(obj, indent=indent, sort_keys=self.sort_keys, default=self.default)
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+
+
+app.json = FastJSONProvider(app)
 
-    /* Mobile Cards - Hidden on Desktop */
-    .mobile-cards {
-      display: none;
-    }
-    
-    @media (max-width: 640px) {
-      .desktop-table {
-        display: none;
-      }
-      
-      .mobile-cards {
-        display: block;
-        padding: 16px;
-      }
-    }
-    
-    @media (max-width: 480px) {
-      .mobile-cards {
-        padding: 12px;
-      }
-    }
-    
-    .vehicle-card {
-      background: rgba(255,255,255,.04);
-      border: 1px solid rgba(255,255,255,.06);
-      border-radius: 12px;
-      padding: 16px;
-      margin-bottom: 16px;
-      backdrop-filter: blur(4px);
-      transition: transform 0.2s ease, box-shadow 0.2s ease;
-    }
-    
-    @media (max-width: 480px) {
-      .vehicle-card {
-        border-radius: 10px;
-        padding: 14px;
-        margin-bottom: 14px;
-      }
-    }
-    
-    .vehicle-card:hover {
-      transform: translateY(-2px);
-      box-shadow: 0 8px 24px rgba(0,0,0,0.2);
-    }
-    
-    .card-header {
-      display: flex;
-      justify-content: space-between;
-      align-items: flex-start;
-      margin-bottom: 12px;
-      border-bottom: 1px solid rgba(255,255,255,0.1);
-      padding-bottom: 8px;
-    }
-    
-    .card-title {
-      font-size: 16px;
-      font-weight: 600;
-      color: #fff;
-      margin: 0;
-    }
-    
-    @media (max-width: 480px) {
-      .card-title {
-        font-size: 15px;
-      }
-    }
-    
-    .card-number {
-      font-size: 14px;
-      color: rgba(255,255,255,0.6);
-      font-weight: 500;
-    }
-    
-    @media (max-width: 480px) {
-      .card-number {
-        font-size: 13px;
-      }
-    }
-    
-    .card-row {
-      display: flex;
-      justify-content: space-between;
-      align-items: center;
-      margin: 8px 0;
-    }
-    
-    .card-label {
-      font-size: 13px;
-      color: rgba(255,255,255,0.7);
-      font-weight: 500;
-    }
-    
-    @media (max-width: 480px) {
-      .card-label {
-        font-size: 12px;
-      }
-    }
-    
-    .card-value {
-      font-size: 14px;
-      color: rgba(255,255,255,0.9);
-      text-align: right;
-    }
-    
-    @media (max-width: 480px) {
-      .card-value {
-        font-size: 13px;
-      }
-    }
-    
-    .card-actions {
-      display: flex;
-      justify-content: space-between;
-      align-items: center;
-      margin-top: 16px;
-      padding-top: 12px;
-      border-top: 1px solid rgba(255,255,255,0.1);
-    }
-    
-    @media (max-width: 480px) {
-      .card-actions {
-        margin-top: 14px;
-        padding-top: 10px;
-      }
-    }
 
-    /* Badges - Responsive */
-    .badge {
-      display: inline-block;
-      white-space: nowrap;
-      font-size: 14px !important;
-      font-weight: 600 !important;
-      padding: 6px 12px !important;
-      border-radius: 8px !important;
-      letter-spacing: 0.5px;
-      box-shadow: 0 2px 8px rgba(0,0,0,0.4);
-      text-transform: uppercase;
-    }
-    
-    @media (max-width: 768px) {
-      .badge {
-        font-size: 12px !important;
-        padding: 5px 10px !important;
-        border-radius: 6px !important;
-      }
-    }
-    
-    @media (max-width: 640px) {
-      .badge {
-        font-size: 11px !important;
-        padding: 4px 8px !important;
-        border-radius: 5px !important;
-      }
-    }
-    
-    @media (max-width: 480px) {
-      .badge {
-        font-size: 10px !important;
-        padding: 3px 6px !important;
-        border-radius: 4px !important;
-      }
-    }
+def load_json(path: str) -> Any:
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            try:
+                return json_loads(f.read())
+            except json.JSONDecodeError:
+                # tolerate corrupted/empty files
+                return []
+    return []
 
-    .badge-success {
-      background-color: #28d17c !important;
-      color: #fff !important;
-    }
 
-    .badge-warning {
-      background-color: #ffc107 !important;
-      color: #212529 !important;
-    }
+def save_json(path: str, data: Any, fsync: bool = False) -> None:
+    # Data files are machine-owned: write compact JSON. Write a temp file and
+    # rename it over the target so other processes never read a partial file.
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(json_dumps(data))
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp, path)
+    if fsync and hasattr(os, "O_DIRECTORY"):
+        # make the rename itself durable
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+# ---------- Content negotiation ----------
+BINARY_ENCODERS: Dict[str, Callable[[Any], bytes]] = {}
+if msgpack is not None:
+    BINARY_ENCODERS[MSGPACK_MIMETYPE] = lambda data: msgpack.packb(data, use_bin_type=True)
+if cbor2 is not None:
+    BINARY_ENCODERS[CBOR_MIMETYPE] = cbor2.dumps
+
+
+# ---------- Streaming ----------
+
+def _chunks(records: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    it = iter(records)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+def iter_json_array(records: Iterable[Any], chunk: int = STREAM_CHUNK_RECORDS) -> Iterator[bytes]:
+    """Yield a JSON array a batch of records at a time.
+
+    Memory stays bounded by one batch instead of the whole encoded document,
+    and clients can start parsing before the last record is sent.
+    """
+    yield b"["
+    first = True
+    for batch in _chunks(records, chunk):
+        body = json_dumps(batch)[1:-1]
+        yield body if first else b"," + body
+        first = False
+    yield b"]\n"
+
+
+def iter_ndjson(records: Iterable[Any], chunk: int = STREAM_CHUNK_RECORDS) -> Iterator[bytes]:
+    """Yield newline-delimited JSON, one record per line."""
+    for batch in _chunks(records, chunk):
+        yield b"".join(json_dumps(record) + b"\n" for record in batch)
+
+
+def iter_msgpack_array(records: Sequence[Any], chunk: int = STREAM_CHUNK_RECORDS) -> Iterator[bytes]:
+    """Yield a MessagePack array a batch of records at a time (see iter_json_array)."""
+    packer = msgpack.Packer(use_bin_type=True)
+    yield packer.pack_array_header(len(records))
+    for batch in _chunks(records, chunk):
+        yield b"".join(packer.pack(record) for record in batch)
+
+
+# Binary types whose large lists can be streamed like JSON
+STREAM_ENCODERS: Dict[str, Callable[[Sequence[Any]], Iterator[bytes]]] = {}
+if msgpack is not None:
+    STREAM_ENCODERS[MSGPACK_MIMETYPE] = iter_msgpack_array
+
+
+def api_response(data: Any, status: int = 200) -> Response:
+    """Encode data as JSON, MessagePack or CBOR, whichever the Accept header prefers.
+
+    JSON wins ties (e.g. ``*/*``), so existing clients are unaffected; binary
+    types are only offered when their encoder is installed. Large JSON and
+    MessagePack lists are streamed (see iter_json_array).
+    """
+    mimetype = request.accept_mimetypes.best_match(
+        [JSON_MIMETYPE, *BINARY_ENCODERS], default=JSON_MIMETYPE
+    )
+    large = isinstance(data, (list, tuple)) and len(data) > STREAM_THRESHOLD
+    if mimetype == JSON_MIMETYPE:
+        if large:
+            response = Response(iter_json_array(data), mimetype=JSON_MIMETYPE)
+        else:
+            response = jsonify(data)
+    elif large and mimetype in STREAM_ENCODERS:
+        response = Response(STREAM_ENCODERS[mimetype](data), mimetype=mimetype)
+    else:
+        with timed("serialize"):
+            body = BINARY_ENCODERS[mimetype](data)
+        response = Response(body, mimetype=mimetype)
+    response.status_code = status
+    response.vary.add("Accept")
+    return response
+
+
+def backfill_vehicles(records: List[Dict[str, Any]], departments, technicians, services) -> None:
+    """Ensure every record loaded from disk has all fields (in place)"""
+    for i, v in enumerate(records):
+        v.setdefault("id", str(uuid.uuid4()))
+        v.setdefault("seq", i + 1)
+        v.setdefault("customer", "")
+        v.setdefault("vehicle_no", "")
+        v.setdefault("vehicle_name", "")
+        v.setdefault("department", departments[0] if departments else "")
+        v.setdefault("service", services[0] if services else "")
+        v.setdefault("technician", technicians[0] if technicians else "")
+        v.setdefault("status", STATUSES[0])
+        v.setdefault("payment", "Unpaid")
+        v.setdefault("parts", "Not Arrived")
+        v.setdefault("visible", True)
+        v.setdefault("version", 1)
+        v.pop("idempotency_key", None)  # older /api/add kept the key in the card
 
-    .badge-danger {
-      background-color: #ff3b30 !important;
-      color: #fff !important;
-    }
-    
-    .badge-paid {
-      background: #10b981;
-      color: #fff;
-    }
-    
-    .badge-advance {
-      background: #f59e0b;
-      color: #fff;
-    }
-    
-    .badge-unpaid {
-      background: #ef4444;
-      color: #fff;
-    }
 
-    /* Watch Button - Responsive */
-    .watch-btn {
-      padding: 8px;
-      background: none;
-      border: none;
-      border-radius: 8px;
-      cursor: pointer;
-      transition: transform 0.2s ease;
-    }
-    
-    @media (max-width: 640px) {
-      .watch-btn {
-        padding: 6px;
-        border-radius: 6px;
-      }
-    }
-    
-    .watch-btn:hover {
-      transform: scale(1.1);
-    }
+def next_seq(records: Tuple[Dict[str, Any], ...]) -> int:
+    """Creation sequence for a new record.
 
-    /* Toast - Responsive */
-    .toast {
-      position: fixed;
-      top: 50%;
-      left: 50%;
-      transform: translate(-50%, -50%);
-      padding: 20px 28px;
-      border-radius: 16px;
-      font-size: 14px;
-      font-weight: 500;
-      display: flex;
-      align-items: center;
-      justify-content: center;
-      box-shadow: 0 25px 50px rgba(0,0,0,0.25);
-      z-index: 100;
-      min-width: 384px;
-      max-width: 384px;
-      opacity: 0;
-      pointer-events: none;
-      transition: all 0.35s ease;
-    }
-    
-    @media (max-width: 768px) {
-      .toast {
-        min-width: 320px;
-        max-width: 320px;
-        padding: 16px 24px;
-        border-radius: 12px;
-      }
-    }
-    
-    @media (max-width: 480px) {
-      .toast {
-        min-width: 280px;
-        max-width: 280px;
-        padding: 14px 20px;
-        border-radius: 10px;
-        font-size: 13px;
-      }
-    }
-    
-    @media (max-width: 360px) {
-      .toast {
-        min-width: 240px;
-        max-width: 240px;
-        padding: 12px 16px;
-        border-radius: 8px;
-        font-size: 12px;
-      }
-    }
-    
-    .toast.show {
-      opacity: 1;
-      pointer-events: auto;
-      transform: translate(-50%, -50%) scale(1.02);
-    }
-    
-    .toast-success {
-      background: linear-gradient(135deg, #10b981, #059669);
-      color: #fff;
-    }
-    
-    .toast-error {
-      background: #ef4444;
-      color: #fff;
-    }
+    Millisecond clock, but always past the newest record so the list stays
+    sorted by seq and a deleted tail never hands its number out again.
+    """
+    last = records[-1]["seq"] if records else 0
+    return max(last + 1, int(time.time() * 1000))
 
-    /* No Results - Responsive */
-    .no-results {
-      text-align: center;
-      color: rgba(255,255,255,0.75);
-      margin-top: 32px;
-    }
-    
-    @media (max-width: 768px) {
-      .no-results {
-        margin-top: 24px;
-        font-size: 14px;
-      }
-    }
-    
-    @media (max-width: 480px) {
-      .no-results {
-        margin-top: 20px;
-        font-size: 13px;
-      }
-    }
 
-    /* Icons - Responsive */
-    .ph {
-      font-size: 28px !important;
-      color: #fff !important;
-    }
-    
-    @media (max-width: 480px) {
-      .ph {
-        font-size: 24px !important;
-      }
-    }
-    
-    @media (max-width: 360px) {
-      .ph {
-        font-size: 20px !important;
-      }
-    }
+# ---------- Cursor pagination ----------
+# Records are kept in creation order, i.e. sorted by (seq, id); a cursor is
+# the opaque key of the row it was cut at plus a direction, so pages do not
+# shift when /api/add appends or another row is deleted mid-scroll.
 
-    /* Animations */
-    @keyframes slideInFromRight {
-      from {
-        transform: translateX(16px);
-        opacity: 0;
-      }
-      to {
-        transform: translateX(0);
-        opacity: 1;
-      }
-    }
+def _sort_key(v: Dict[str, Any]) -> tuple:
+    return (v["seq"], v["id"])
 
-    /* Enhanced Badge Colors */
-    .badge-danger  { 
-      background-color: #ff1744 !important; 
-      color: #fff !important; 
-      box-shadow: 0 0 10px rgba(255,23,68,.9); 
-    }
-    
-    .badge-warning { 
-      background-color: #faff00 !important; 
-      color: #000 !important; 
-      box-shadow: 0 0 10px rgba(250,255,0,.9); 
-    }
-    
-    .badge-success { 
-      background-color: #39ff14 !important; 
-      color: #000 !important; 
-      box-shadow: 0 0 10px rgba(57,255,20,.9); 
-    }
 
-    /* Landscape orientation fixes for mobile */
-    @media (max-height: 500px) and (orientation: landscape) {
-      .main-content {
-        padding-top: 50px;
-      }
-      
-      .page-title {
-        font-size: 18px;
-        margin-bottom: 12px;
-      }
-      
-      .vehicle-card {
-        padding: 12px;
-        margin-bottom: 12px;
-      }
-      
-      .watch-dropdown {
-        max-height: 200px;
-      }
-      
-      .watch-dropdown-content {
-        max-height: 150px;
-      }
-    }
+def encode_cursor(v: Dict[str, Any], direction: str) -> str:
+    raw = json_dumps([v["seq"], v["id"], direction])
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
 
-    /* Ultra small screens (below 320px) */
-    @media (max-width: 320px) {
-      .top-controls {
-        gap: 4px;
-        top: 2px;
-        right: 2px;
-      }
-      
-      .control-btn {
-        width: 32px;
-        height: 32px;
-      }
-      
-      .search-input {
-        width: 100px;
-      }
-      
-      .watch-dropdown {
-        width: 220px;
-      }
-      
-      .drawer {
-        width: 220px;
-        right: -220px;
-      }
-      
-      .main-content {
-        padding: 8px;
-        padding-top: 45px;
-      }
-      
-      .page-title {
-        font-size: 18px;
-        margin-bottom: 12px;
-      }
-      
-      .vehicle-card {
-        padding: 10px;
-        margin-bottom: 10px;
-      }
-      
-      .badge {
-        font-size: 9px !important;
-        padding: 2px 4px !important;
-        border-radius: 3px !important;
-      }
-    }
 
-  </style>
-</head>
-<body>
-
-<!-- Top Controls -->
-<div class="top-controls">
-  <!-- Search -->
-  <div class="search-container">
-    <div id="searchInput" class="search-input-container">
-      <i class="ph ph-magnifying-glass"></i>
-      <input id="searchField" class="search-input" placeholder="Search" />
-      <button id="searchClear" class="search-clear" style="display: none;">✕</button>
-    </div>
-    <button id="searchToggle" class="control-btn">
-      <i class="ph ph-magnifying-glass"></i>
-    </button>
-  </div>
-
-  <!-- Watch List -->
-  <div class="watch-container" style="position: relative;">
-    <button id="watchToggle" class="control-btn">
-      <i class="ph ph-eye"></i>
-      <span id="watchBadge" class="watch-badge" style="display: none;">0</span>
-    </button>
-    <div id="watchDropdown" class="watch-dropdown">
-      <div class="watch-dropdown-header">
-        <h3>Watch List</h3>
-      </div>
-      <div id="watchContent" class="watch-dropdown-content">
-        <div style="padding: 24px; text-align: center; color: rgba(255,255,255,0.75);">
-          No vehicles in watch list
-        </div>
-      </div>
-    </div>
-  </div>
-
-  <!-- Menu -->
-  <button id="menuToggle" class="control-btn">
-    <i class="ph ph-list"></i>
-  </button>
-</div>
-
-<!-- Overlay -->
-<div id="overlay" class="overlay"></div>
-
-<!-- Drawer -->
-<div id="drawer" class="drawer">
-  <div class="drawer-header">
-    <h3>MENU</h3>
-  </div>
-  <button class="logout-btn" onclick="logout()">Logout</button>
-</div>
-
-<!-- Main Content -->
-<div class="main-content">
-  <h1 class="page-title">Dashboard</h1>
-  
-  <div class="table-container">
-    <!-- Desktop Table -->
-    <div class="table-wrapper">
-      <table class="desktop-table">
-        <thead>
-          <tr>
-           <th>S.No</th>
-           <th>Customer</th>
-           <th>Vehicle No</th>
-           <th>Vehicle Name</th>
-           <th>Department</th>
-           <th>Service</th>
-           <th>Technician</th>
-           <th>Parts Status</th>
-           <th>Status</th>
-           <th>Payment</th>
-           <th>Watch</th>
-          </tr>
-        </thead>
-        <tbody id="tableBody"></tbody>
-      </table>
-    </div>
-    
-    <!-- Mobile Cards -->
-    <div class="mobile-cards" id="mobileCards"></div>
-  </div>
-
-  <div id="noResults" class="no-results" style="display: none;">
-    No vehicles found matching "<span id="searchTerm"></span>"
-  </div>
-</div>
-
-<!-- Toast -->
-<div id="toast" class="toast">
-  <span id="toastMessage"></span>
-</div>
-
-
-<script>
-
-// Simple unified status badge (only 3 neon statuses)
-function statusBadge(status) {
-  const val = (status || '').toLowerCase();
-  if (val === 'done') return '<span class="badge badge-success">Done</span>';
-  if (val === 'in service') return '<span class="badge badge-warning">In Service</span>';
-  return '<span class="badge badge-danger">Waiting</span>';
-}
+def decode_cursor(cursor: str) -> tuple:
+    """Return ((seq, id), direction); raises ValueError on a malformed cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        seq, vid, direction = json_loads(raw)
+    except (binascii.Error, TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if not isinstance(seq, int) or not isinstance(vid, str) or direction not in {"next", "prev"}:
+        raise ValueError("Invalid cursor")
+    return (seq, vid), direction
 
-// Global variables
-let vehicles = {{ vehicles|tojson }};
-let filteredVehicles = [...vehicles];
-
-// DOM elements
-const searchToggle = document.getElementById('searchToggle');
-const searchInput = document.getElementById('searchInput');
-const searchField = document.getElementById('searchField');
-const searchClear = document.getElementById('searchClear');
-const watchToggle = document.getElementById('watchToggle');
-const watchDropdown = document.getElementById('watchDropdown');
-const watchBadge = document.getElementById('watchBadge');
-const watchContent = document.getElementById('watchContent');
-const menuToggle = document.getElementById('menuToggle');
-const overlay = document.getElementById('overlay');
-const drawer = document.getElementById('drawer');
-const tableBody = document.getElementById('tableBody');
-const mobileCards = document.getElementById('mobileCards');
-const noResults = document.getElementById('noResults');
-const searchTerm = document.getElementById('searchTerm');
-const toast = document.getElementById('toast');
-const toastMessage = document.getElementById('toastMessage');
-
-// Initialize
-updateWatchList();
-renderTable();
-
-// Fade top controls on scroll
-const topControls = document.querySelector('.top-controls');
-
-window.addEventListener('scroll', () => {
-  const scrollY = window.scrollY || window.pageYOffset;
-  if (scrollY > 20) {
-    topControls.classList.add('fade');
-  } else {
-    topControls.classList.remove('fade');
-  }
-});
-
-// Responsive screen size detection
-function isMobile() {
-  return window.innerWidth <= 640;
-}
 
-// API update function - WATCH ONLY (no parts status picker)
-async function updateVehicleAPI(vehicleId, key, value) {
-  try {
-    console.log('Updating:', vehicleId, key, value);
-    
-    const response = await fetch('/api/update', {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-      },
-      body: JSON.stringify({
-        id: String(vehicleId),
-        key: key,
-        value: value
-      })
-    });
-
-    const result = await response.json();
-    console.log('API Response:', result);
-
-    if (result.success) {
-      const vehicle = vehicles.find(v => String(v.id) === String(vehicleId));
-      if (vehicle) {
-        vehicle[key] = value;
-      }
-
-      renderTable();
-      updateWatchList();
-
-      showToast('Watch status updated successfully', 'success');
-
-      return true;
-    } else {
-      console.error('API Error:', result.error);
-      showToast(result.error || 'Update failed', 'error');
-      return false;
-    }
+def paginate_vehicles(records: Tuple[Dict[str, Any], ...], cursor: Optional[str], limit: int) -> Dict[str, Any]:
+    """One page of records after (or before) the cursor, located by bisection."""
+    if cursor:
+        key, direction = decode_cursor(cursor)
+    else:
+        key, direction = None, "next"
 
-  } catch (error) {
-    console.error('Network Error:', error);
-    showToast('Network error. Please check your connection.', 'error');
-    return false;
-  }
-}
+    if direction == "next":
+        start = bisect_right(records, key, key=_sort_key) if key else 0
+        end = min(start + limit, len(records))
+    else:
+        end = bisect_left(records, key, key=_sort_key)
+        start = max(end - limit, 0)
 
-// Search functionality - Fixed for exact matching
-searchToggle.addEventListener('click', () => {
-  const isVisible = searchInput.classList.contains('show');
-  if (isVisible) {
-    searchInput.classList.remove('show');
-  } else {
-    searchInput.classList.add('show');
-    setTimeout(() => searchField.focus(), 200);
-  }
-});
-
-searchField.addEventListener('input', () => {
-  const query = searchField.value.trim();
-  if (query) {
-    searchClear.style.display = 'block';
-  } else {
-    searchClear.style.display = 'none';
-    filteredVehicles = [...vehicles];
-    renderTable();
-    noResults.style.display = 'none';
-  }
-});
-
-// Fixed search functionality for exact matching (case insensitive)
-searchField.addEventListener('keyup', () => {
-  const query = searchField.value.trim().toLowerCase();
-  if (!query) {
-    filteredVehicles = [...vehicles];
-    renderTable();
-    noResults.style.display = 'none';
-    return;
-  }
-
-  filteredVehicles = vehicles.filter(vehicle => {
-    const fields = [
-      vehicle.customer?.toLowerCase() || '',
-      vehicle.vehicle_no?.toLowerCase() || '',
-      vehicle.vehicle_name?.toLowerCase() || '',
-      vehicle.department?.toLowerCase() || '',
-      vehicle.service?.toLowerCase() || '',
-      vehicle.technician?.toLowerCase() || '',
-      vehicle.parts?.toLowerCase() || '',
-      vehicle.payment?.toLowerCase() || ''
-    ];
-    return fields.some(field => field === query);
-  });
-
-  renderTable();
-  
-  if (filteredVehicles.length === 0) {
-    searchTerm.textContent = searchField.value.trim();
-    noResults.style.display = 'block';
-  } else {
-    noResults.style.display = 'none';
-  }
-});
-
-searchClear.addEventListener('click', () => {
-  searchField.value = '';
-  searchClear.style.display = 'none';
-  filteredVehicles = [...vehicles];
-  renderTable();
-  noResults.style.display = 'none';
-});
-
-// Watch list functionality  
-watchToggle.addEventListener('click', () => {
-  const isVisible = watchDropdown.classList.contains('show');
-  if (isVisible) {
-    watchDropdown.classList.remove('show');
-    if (
-      !drawer.classList.contains('show') &&
-      !searchInput.classList.contains('show')
-    ) {
-      overlay.classList.remove('show');
-    }
-  } else {
-    watchDropdown.classList.add('show');
-    overlay.classList.add('show');
-  }
-});
-
-// Menu functionality
-menuToggle.addEventListener('click', () => {
-  drawer.classList.add('show');
-  overlay.classList.add('show');
-});
-
-// Overlay click
-overlay.addEventListener('click', () => {
-  if (watchDropdown.classList.contains('show')) watchDropdown.classList.remove('show');
-  if (drawer.classList.contains('show')) drawer.classList.remove('show');
-  if (searchInput.classList.contains('show')) searchInput.classList.remove('show');
-  overlay.classList.remove('show');
-});
-
-// Master click handler for watch interactions only (no parts picker)
-document.addEventListener('click', async (e) => {
-  // Close search if clicked outside
-  if (!searchInput.contains(e.target) && !searchToggle.contains(e.target) && searchInput.classList.contains('show')) {
-    searchInput.classList.remove('show');
-  }
- 
-  // Close watch dropdown if clicked outside
-  if (!watchDropdown.contains(e.target) && !watchToggle.contains(e.target) && watchDropdown.classList.contains('show')) {
-    watchDropdown.classList.remove('show');
-    if (
-      !drawer.classList.contains('show') &&
-      !searchInput.classList.contains('show')
-    ) {
-      overlay.classList.remove('show');
+    items = records[start:end]
+    return {
+        "items": items,
+        "next_cursor": encode_cursor(items[-1], "next") if items and end < len(records) else None,
+        "prev_cursor": encode_cursor(items[0], "prev") if items and start > 0 else None,
     }
-  }
-
-  // Watch button clicks in table
-  const watchBtn = e.target.closest('.watch-btn');
-  if (watchBtn) {
-    e.preventDefault();
-    e.stopPropagation();
-    
-    const vehicleId = watchBtn.dataset.id;
-    const vehicle = vehicles.find(v => String(v.id) === String(vehicleId));
-    const newWatchStatus = !vehicle?.watch;
-    
-    await updateVehicleAPI(vehicleId, 'watch', newWatchStatus);
-    return;
-  }
-
-  // Watch remove buttons in dropdown
-  const removeBtn = e.target.closest('.watch-remove');
-  if (removeBtn) {
-    e.preventDefault();
-    e.stopPropagation();
-    
-    const vehicleId = removeBtn.dataset.id;
-    await updateVehicleAPI(vehicleId, 'watch', false);
-    return;
-  }
-});
-
-// Enhanced render table function with mobile support (NO PARTS PICKER - READ ONLY)
-function renderTable() {
-  // Clear both desktop and mobile containers
-  tableBody.innerHTML = '';
-  mobileCards.innerHTML = '';
-  
-  filteredVehicles.forEach((vehicle, index) => {
-    // Desktop table row
-    const row = document.createElement('tr');
-    row.innerHTML = `
-      <td>${index + 1}</td>
-      <td>${vehicle.customer || ''}</td>
-      <td>${vehicle.vehicle_no || ''}</td>
-      <td>${vehicle.vehicle_name || ''}</td>
-      <td>${vehicle.department || ''}</td>
-      <td>${vehicle.service || ''}</td>
-      <td>${vehicle.technician || ''}</td>
-      <td>
-        <span class="badge ${vehicle.parts === 'Arrived' ? 'badge-success' : 'badge-danger'}">${vehicle.parts || 'Not Arrived'}</span>
-      </td>
-      <td>${statusBadge(vehicle.status)}</td>
-      <td>
-        <span class="badge ${getPaymentBadgeClass(vehicle.payment)}">${vehicle.payment || 'Unpaid'}</span>
-      </td>
-      <td>
-        <button class="watch-btn" data-id="${vehicle.id}">
-          ${vehicle.watch ? 
-            '<i class="ph ph-eye" style="color: #e63946;"></i>' :
-            '<i class="ph ph-eye-slash" style="color: #9ca3af;"></i>'
-          }
-        </button>
-      </td>
-    `;
-    tableBody.appendChild(row);
-
-    // Mobile card
-    const card = document.createElement('div');
-    card.className = 'vehicle-card';
-    card.innerHTML = `
-      <div class="card-header">
-        <h4 class="card-title">${vehicle.vehicle_no || 'N/A'} - ${vehicle.vehicle_name || 'N/A'}</h4>
-        <span class="card-number">#${index + 1}</span>
-      </div>
-      
-      <div class="card-row">
-        <span class="card-label">Customer:</span>
-        <span class="card-value">${vehicle.customer || 'N/A'}</span>
-      </div>
-      
-      <div class="card-row">
-        <span class="card-label">Department:</span>
-        <span class="card-value">${vehicle.department || 'N/A'}</span>
-      </div>
-      
-      <div class="card-row">
-        <span class="card-label">Service:</span>
-        <span class="card-value">${vehicle.service || 'N/A'}</span>
-      </div>
-      
-      <div class="card-row">
-        <span class="card-label">Technician:</span>
-        <span class="card-value">${vehicle.technician || 'N/A'}</span>
-      </div>
-      
-      <div class="card-row">
-        <span class="card-label">Parts Status:</span>
-        <span class="card-value">
-          <span class="badge ${vehicle.parts === 'Arrived' ? 'badge-success' : 'badge-danger'}">${vehicle.parts || 'Not Arrived'}</span>
-        </span>
-      </div>
-      
-      <div class="card-row">
-        <span class="card-label">Status:</span>
-        <span class="card-value">${statusBadge(vehicle.status)}</span>
-      </div>
-      
-      <div class="card-row">
-        <span class="card-label">Payment:</span>
-        <span class="card-value">
-          <span class="badge ${getPaymentBadgeClass(vehicle.payment)}">${vehicle.payment || 'Unpaid'}</span>
-        </span>
-      </div>
-      
-      <div class="card-actions">
-        <span>Watch Vehicle:</span>
-        <button class="watch-btn" data-id="${vehicle.id}">
-          ${vehicle.watch ? 
-            '<i class="ph ph-eye" style="color: #e63946;"></i>' :
-            '<i class="ph ph-eye-slash" style="color: #9ca3af;"></i>'
-          }
-        </button>
-      </div>
-    `;
-    mobileCards.appendChild(card);
-  });
-}
-
-// Update watch list
-function updateWatchList() {
-  const watchedVehicles = vehicles.filter(v => v.watch);
-  
-  if (watchedVehicles.length > 0) {
-    watchBadge.textContent = watchedVehicles.length;
-    watchBadge.style.display = 'flex';
-  } else {
-    watchBadge.style.display = 'none';
-  }
-  
-  if (watchedVehicles.length === 0) {
-    watchContent.innerHTML = '<div style="padding: 24px; text-align: center; color: rgba(255,255,255,0.75);">No vehicles in watch list</div>';
-  } else {
-    watchContent.innerHTML = watchedVehicles.map(vehicle => `
-      <div class="watch-item">
-        <div class="watch-item-info">
-          <div class="watch-item-title">${vehicle.vehicle_no} - ${vehicle.vehicle_name}</div>
-          <div class="watch-item-service">${vehicle.service}</div>
-          <div class="watch-item-tech">${vehicle.technician}</div>
-        </div>
-        <button class="watch-remove" data-id="${vehicle.id}">
-          <i class="ph ph-eye-slash" style="color: #e63946;"></i>
-        </button>
-      </div>
-    `).join('');
-  }
-}
-
-// Get payment badge class
-function getPaymentBadgeClass(payment) {
-  switch (payment) {
-    case 'Paid': return 'badge-paid';
-    case 'Advance Paid': return 'badge-advance';
-    case 'Unpaid': return 'badge-unpaid';
-    default: return 'badge-unpaid';
-  }
-}
-
-// Show toast
-function showToast(message, type) {
-  toastMessage.textContent = message;
-  toast.className = `toast toast-${type}`;
-  toast.classList.add('show');
-  
-  setTimeout(() => {
-    toast.classList.remove('show');
-  }, type === 'error' ? 5000 : 3000);
-}
-
-// Logout
-function logout() {
-  window.location.href = '/logout';
-}
 
-// Auto-refresh with responsive handling
-setInterval(async () => {
-  try {
-    const response = await fetch('/api/vehicles');
-    if (response.ok) {
-      const freshData = await response.json();
-      vehicles = freshData;
-      const currentQuery = searchField.value.trim().toLowerCase();
-      if (currentQuery) {
-        filteredVehicles = vehicles.filter(vehicle => {
-          const fields = [
-            vehicle.customer?.toLowerCase() || '',
-            vehicle.vehicle_no?.toLowerCase() || '',
-            vehicle.vehicle_name?.toLowerCase() || '',
-            vehicle.department?.toLowerCase() || '',
-            vehicle.service?.toLowerCase() || '',
-            vehicle.technician?.toLowerCase() || '',
-            vehicle.parts?.toLowerCase() || '',
-            vehicle.payment?.toLowerCase() || ''
-          ];
-          return fields.some(field => field === currentQuery);
-        });
-      } else {
-        filteredVehicles = [...freshData];
-      }
-      renderTable();
-      updateWatchList();
-    }
-  } catch (error) {
-    console.log('Auto-refresh failed:', error);
-  }
-}, 5000);
-
-// Handle window resize for responsive adjustments
-window.addEventListener('resize', () => {
-  // Re-render table if switching between desktop/mobile view
-  renderTable();
-});
-
-</script>
-</body>
-</html>""",
-        vehicles=vehicles,
-    )
 ###############################################################################
-# Display (big screen)
+# Metrics
 ###############################################################################
-from flask import render_template_string, redirect, session
-
-@app.route("/display")
-def display():
-    if session.get("user") != "display":
-        return redirect("/")
-
-    return render_template_string(
-        r"""<!doctype html>
-<html>
-<head>
-  <meta name="viewport" content="width=device-width, initial-scale=1">
-  <title>Vehicle Status</title>
-  <link rel="stylesheet" href="https://unpkg.com/@phosphor-icons/web@2.0.3/src/regular/style.css">
-  <link href="https://fonts.googleapis.com/css2?family=Michroma&display=swap" rel="stylesheet">
-  <style>
-    .logo-container {
-      text-align: center;
-      transition: opacity 0.8s ease; /* Added smooth transition */
-    }
-    .logo-container img {
-      background: none; /* ensures no background */
-      width: 300px; /* adjust as needed */
-      height: auto;
-      transition: opacity 0.8s ease; /* Added smooth transition for image */
-    }
-    
-    /* Fixed: Proper targeting for logo fade */
-    .logo-container.video-playing {
-      opacity: 0 !important;
-    }
-    
-    /* Double safety: Also target the image directly */
-    .logo-container.video-playing img {
-      opacity: 0 !important;
-    }
-    
-    .page-text {
-      text-align: center;
-      font-family: 'Michroma', sans-serif;
-      font-size: 50px; /* adjust size */
-      margin: 5px 0; /* spacing above and below */
-      font-weight: 1000; /* optional styling */
-      word-spacing: 20px;
-      transition: opacity 0.8s ease; /* Added smooth transition */
-    }
-   h1 {
-      text-align: center;
-      margin-top: 5px;
-    }
-    .page-text.video-playing {
-      opacity: 0 !important; /* Added !important for priority */
-    }
-    /* Hide scrollbars */
-    ::-webkit-scrollbar { display: none; }
-    * { scrollbar-width: none; -ms-overflow-style: none; }
-    .scrollable::-webkit-scrollbar { display: none; }
-
-    body {
-      margin: 0;
-      font-family: Inter, "Segoe UI", system-ui, -apple-system, sans-serif;
-      background: #0f1418; /* solid background (no gradient) */
-      color: #fff;
-      min-height: 100vh;
-      overflow: hidden; /* TV optimization - no scrolling */
-    }
-
-    /* TV Optimizations - 43" 1080p Full HD */
-    * {
-      -webkit-font-smoothing: antialiased;
-      -moz-osx-font-smoothing: grayscale;
-      text-rendering: optimizeLegibility;
-    }
-
-    /* Top Controls - Only Menu, Hide during video */
-    .top-controls {
-      position: fixed;
-      top: 24px;
-      right: 24px;
-      z-index: 50;
-      display: flex;
-      gap: 12px;
-      transition: opacity 0.15s ease;
-    }
-    .top-controls.fade {
-      opacity: 0;
-      transform: translateY(-10px);
-      pointer-events: none;
-    }
-    .top-controls.video-playing {
-      opacity: 0;
-      pointer-events: none;
-      z-index: 40;
-    }
-    .control-btn {
-      width: 56px;
-      height: 56px;
-      border-radius: 16px;
-      display: flex;
-      align-items: center;
-      justify-content: center;
-      background: rgba(255,255,255,.06);
-      border: 1px solid rgba(255,255,255,.08);
-      backdrop-filter: blur(8px);
-      cursor: pointer;
-      transition: transform 0.3s ease;
-      position: relative;
-    }
-    .control-btn:hover { transform: translateY(-2px); }
-    
-    /* Fixed: More specific targeting for menu icon color */
-    .control-btn i, 
-    .control-btn i.ph, 
-    .control-btn .ph,
-    #menuToggle i,
-    #menuToggle .ph {
-      font-size: 24px !important; 
-      color: #fff !important;
-    }
-
-    /* Overlay */
-    .overlay {
-      position: fixed;
-      inset: 0;
-      background: rgba(0,0,0,0);
-      backdrop-filter: blur(0px);
-      z-index: 40;
-      opacity: 0;
-      pointer-events: none;
-      transition: all 0.3s ease;
-    }
-    .overlay.show {
-      backdrop-filter: blur(4px);
-      opacity: 1;
-      pointer-events: auto;
-    }
-
-    /* Drawer */
-    .drawer {
-      position: fixed;
-      top: 0;
-      right: -400px;
-      width: 400px;
-      height: 100vh;
-      background: #0e1116;
-      border-left: 1px solid #1b1f27;
-      box-shadow: -16px 0 48px rgba(0,0,0,0.5);
-      z-index: 50;
-      transition: right 0.3s cubic-bezier(0.22, 1, 0.36, 1);
-    }
-    .drawer.show { right: 0; }
-    .drawer-header { padding: 30px; border-bottom: 1px solid #1b1f27; }
-    .drawer-header h3 { font-size: 24px; font-weight: 600; color: #fff; margin: 0; }
-    .logout-btn {
-      margin: 30px;
-      padding: 18px 24px;
-      border-radius: 16px;
-      border: none;
-      background: linear-gradient(90deg, #e63946, #d2353f);
-      color: #fff;
-      font-weight: 900;
-      cursor: pointer;
-      width: calc(100% - 60px);
-      transition: transform 0.3s ease;
-      font-size: 18px;
-    }
-    .logout-btn:hover { transform: translateY(-2px); }
-
-    /* Main Content - 1920x1080 Optimized */
-    .main-content {
-      padding: 40px 50px;
-      padding-top: 10px;
-      max-width: 100%;
-      margin: 0 auto;
-      height: calc(100vh - 140px);
-      display: flex;
-      flex-direction: column;
-    }
-
-    /* Page Title - 1080p Optimized */
-    .page-title {
-      font-size: 52px; /* Optimized for 1920x1080 */
-      font-weight: 700;
-      color: #fff;
-      margin-bottom: 5px;
-      margin-top: 5px;
-      text-align: center;
-      text-shadow: 3px 3px 6px rgba(0,0,0,0.6);
-      transition: opacity 0.8s ease;
-      letter-spacing: 1px;
-    }
-    .page-title.video-playing {
-      opacity: 0;
-    }
-
-    /* Content Wrapper for sliding pages */
-    .content-wrapper {
-      flex: 1;
-      position: relative;
-      overflow: hidden;
-    }
-
-    /* iOS Home screen style animation for table containers */
-    .table-container {
-      background: rgba(255,255,255,.06);
-      border: 1px solid rgba(255,255,255,.08);
-      border-radius: 20px;
-      backdrop-filter: blur(8px);
-      box-shadow: 0 30px 60px rgba(0,0,0,0.3);
-      overflow: hidden;
-      height: 100%;
-      position: absolute;
-      width: 100%;
-      transform-origin: center;
-      will-change: transform;
-      transition: transform 0.8s cubic-bezier(0.4, 0, 0.2, 1);
-    }
-
-    /* iOS-style slide states - smooth simultaneous movement */
-    .table-container.slide-out-left {
-      transform: translateX(-100%);
-    }
-
-    .table-container.slide-in-from-right {
-      transform: translateX(100%);
-    }
-
-    .table-container.slide-active {
-      transform: translateX(0);
-    }
-
-    .table-wrapper { 
-      overflow: hidden; 
-      height: 100%;
-      display: flex;
-      flex-direction: column;
-      padding: 16px;
-    }
+# In-process counters and histograms, rendered in the Prometheus text format
+# at /metrics. Recording is a dict lookup and a few additions under one lock;
+# all formatting (cumulative buckets, quantile estimates) happens at scrape.
+#
+# With METRICS_DIR set, every process also writes its series to
+# METRICS_DIR/<pid>.json from a background thread, every
+# METRICS_SHARE_SECONDS while they change, and a scrape adds up all the files, so whichever worker answers
+# reports the whole server. Files of exited workers stay, which keeps the
+# counters monotonic. Gauges describe the process that answered. A forked
+# worker starts from empty series rather than a copy of the master's.
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimate by linear interpolation inside the bucket holding rank q."""
+        if not self.count:
+            return 0.0
+        rank, seen, lower = q * self.count, 0, 0.0
+        for upper, n in zip(self.buckets, self.counts):
+            if n and seen + n >= rank:
+                return lower + (upper - lower) * (rank - seen) / n
+            seen, lower = seen + n, upper
+        return self.buckets[-1]
+
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Metrics:
+    HELP = {
+        "asg_http_requests_total": ("counter", "HTTP requests by route, method and status"),
+        "asg_http_request_duration_seconds": ("histogram", "HTTP request latency by route"),
+        "asg_http_request_duration_quantile_seconds": ("gauge", "Estimated latency quantiles by route"),
+        "asg_http_response_size_bytes": ("histogram", "HTTP response body size by route"),
+        "asg_phase_duration_seconds": ("histogram", "Time spent in named phases (store load, persist, ...)"),
+        "asg_store_events_total": ("counter", "Store writer ops, batches, flushes and flush errors"),
+    }
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self._changed = False
+        self._sharer_pid: Optional[int] = None
+
+    def inc(self, name: str, labels: Labels, amount: float = 1) -> None:
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[labels] = series.get(labels, 0) + amount
+            self._changed = True
+
+    def observe(self, name: str, labels: Labels, value: float, buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            hist = series.get(labels)
+            if hist is None:
+                hist = series[labels] = Histogram(buckets)
+            hist.observe(value)
+            self._changed = True
+
+    def _dump(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "counters": {name: [[labels, value] for labels, value in series.items()]
+                             for name, series in self._counters.items()},
+                "histograms": {name: [[labels, hist.buckets, hist.counts, hist.sum, hist.count]
+                                      for labels, hist in series.items()]
+                               for name, series in self._histograms.items()},
+            }
 
-    table { 
-      width: 100%; 
-      border-collapse: collapse; 
-      font-size: 30px; /* 1920x1080 readability */
-    }
+    def share(self) -> None:
+        """Start sharing this process's series through METRICS_DIR (once per process)."""
+        if not METRICS_DIR or self._sharer_pid == os.getpid():
+            return
+        with self._lock:
+            if self._sharer_pid != os.getpid():
+                threading.Thread(target=self._run_sharer, name="metrics-share", daemon=True).start()
+                self._sharer_pid = os.getpid()
+
+    def _run_sharer(self) -> None:
+        path = os.path.join(METRICS_DIR, f"{os.getpid()}.json")
+        while True:
+            time.sleep(METRICS_SHARE_SECONDS)
+            if self._changed:
+                self._changed = False
+                save_json(path, self._dump())
+
+    def _collect(self) -> Tuple[Dict[str, Dict[Labels, float]], Dict[str, Dict[Labels, Histogram]]]:
+        """Series of this process plus, with METRICS_DIR, those the other processes shared."""
+        dumps = [self._dump()]
+        if METRICS_DIR:
+            own = f"{os.getpid()}.json"
+            for entry in os.scandir(METRICS_DIR):
+                if entry.name.endswith(".json") and entry.name != own:
+                    data = load_json(entry.path)
+                    if isinstance(data, dict):
+                        dumps.append(data)
+        counters: Dict[str, Dict[Labels, float]] = {}
+        histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        for data in dumps:
+            for name, series in data.get("counters", {}).items():
+                merged = counters.setdefault(name, {})
+                for labels, value in series:
+                    labels = tuple(map(tuple, labels))
+                    merged[labels] = merged.get(labels, 0) + value
+            for name, series in data.get("histograms", {}).items():
+                merged_h = histograms.setdefault(name, {})
+                for labels, buckets, counts, total, count in series:
+                    labels = tuple(map(tuple, labels))
+                    hist = merged_h.get(labels)
+                    if hist is None:
+                        hist = merged_h[labels] = Histogram(tuple(buckets))
+                    hist.counts = [a + b for a, b in zip(hist.counts, counts)]
+                    hist.sum += total
+                    hist.count += count
+        return counters, histograms
+
+    def render(self, gauges: Dict[str, Tuple[str, Dict[Labels, float]]]) -> str:
+        """Prometheus text exposition; gauges maps name -> (help, {labels: value})."""
+        lines: List[str] = []
+
+        def header(name: str, kind: str, text: str) -> None:
+            lines.append(f"# HELP {name} {text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        counters, histograms = self._collect()
+        for name, series in sorted(counters.items()):
+            header(name, *self.HELP[name])
+            for labels, value in sorted(series.items()):
+                lines.append(f"{name}{_fmt_labels(labels)} {value:g}")
+        for name, series in sorted(histograms.items()):
+            header(name, *self.HELP[name])
+            for labels, hist in sorted(series.items()):
+                cumulative = 0
+                for upper, n in zip(hist.buckets + (float("inf"),), hist.counts):
+                    cumulative += n
+                    le = "+Inf" if upper == float("inf") else f"{upper:g}"
+                    lines.append(f"{name}_bucket{_fmt_labels(labels + (('le', le),))} {cumulative}")
+                lines.append(f"{name}_sum{_fmt_labels(labels)} {hist.sum:.6f}")
+                lines.append(f"{name}_count{_fmt_labels(labels)} {hist.count}")
+        durations = histograms.get("asg_http_request_duration_seconds", {})
+        if durations:
+            name = "asg_http_request_duration_quantile_seconds"
+            header(name, *self.HELP[name])
+            for labels, hist in sorted(durations.items()):
+                for q in QUANTILES:
+                    lines.append(f"{name}{_fmt_labels(labels + (('quantile', f'{q:g}'),))} {hist.quantile(q):.6f}")
+        for name, (text, series) in sorted(gauges.items()):
+            header(name, "gauge", text)
+            for labels, value in sorted(series.items()):
+                lines.append(f"{name}{_fmt_labels(labels)} {value:g}")
+        return "\n".join(lines) + "\n"
+
+
+def _fmt_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in labels)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(labels, escaped)) + "}"
+
+
+metrics = Metrics()
+os.register_at_fork(after_in_child=metrics.reset)
+
+
+def record_phase(phase: str, seconds: float) -> None:
+    """Add a phase duration to the metrics and, inside a request, to its Server-Timing."""
+    metrics.observe("asg_phase_duration_seconds", (("phase", phase),), seconds)
+    if has_request_context():
+        phases = g.setdefault("phases", {})
+        phases[phase] = phases.get(phase, 0.0) + seconds
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """Record the duration of the block as a phase (see record_phase)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_phase(phase, time.perf_counter() - start)
+
+
+# ---------- Phase hooks ----------
+# Phases a request goes through: session (cookie decode), store_read,
+# serialize, template_compile, render and persist (waiting on the store
+# writer). backfill and store_load are timed where they run, which is the
+# writer thread, so they only show up in /metrics.
+
+class _StampRequestStart:
+    """WSGI wrapper noting the start time before Flask opens the session."""
+
+    def __init__(self, wsgi_app: Callable) -> None:
+        self.wsgi_app = wsgi_app
+
+    def __call__(self, environ: Dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        environ["asg.request_start"] = time.perf_counter()
+        return self.wsgi_app(environ, start_response)
+
+
+class TimedSessionInterface(SecureCookieSessionInterface):
+    def open_session(self, app: Flask, request: Any) -> Any:
+        with timed("session"):
+            return super().open_session(app, request)
+
+
+class TimedEnvironment(Environment):
+    """Jinja environment timing template compilation.
+
+    Page templates are compiled on first use and then served from Jinja's
+    cache, so this shows up once per template per process (or not at all
+    in workers forked from a preloaded master, see warm_caches).
+    """
+
+    def compile(self, source: Any, name: Optional[str] = None, filename: Optional[str] = None,
+                raw: bool = False, defer_init: bool = False) -> Any:
+        with timed("template_compile"):
+            return super().compile(source, name, filename, raw, defer_init)
+
+
+app.wsgi_app = _StampRequestStart(app.wsgi_app)
+app.session_interface = TimedSessionInterface()
+app.jinja_environment = TimedEnvironment
+
+
+@before_render_template.connect_via(app)
+def _render_started(sender: Flask, **extra: Any) -> None:
+    g.render_start = time.perf_counter()
+
+
+@template_rendered.connect_via(app)
+def _render_finished(sender: Flask, **extra: Any) -> None:
+    record_phase("render", time.perf_counter() - g.pop("render_start", time.perf_counter()))
+
+
+@app.after_request
+def _record_request_metrics(response: Response) -> Response:
+    start = request.environ.get("asg.request_start")
+    if start is None:
+        return response
+    elapsed = time.perf_counter() - start
+    route = request.url_rule.rule if request.url_rule else "unmatched"
+    labels = (("route", route),)
+    metrics.inc("asg_http_requests_total",
+                labels + (("method", request.method), ("status", str(response.status_code))))
+    metrics.observe("asg_http_request_duration_seconds", labels, elapsed)
 
-    tbody {
-      vertical-align: top;
-    }
+    timing = [f"{name};dur={sec * 1000:.2f}" for name, sec in g.get("phases", {}).items()]
+    timing.append(f"total;dur={elapsed * 1000:.2f}")
+    response.headers["Server-Timing"] = ", ".join(timing)
 
-    th {
-      text-align: left;
-      padding: 24px 20px;
-      color: #fff;
-      font-weight: 700;
-      border-bottom: 2px solid rgba(255,255,255,0.15);
-      font-size: 42px; /* 1920x1080 headers */
-      text-shadow: 2px 2px 4px rgba(0,0,0,0.6);
-      letter-spacing: 0.5px;
-    }
+    def observe_size(size: int) -> None:
+        metrics.observe("asg_http_response_size_bytes", labels, size, SIZE_BUCKETS)
 
-    tr { transition: all 0.2s ease-out; }
-    tr:not(:last-child) { border-bottom: 1px solid rgba(255,255,255,0.08); }
-    tbody tr:hover {
-      transform: scale(1.005);
-      box-shadow: 0 6px 16px rgba(0,0,0,0.2);
-    }
+    if response.is_streamed:
+        response.response = _counting_body(response.response, observe_size)
+    else:
+        observe_size(response.content_length or 0)
+    metrics.share()  # no-op once this process shares
+    return response
 
-    td { 
-      padding: 22px 20px; 
-      color: rgba(255,255,255,0.95); 
-      font-size: 40px; /* 1920x1080 readability */
-      line-height: 1.4;
-      font-weight: 500;
-    }
 
-    /* Badges - 1920x1080 Optimized */
-    .badge {
-      display: inline-block;
-      white-space: nowrap;
-      font-size: 26px !important; /* 1920x1080 optimal */
-      font-weight: 800 !important;
-      padding: 10px 20px !important;
-      border-radius: 20px !important;
-      letter-spacing: 0.6px;
-      box-shadow: 0 3px 12px rgba(0,0,0,0.5);
-      text-transform: uppercase;
-    }
+def _counting_body(body: Iterable[bytes], done: Callable[[int], None]) -> Iterator[bytes]:
+    total = 0
+    try:
+        for chunk in body:
+            total += len(chunk)
+            yield chunk
+    finally:
+        done(total)
 
-    .badge-danger  { background-color: #ff1744 !important; color: #fff !important; box-shadow: 0 0 20px rgba(255,23,68,.9); }
-    .badge-warning { background-color: #ffeb3b !important; color: #000 !important; box-shadow: 0 0 20px rgba(250,255,0,.9); }
-    .badge-success { background-color: #39ff14 !important; color: #000 !important; box-shadow: 0 0 20px rgba(57,255,20,.9); }
-
-    /* Video Container */
-    .video-container {
-      position: fixed;
-      top: 0;
-      left: 0;
-      right: 0;
-      bottom: 0;
-      display: flex;
-      align-items: center;
-      justify-content: center;
-      background: rgba(0,0,0,0.95);
-      transform: translateX(100%);
-      opacity: 0;
-      transition: transform 0.8s ease, opacity 0.8s ease;
-      z-index: 60;
-    }
+###############################################################################
+# Slow request log
+###############################################################################
+# Requests slower than the threshold are kept in a ring buffer (route,
+# parameters, phase timings, sizes) and counted into per-route and per-cause
+# totals; the cause is the phase that took longest, or "other" when most of
+# the time is outside any timed phase.
+
+class SlowRequestLog:
+    def __init__(self, threshold_ms: float, size: int) -> None:
+        self.threshold_ms = threshold_ms
+        self._recent: "deque[Dict[str, Any]]" = deque(maxlen=size)
+        self._by_route: Dict[str, Dict[str, float]] = {}
+        self._by_cause: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._recent.append(entry)
+            for table, key in ((self._by_route, entry["route"]), (self._by_cause, entry["cause"])):
+                row = table.setdefault(key, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+                row["count"] += 1
+                row["total_ms"] += entry["duration_ms"]
+                row["max_ms"] = max(row["max_ms"], entry["duration_ms"])
+
+    def reset(self) -> None:
+        with self._lock:
+            self._recent.clear()
+            self._by_route.clear()
+            self._by_cause.clear()
+
+    def report(self, top: int) -> Dict[str, Any]:
+        def ranked(table: Dict[str, Dict[str, float]], label: str) -> List[Dict[str, Any]]:
+            rows = sorted(table.items(), key=lambda kv: kv[1]["total_ms"], reverse=True)[:top]
+            return [{label: key, "count": row["count"], "total_ms": round(row["total_ms"], 2),
+                     "max_ms": row["max_ms"], "avg_ms": round(row["total_ms"] / row["count"], 2)}
+                    for key, row in rows]
+
+        with self._lock:
+            return {
+                "threshold_ms": self.threshold_ms,
+                "by_route": ranked(self._by_route, "route"),
+                "by_cause": ranked(self._by_cause, "cause"),
+                "recent": list(reversed(self._recent))[:top],
+            }
 
-    .video-container.slide-in {
-      transform: translateX(0);
-      opacity: 1;
-    }
 
-    .video-container video {
-      width: 100vw;
-      height: 100vh;
-      object-fit: cover;
-    }
+slow_log = SlowRequestLog(SLOW_REQUEST_MS, SLOW_LOG_SIZE)
+
+
+def _request_params() -> Dict[str, Any]:
+    """Query args plus short scalar JSON fields, enough to replay the request."""
+    params: Dict[str, Any] = dict(request.args)
+    if request.is_json:
+        body = request.get_json(silent=True)
+        if isinstance(body, dict):
+            params.update({k: v for k, v in body.items()
+                           if isinstance(v, (bool, int, float)) or (isinstance(v, str) and len(v) <= 64)})
+    return params
+
+
+@app.after_request
+def _record_slow_request(response: Response) -> Response:
+    start = request.environ.get("asg.request_start")
+    if start is None:
+        return response
+    duration_ms = (time.perf_counter() - start) * 1000
+    if duration_ms < slow_log.threshold_ms:
+        return response
+    phases = {name: sec * 1000 for name, sec in g.get("phases", {}).items()}
+    other = duration_ms - sum(phases.values())
+    cause = max(phases, key=phases.get) if phases else "other"
+    if other > phases.get(cause, 0.0):
+        cause = "other"
+    slow_log.record({
+        "at": time.time(),
+        "route": request.url_rule.rule if request.url_rule else "unmatched",
+        "method": request.method,
+        "path": request.path,
+        "params": _request_params(),
+        "status": response.status_code,
+        "duration_ms": round(duration_ms, 2),
+        "phases_ms": {name: round(ms, 2) for name, ms in phases.items()},
+        "cause": cause,
+        "request_bytes": request.content_length or 0,
+        "response_bytes": response.content_length,  # None when streamed
+    })
+    return response
 
-    /* Page Indicator - 1920x1080 optimized */
-    .page-indicator {
-      position: fixed;
-      bottom: 40px;
-      left: 50%;
-      transform: translateX(-50%);
-      background: rgba(255,255,255,.12);
-      border: 2px solid rgba(255,255,255,.2);
-      border-radius: 24px;
-      padding: 12px 24px;
-      backdrop-filter: blur(12px);
-      color: #fff;
-      font-size: 18px; /* 1080p optimized */
-      font-weight: 700;
-      text-shadow: 2px 2px 4px rgba(0,0,0,0.6);
-      transition: opacity 0.8s ease;
-      letter-spacing: 0.5px;
-    }
-    .page-indicator.video-playing {
-      opacity: 0;
-    }
-   
-    .no-results { 
-      text-align: center; 
-      color: rgba(255,255,255,0.8); 
-      margin-top: 30px; 
-      font-size: 24px; /* 1080p readability */
-      font-weight: 600;
-    }
+###############################################################################
+# Profiler
+###############################################################################
+# A sampling profiler for live traffic. While at least one request is being
+# profiled, a background thread wakes every PROFILE_INTERVAL_MS, grabs the
+# stacks of the profiled request threads and counts them as collapsed stacks
+# ("route;frame;frame count"), the input format of flamegraph.pl/speedscope.
+# Requests that are not profiled pay one random() call.
+#
+# Under gevent the requests are greenlets sharing one OS thread:
+# sys._current_frames() only sees whichever of them is running, and a patched
+# sampler thread would itself be a greenlet that never runs while a request
+# holds the CPU. So there the sampler is a native thread (with a native lock
+# and sleep) that reads each waiting greenlet's frame from gr_frame.
+
+class SamplingProfiler:
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.sample_rate = PROFILE_SAMPLE_RATE
+        self.requests = 0
+        # thread ident (or greenlet) -> (route, ident of the OS thread running it)
+        self._active: Dict[Any, Tuple[str, int]] = {}
+        self._stacks: Dict[str, int] = {}
+        self._dropped = 0
+        self._greenlets = SERVER_MODE == "gevent"
+        if self._greenlets:
+            from gevent import monkey
+            self._lock = monkey.get_original("_thread", "allocate_lock")()
+            self._sleep = monkey.get_original("time", "sleep")
+            self._start_thread = monkey.get_original("_thread", "start_new_thread")
+            self._os_ident = monkey.get_original("_thread", "get_ident")
+        else:
+            self._lock = threading.Lock()
+            self._sleep = time.sleep
+            self._start_thread = lambda fn, args: threading.Thread(target=fn, name="profiler", daemon=True).start()
+            self._os_ident = threading.get_ident
+        self._wake = threading.Event()  # threads only: native code cannot wait on a gevent Event
+        self._sampler_pid: Optional[int] = None
+
+    def _current(self) -> Any:
+        return gevent.getcurrent() if self._greenlets else threading.get_ident()
+
+    def start(self, route: str) -> None:
+        """Start sampling the calling thread (or greenlet)."""
+        self._ensure_sampler()
+        with self._lock:
+            self._active[self._current()] = (route, self._os_ident())
+            self.requests += 1
+        if not self._greenlets:
+            self._wake.set()
+
+    def stop(self) -> None:
+        with self._lock:
+            self._active.pop(self._current(), None)
+            if not self._active and not self._greenlets:
+                self._wake.clear()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stacks.clear()
+            self._dropped = 0
+            self.requests = 0
+
+    def collapsed(self) -> str:
+        """Aggregated stacks, one "frame;frame;... count" line each."""
+        with self._lock:
+            return "".join(f"{stack} {n}\n" for stack, n in sorted(self._stacks.items()))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "sample_rate": self.sample_rate,
+                "interval_ms": self.interval * 1000,
+                "profiled_requests": self.requests,
+                "samples": sum(self._stacks.values()),
+                "distinct_stacks": len(self._stacks),
+                "dropped_samples": self._dropped,
+            }
 
-    /* Removed the generic .ph rule that was causing conflicts */
- </style>
-</head>
-<body>
-  <div class="logo-container">
-    <img src="/static/logo1.png" alt="Logo">
-  </div>
-    <div class="page-text">
-    AL SULAIMAN GARAGE
-  </div>
-<!-- Top Controls (Menu only - search removed) -->
-<div class="top-controls">
-  <!-- Menu -->
-  <button id="menuToggle" class="control-btn" aria-label="Menu">
-    <i class="ph ph-list"></i>
-  </button>
-</div>
-
-<!-- Overlay -->
-<div id="overlay" class="overlay"></div>
-
-<!-- Drawer -->
-<div id="drawer" class="drawer">
-  <div class="drawer-header">
-    <h3>MENU</h3>
-  </div>
-  <button class="logout-btn" onclick="logout()">Logout</button>
-</div>
-
-<!-- Main Content -->
-<div class="main-content">
-  <h1 class="page-title">Vehicle Status</h1>
-
-  <div class="content-wrapper">
-    <div id="tableContainer" class="table-container">
-      <div class="table-wrapper">
-        <table>
-          <thead>
-            <tr>
-              <th>Vehicle No</th>
-              <th>Vehicle Name</th>
-              <th>Department</th>
-              <th>Technician</th>
-              <th>Status</th>
-            </tr>
-          </thead>
-          <tbody id="tableBody"></tbody>
-        </table>
-      </div>
-    </div>
-
-    <div id="videoContainer" class="video-container">
-      <video id="displayVideo" autoplay muted loop>
-        <source id="videoSource" src="/static/video.mp4" type="video/mp4">
-        Your browser does not support the video tag.
-      </video>
-    </div>
-  </div>
-
-  <div id="pageIndicator" class="page-indicator" style="display: none;">
-    Page 1 of 1
-  </div>
-
-  <div id="noResults" class="no-results" style="display: none;">
-    No vehicles found
-  </div>
-</div>
-
-<script>
-// Live data exactly like your baseline: pull from /api/vehicles and refresh
-let vehicles = [];
-let filteredVehicles = [];
-let currentPage = 0;
-let totalPages = 0;
-let isShowingVideo = false;
-let pageTimer = null;
-let videoTimer = null;
-let currentVideoIndex = 0;
-
-const ROWS_PER_PAGE = 5; // Changed from 9 to 7
-const PAGE_DURATION = 6000; // 6 seconds
-const VIDEO_DURATION = 30000; // 30 seconds
-const VIDEO_FILES = [
-  '/static/video.mp4',
-  '/static/video1.mp4', 
-  '/static/video2.mp4',
-  '/static/video3.mp4',
-  '/static/video4.mp4'
-];
-
-// DOM references
-const menuToggle   = document.getElementById('menuToggle');
-const overlay      = document.getElementById('overlay');
-const drawer       = document.getElementById('drawer');
-let tableBody      = document.getElementById('tableBody');
-const noResults    = document.getElementById('noResults');
-let tableContainer = document.getElementById('tableContainer');
-const videoContainer = document.getElementById('videoContainer');
-const pageIndicator = document.getElementById('pageIndicator');
-const displayVideo = document.getElementById('displayVideo');
-const videoSource = document.getElementById('videoSource');
-const topControls = document.querySelector('.top-controls');
-const pageTitle = document.querySelector('.page-title');
-const logoContainer = document.querySelector('.logo-container');
-const pageText = document.querySelector('.page-text');
-
-
-// Fetch vehicles (baseline style)
-async function fetchVehicles(){
-  const res = await fetch('/api/vehicles');
-  if (!res.ok) return [];
-  return await res.json();
-}
+    def _ensure_sampler(self) -> None:
+        if self._sampler_pid == os.getpid():
+            return
+        with self._lock:
+            if self._sampler_pid != os.getpid():
+                self._start_thread(self._run, ())
+                self._sampler_pid = os.getpid()
+
+    def _run(self) -> None:
+        while True:
+            if not self._greenlets:
+                self._wake.wait()
+            self._sleep(self.interval)
+            with self._lock:
+                active = dict(self._active)
+            if not active:
+                if self._greenlets:
+                    self._sleep(0.05)  # nothing to park on, so poll slowly while idle
+                continue
+            frames = sys._current_frames()
+            samples = []
+            for key, (route, ident) in active.items():
+                # a waiting greenlet keeps its frame; the running one (and
+                # every thread) is the top of its OS thread's stack
+                frame = getattr(key, "gr_frame", None) or frames.get(ident)
+                if frame is not None:
+                    samples.append(f"{route};{_collapse(frame)}")
+            with self._lock:
+                for stack in samples:
+                    if stack in self._stacks or len(self._stacks) < PROFILE_MAX_STACKS:
+                        self._stacks[stack] = self._stacks.get(stack, 0) + 1
+                    else:
+                        self._dropped += 1
+
+
+def _collapse(frame: Any) -> str:
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        # parent dir + file name, so flask/app.py and our app.py stay apart
+        path = "/".join(code.co_filename.replace(os.sep, "/").split("/")[-2:])
+        names.append(f"{path}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+profiler = SamplingProfiler(PROFILE_INTERVAL_MS / 1000)
+
+
+@app.before_request
+def _maybe_profile() -> None:
+    wanted = request.headers.get("X-Profile") == "1" and session.get("user") == "admin"
+    if wanted or (profiler.sample_rate and random.random() < profiler.sample_rate):
+        profiler.start(request.url_rule.rule if request.url_rule else "unmatched")
+        g.profiling = True
+
+
+@app.teardown_request
+def _stop_profile(exc: Optional[BaseException]) -> None:
+    if g.pop("profiling", False):
+        profiler.stop()
 
-// Render current page with iOS home screen style sliding animation
-function renderCurrentPage(slideDirection = null) {
-  const visibleVehicles = filteredVehicles.filter(v => v.visible);
-  const startIndex = currentPage * ROWS_PER_PAGE;
-  const endIndex = Math.min(startIndex + ROWS_PER_PAGE, visibleVehicles.length);
-  const pageVehicles = visibleVehicles.slice(startIndex, endIndex);
-
-  // Handle iOS-style sliding animation with two containers
-  if (slideDirection === 'right') {
-    // Create a duplicate container for the new content
-    const newContainer = tableContainer.cloneNode(true);
-    newContainer.id = 'tableContainerNew';
-    
-    // Position new container off-screen to the right
-    newContainer.classList.add('slide-in-from-right');
-    
-    // Update the new container's content
-    const newTableBody = newContainer.querySelector('#tableBody');
-    newTableBody.id = 'tableBodyNew';
-    newTableBody.innerHTML = '';
-    pageVehicles.forEach(v => {
-      const row = document.createElement('tr');
-      row.innerHTML = `
-        <td>${v.vehicle_no || ''}</td>
-        <td>${v.vehicle_name || ''}</td>
-        <td>${v.department || ''}</td>
-        <td>${v.technician || ''}</td>
-        <td>${statusBadge(v.status)}</td>
-      `;
-      newTableBody.appendChild(row);
-    });
-    
-    // Add new container to DOM
-    tableContainer.parentNode.appendChild(newContainer);
-    
-    // Force reflow
-    newContainer.offsetHeight;
-    
-    // Start simultaneous animation
-    requestAnimationFrame(() => {
-      // Current page slides out to left
-      tableContainer.classList.add('slide-out-left');
-      
-      // New page slides in from right
-      newContainer.classList.remove('slide-in-from-right');
-      newContainer.classList.add('slide-active');
-      
-      // After animation completes, clean up
-      setTimeout(() => {
-        // Remove old container
-        const oldContainer = document.getElementById('tableContainer');
-        if (oldContainer) {
-          oldContainer.remove();
+###############################################################################
+# Store (single writer thread, copy-on-write snapshots)
+###############################################################################
+# Every mutation runs as an op on one writer thread. It applies queued ops in
+# batches (group commit), persists the sections they changed with a single
+# write each and then publishes a new immutable Snapshot. Request threads only
+# ever read the current snapshot (a single attribute load), so reads never
+# block and writes are never interleaved. Records are never modified once
+# published; ops replace a record with an updated copy.
+#
+# Revisions come from blocks of numbers that each process reserves in
+# STORE_STATE_FILE under the file lock, so no two processes ever hand out the
+# same one. Flushing a section records its revision there next to the file's
+# stamp, and a process loading that file adopts the recorded revision: every
+# process reports the same revision for the same data. A batch that only
+# picks up other processes' writes (read()'s refresh) skips the file lock,
+# since files are replaced atomically, so a read replica never waits behind
+# a write; only a file whose revision is not recorded yet waits for the
+# writer to finish before asking again.
+#
+# Async writes sit in memory until their flush, and meanwhile another process
+# may rewrite the same file. Before flushing, under the file lock, the writer
+# therefore reloads such a file and replays its unflushed async ops on top,
+# so a flush never overwrites what other processes already acknowledged.
+#
+# Each publish is also turned into change events (add / update / visibility /
+# delete per vehicle, options for the lists) and handed to subscribers, which
+# is what live push builds on. Picking up another process's vehicles file
+# yields the same per-vehicle events, found by comparing ids and versions;
+# only list files, or a vehicles file edited by hand (a record changed
+# without a newer version), give a "reload" event.
+
+SECTIONS = ("departments", "technicians", "services", "vehicles")
+SECTION_FILES: Dict[str, str] = {
+    "departments": DEPARTMENTS_FILE,
+    "technicians": TECHS_FILE,
+    "services": SERVICES_FILE,
+    "vehicles": VEHICLES_FILE,
+}
+# Used when a section's file is missing or empty
+SECTION_DEFAULTS: Dict[str, List[Any]] = {
+    "departments": ["Mechanical", "Electrical", "Body Shop"],
+    "technicians": ["Rajesh", "Syon"],
+    "services": ["General Service", "Oil Change", "Full Inspection"],
+    "vehicles": [],
+}
+
+
+class Snapshot(NamedTuple):
+    departments: Tuple[str, ...]
+    technicians: Tuple[str, ...]
+    services: Tuple[str, ...]
+    vehicles: Tuple[Dict[str, Any], ...]
+    by_id: Dict[str, int]                  # vehicle id -> index in vehicles
+    revisions: Dict[str, int]              # per-section change counters
+    stamps: Dict[str, Optional[tuple]]     # file signature each section matches
+    changes: Tuple[str, ...] = ()          # vehicle ids touched since the last publish
+
+    def find(self, vid: str) -> Optional[Dict[str, Any]]:
+        i = self.by_id.get(vid)
+        return None if i is None else self.vehicles[i]
+
+    def with_vehicle(self, record: Dict[str, Any]) -> "Snapshot":
+        """Replace the record with the same id (bumping its version), or append it."""
+        i = self.by_id.get(record["id"])
+        if i is None:
+            record = {**record, "version": 1}
+            by_id = dict(self.by_id)
+            by_id[record["id"]] = len(self.vehicles)
+            return self._replace(vehicles=self.vehicles + (record,), by_id=by_id,
+                                 changes=self.changes + (record["id"],))
+        record = {**record, "version": self.vehicles[i]["version"] + 1}
+        return self._replace(vehicles=self.vehicles[:i] + (record,) + self.vehicles[i + 1:],
+                             changes=self.changes + (record["id"],))
+
+    def without_vehicle(self, vid: str) -> "Snapshot":
+        i = self.by_id[vid]
+        vehicles = self.vehicles[:i] + self.vehicles[i + 1:]
+        return self._replace(vehicles=vehicles, by_id=_index_vehicles(vehicles),
+                             changes=self.changes + (vid,))
+
+
+def _index_vehicles(vehicles: Tuple[Dict[str, Any], ...]) -> Dict[str, int]:
+    return {v["id"]: i for i, v in enumerate(vehicles)}
+
+
+def _file_stamp(path: str) -> Optional[tuple]:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _read_section(path: str) -> Tuple[Any, Optional[tuple]]:
+    """Parsed data file and its stamp, taken from the same open file so they always match."""
+    try:
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            raw = f.read()
+    except FileNotFoundError:
+        return [], None
+    try:
+        data = json_loads(raw)
+    except json.JSONDecodeError:  # tolerate corrupted/empty files, like load_json
+        data = []
+    return data, (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _read_store_state() -> Dict[str, Any]:
+    """STORE_STATE_FILE: {"seq": last reserved number, "files": {section: [revision, stamp]}}."""
+    state = load_json(STORE_STATE_FILE)
+    return state if isinstance(state, dict) else {}
+
+
+def blocking_io(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking file call; under gevent on a native thread so other greenlets keep running."""
+    if SERVER_MODE == "gevent":
+        return gevent.get_hub().threadpool.apply(fn, args, kwargs)
+    return fn(*args, **kwargs)
+
+
+@contextmanager
+def _store_file_lock() -> Iterator[None]:
+    """flock() on STORE_LOCK_FILE so writers in other processes take turns."""
+    if fcntl is None:
+        yield
+        return
+    fd = os.open(STORE_LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        blocking_io(fcntl.flock, fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)  # closing releases the lock
+
+
+Op = Callable[[Snapshot], Tuple[Snapshot, Any]]
+Key = Tuple[str, str]  # (Idempotency-Key scoped to its path, request fingerprint)
+Listener = Callable[[List[Dict[str, Any]]], None]
+
+
+# Fields live subscriptions can filter on (see VehicleFilter)
+FILTER_FIELDS = ("department", "technician", "status", "visible")
+
+
+def change_events(old: Snapshot, new: Snapshot, changed: Iterable[str]) -> List[Dict[str, Any]]:
+    """Describe what an op changed between two consecutive snapshots.
+
+    Events about an existing record carry "was", its previous filter fields,
+    so filtered subscribers can tell a record entering or leaving their view.
+    """
+    events: List[Dict[str, Any]] = []
+    for vid in dict.fromkeys(new.changes):
+        before, after = old.find(vid), new.find(vid)
+        was = {f: before.get(f, True if f == "visible" else None) for f in FILTER_FIELDS} if before else None
+        if after is None:
+            if before is not None:
+                events.append({"type": "delete", "vehicle": {"id": vid, "version": before["version"]}, "was": was})
+        elif before is None:
+            events.append({"type": "add", "vehicle": after})
+        elif before.get("visible", True) != after.get("visible", True):
+            events.append({"type": "visibility", "vehicle": after, "was": was})
+        elif before is not after:
+            events.append({"type": "update", "vehicle": after, "was": was})
+    for name in changed:
+        if name != "vehicles":
+            events.append({"type": "options", "section": name, "items": list(getattr(new, name))})
+    return events
+
+
+def refresh_events(old: Snapshot, new: Snapshot) -> List[Dict[str, Any]]:
+    """Events for a snapshot another process's files replaced (see the section comment)."""
+    swapped = [n for n in SECTIONS if getattr(new, n) is not getattr(old, n)]
+    if not swapped:
+        return []
+    if swapped != ["vehicles"]:
+        return [{"type": "reload", "sections": swapped}]
+    touched = []
+    for v in new.vehicles:
+        before = old.find(v["id"])
+        if before is None or before["version"] < v["version"]:
+            touched.append(v["id"])
+        elif before["version"] > v["version"] or before != v:
+            return [{"type": "reload", "sections": swapped}]  # edited by hand
+    touched += [v["id"] for v in old.vehicles if v["id"] not in new.by_id]
+    # every loaded record is a new object: list only those whose version moved
+    return change_events(old, new._replace(changes=tuple(touched)), [])
+
+
+class Store:
+    """Owns the data files; see the section comment above."""
+
+    def __init__(self) -> None:
+        empty = Snapshot((), (), (), (), {}, {n: 0 for n in SECTIONS}, {n: None for n in SECTIONS})
+        self._locked = False  # this process holds the file lock (writer thread, or here)
+        self._ids_pid: Optional[int] = None
+        self._next_number = self._last_number = 0
+        self._dirty_since: Optional[float] = None
+        self._pending: List[Op] = []  # async ops applied since the last flush, to replay
+        # Idempotency-Key -> [fingerprint, expiry (epoch seconds), op result]
+        self._keys: "OrderedDict[str, List[Any]]" = OrderedDict()
+        self._new_keys: Dict[str, List[Any]] = {}  # recorded since the last flush
+        self._keys_stamp: Optional[tuple] = None
+        self._flushing = False
+        # _persisted is what is on disk; _snapshot runs ahead of it only
+        # while async writes are waiting for their flush
+        with self._exclusive():
+            self._snapshot = self._persisted = self._load(empty, SECTIONS)
+            self._load_keys()
+        self._writer_pid: Optional[int] = None
+        self._start_lock = threading.Lock()
+        self._counters = {"ops": 0, "batches": 0, "flushes": 0, "flush_errors": 0}
+        self._listeners: List[Listener] = []
+        self._event_id = self._next_id()  # shared numbering: unique across processes and restarts
+
+    # ---------- Change events ----------
+    @property
+    def last_event_id(self) -> int:
+        return self._event_id
+
+    def subscribe(self, listener: Listener) -> None:
+        """Call listener(events) on the writer thread after every publish."""
+        self._listeners.append(listener)
+
+    def _emit(self, events: List[Dict[str, Any]], revisions: Dict[str, int]) -> None:
+        if not events or not self._listeners:
+            return
+        for event in events:
+            self._event_id = self._next_id()
+            event["id"] = self._event_id
+            event["revisions"] = revisions
+        for listener in self._listeners:
+            try:
+                listener(events)
+            except Exception:  # a broken subscriber must not stop the writer
+                app.logger.exception("store listener failed")
+
+    # ---------- Shared numbering ----------
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        """Hold the cross-process file lock (re-entrant within this process)."""
+        if self._locked:
+            yield
+            return
+        with _store_file_lock():
+            self._locked = True
+            try:
+                yield
+            finally:
+                self._locked = False
+
+    def _next_id(self) -> int:
+        """A number no other process hands out (revisions, event ids); increasing within this process."""
+        if self._ids_pid != os.getpid() or self._next_number >= self._last_number:
+            self._reserve_ids()
+        self._next_number += 1
+        return self._next_number
+
+    def _reserve_ids(self) -> None:
+        # Per process: workers forked from a preloaded master each reserve their own
+        with self._exclusive():
+            state = _read_store_state()
+            # the clock keeps numbers increasing even if the state file is lost
+            start = max(int(state.get("seq", 0)), int(time.time() * 1_000_000))
+            blocking_io(save_json, STORE_STATE_FILE, {**state, "seq": start + ID_BLOCK}, fsync=STORE_FSYNC)
+        self._next_number, self._last_number, self._ids_pid = start, start + ID_BLOCK, os.getpid()
+
+    # ---------- Readers ----------
+    def read(self) -> Snapshot:
+        """Current snapshot; reloaded first if another process rewrote a data file."""
+        with timed("store_read"):
+            snap = self._snapshot
+            if any(_file_stamp(SECTION_FILES[n]) != snap.stamps[n] for n in SECTIONS):
+                current = self._snapshot
+                if self._flushing or current is not snap:
+                    # our own writer is replacing the files (or just did); it
+                    # holds the file lock, so nobody else wrote and the
+                    # snapshot is already as new as what is on disk
+                    return current
+                # the writer refreshes before every batch
+                self.submit(_refresh_op, durability="async")
+                snap = self._snapshot
+            return snap
+
+    def stats(self) -> Dict[str, Any]:
+        """Writer queue depth, unflushed lag and counters."""
+        dirty_since = self._dirty_since
+        return {
+            "durability": STORE_DURABILITY,
+            "queue_depth": self._queue.qsize() if self._writer_pid else 0,
+            "flush_lag_seconds": time.monotonic() - dirty_since if dirty_since is not None else 0.0,
+            "dirty_sections": self._dirty_sections(),
+            **self._counters,
         }
-        
-        // Replace with new container
-        newContainer.id = 'tableContainer';
-        newContainer.classList.remove('slide-active');
-        
-        // Update global references
-        tableContainer = newContainer;
-        tableBody = newContainer.querySelector('#tableBodyNew');
-        tableBody.id = 'tableBody';
-      }, 800);
-    });
-  } else {
-    renderTableContent(pageVehicles);
-  }
-
-  // Update page indicator
-  if (totalPages > 1) {
-    pageIndicator.textContent = `Page ${currentPage + 1} of ${totalPages}`;
-    pageIndicator.style.display = 'block';
-  } else {
-    pageIndicator.style.display = 'none';
-  }
-}
-
-// Render table content
-function renderTableContent(pageVehicles) {
-  const currentTableBody = document.getElementById('tableBody');
-  currentTableBody.innerHTML = '';
-  pageVehicles.forEach(v => {
-    const row = document.createElement('tr');
-    row.innerHTML = `
-      <td>${v.vehicle_no || ''}</td>
-      <td>${v.vehicle_name || ''}</td>
-      <td>${v.department || ''}</td>
-      <td>${v.technician || ''}</td>
-      <td>${statusBadge(v.status)}</td>
-    `;
-    currentTableBody.appendChild(row);
-  });
-}
-
-// Status badge (matches dashboard badge tokens)
-function statusBadge(s) {
-  switch(s) {
-    case 'Done':       return '<span class="badge badge-success">Done</span>';
-    case 'In Service': return '<span class="badge badge-warning">In Service</span>';
-    default:           return '<span class="badge badge-danger">Waiting</span>';
-  }
-}
-
-// Show video with smooth transition
-function showVideo() {
-  isShowingVideo = true;
-  
-  // Hide all UI elements
-  topControls.classList.add('video-playing');
-  pageTitle.classList.add('video-playing');
-  pageIndicator.classList.add('video-playing');
-  logoContainer.classList.add('video-playing');  
-  pageText.classList.add('video-playing');       
-  
-  tableContainer.classList.add('slide-out-left');
-  
-  setTimeout(() => {
-    // Set the current video source
-    videoSource.src = VIDEO_FILES[currentVideoIndex];
-    displayVideo.load(); // Reload video with new source
-    
-    videoContainer.classList.add('slide-in');
-    displayVideo.currentTime = 0; // Reset video
-    displayVideo.play();
-  }, 400);
-
-  // Hide video after 30 seconds and restart cycle
-  videoTimer = setTimeout(() => {
-    hideVideo();
-  }, VIDEO_DURATION);
-}
 
-// Hide video and show table
-function hideVideo() {
-  isShowingVideo = false;
-  videoContainer.classList.remove('slide-in');
-  
-  // Move to next video for next cycle
-  currentVideoIndex = (currentVideoIndex + 1) % VIDEO_FILES.length;
-  
-  setTimeout(() => {
-    // Show all UI elements again
-    topControls.classList.remove('video-playing');
-    pageTitle.classList.remove('video-playing');
-    pageIndicator.classList.remove('video-playing');
-    logoContainer.classList.remove('video-playing'); 
-    pageText.classList.remove('video-playing');    
-    
-    tableContainer.classList.remove('slide-out-left');
-    currentPage = 0; // Reset to first page
-    renderCurrentPage();
-    console.log(`Video hidden, restarting page cycle from page 1. Next video will be: ${VIDEO_FILES[currentVideoIndex]}`);
-    startPageCycle();
-  }, 800);
-}
-
-// Start automatic page cycling
-function startPageCycle() {
-  clearTimeout(pageTimer);
-  
-  if (totalPages === 0) return;
-  if (isShowingVideo) return;
-
-  // Always start the timer for next page change
-  pageTimer = setTimeout(() => {
-    if (isShowingVideo) return;
-
-    currentPage++;
-    console.log(`Moving to page ${currentPage + 1} of ${totalPages}`);
-    
-    if (currentPage >= totalPages) {
-      // All pages shown, show video
-      console.log(`All pages shown, showing video: ${VIDEO_FILES[currentVideoIndex]}`);
-      showVideo();
-    } else {
-      // Show next page with Apple-style sliding animation
-      renderCurrentPage('right');
-      startPageCycle(); // Continue the cycle
-    }
-  }, PAGE_DURATION);
-  
-  console.log(`Page timer set for page ${currentPage + 1}, will advance in ${PAGE_DURATION}ms`);
-}
+    # ---------- Writer ----------
+    def submit(self, op: Op, durability: Optional[str] = None) -> Any:
+        """Run op(snapshot) -> (new_snapshot, result) on the writer thread.
+
+        Blocks until op has been applied and, unless durability is "async",
+        until the batch holding it is persisted; then returns result (or
+        raises whatever op raised).
+        """
+        self._ensure_writer()
+        future: Future = Future()
+        self._queue.put((op, future, durability or STORE_DURABILITY, None))
+        return future.result()
+
+    def submit_keyed(self, op: Op, key: Key, durability: Optional[str] = None) -> Tuple[Any, bool]:
+        """Like submit(), but at most once per Idempotency-Key across processes.
+
+        Returns (result, replayed): a key already recorded by any process
+        returns the result its op had instead of running op again. Raises
+        IdempotencyKeyReused when the key came with a different request.
+        """
+        self._ensure_writer()
+        future: Future = Future()
+        self._queue.put((op, future, durability or STORE_DURABILITY, key))
+        return future.result()
+
+    def _ensure_writer(self) -> None:
+        # Threads do not survive fork, so start (or restart) per process
+        if self._writer_pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._writer_pid != os.getpid():
+                self._queue: "queue.SimpleQueue[Tuple[Op, Future, str, Optional[Key]]]" = queue.SimpleQueue()
+                threading.Thread(target=self._run, name="store-writer", daemon=True).start()
+                self._writer_pid = os.getpid()
+
+    def _next_batch(self) -> List[Tuple[Op, Future, str, Optional[Key]]]:
+        # With unflushed async writes, wake up in time to flush them
+        timeout = None
+        if self._dirty_since is not None:
+            timeout = max(self._dirty_since + ASYNC_FLUSH_MS / 1000 - time.monotonic(), 0)
+        try:
+            batch = [self._queue.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + GROUP_COMMIT_WINDOW_MS / 1000
+        while len(batch) < GROUP_COMMIT_MAX_BATCH and batch[-1][2] != "sync":
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            waiting: List[Tuple[Future, Any]] = []  # acknowledged once durable
+            recorded_keys: List[str] = []
+            start = self._snapshot
+            # refreshes alone only read files, which are replaced atomically
+            refresh_only = bool(batch) and all(op is _refresh_op for op, _, _, _ in batch) and not self._flush_due()
+            try:
+                with nullcontext() if refresh_only else self._exclusive():
+                    refreshed = self._refresh(start)
+                    if refreshed is not start:  # another process rewrote a file
+                        self._emit(refresh_events(start, refreshed), refreshed.revisions)
+                    self._snapshot = start = refreshed
+                    for op, future, durability, key in batch:
+                        if key is not None and key[0] in self._keys:
+                            fingerprint, _, recorded = self._keys[key[0]]
+                            if fingerprint == key[1]:
+                                future.set_result((recorded, True))
+                            else:
+                                future.set_exception(IdempotencyKeyReused(key[0]))
+                            continue
+                        try:
+                            new, result = op(self._snapshot)
+                        except Exception as exc:  # only this op is dropped
+                            future.set_exception(exc)
+                            continue
+                        self._publish(new)
+                        if key is not None:
+                            self._record_key(key, result)
+                            recorded_keys.append(key[0])
+                            result = (result, False)
+                        if durability == "async":
+                            self._pending.append(op)
+                            future.set_result(result)
+                        else:
+                            waiting.append((future, result))
+                    self._count("ops", len(batch))
+                    self._count("batches", 1 if batch else 0)
+                    if not refresh_only and (waiting or self._flush_due()):
+                        self._flush()
+            except BaseException as exc:
+                # Persisting failed: drop this batch (async ops in it were
+                # already acknowledged) and retry older unflushed writes later
+                self._count("flush_errors")
+                # Fresh revisions, so clients refetch the rollback
+                revisions = {n: self._next_id() for n in SECTIONS}
+                self._snapshot = start._replace(revisions=revisions)
+                self._emit([{"type": "reload", "sections": list(SECTIONS)}], revisions)
+                for name in recorded_keys:  # their ops were rolled back, so retries must run
+                    self._keys.pop(name, None)
+                    self._new_keys.pop(name, None)
+                self._dirty_since = time.monotonic() if self._dirty_sections() or self._new_keys else None
+                for future, _ in waiting:
+                    future.set_exception(exc)
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for future, result in waiting:
+                future.set_result(result)
+
+    def _publish(self, new: Snapshot) -> None:
+        """Make new visible to readers, bumping revisions of changed sections."""
+        old = self._snapshot
+        changed = [n for n in SECTIONS if getattr(new, n) is not getattr(old, n)]
+        if not changed:
+            self._snapshot = new._replace(changes=()) if new.changes else new
+            return
+        revisions = dict(new.revisions)
+        for name in changed:
+            revisions[name] = self._next_id()
+        events = change_events(old, new, changed)
+        self._snapshot = new._replace(revisions=revisions, changes=())
+        if self._dirty_since is None:
+            self._dirty_since = time.monotonic()
+        self._emit(events, revisions)
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        # stats() for this process, plus a /metrics counter summed over workers
+        self._counters[name] += amount
+        metrics.inc("asg_store_events_total", (("counter", name),), amount)
+
+    def _record_key(self, key: Key, result: Any) -> None:
+        self._keys[key[0]] = self._new_keys[key[0]] = [key[1], time.time() + IDEMPOTENCY_TTL, result]
+        while len(self._keys) > IDEMPOTENCY_MAX_KEYS:
+            self._keys.popitem(last=False)
+        if self._dirty_since is None:
+            self._dirty_since = time.monotonic()
+
+    def _dirty_sections(self) -> List[str]:
+        snap, persisted = self._snapshot, self._persisted
+        return [n for n in SECTIONS if getattr(snap, n) is not getattr(persisted, n)]
+
+    def _flush_due(self) -> bool:
+        return self._dirty_since is not None and time.monotonic() - self._dirty_since >= ASYNC_FLUSH_MS / 1000
+
+    def _flush(self) -> None:
+        """Write every section that differs from disk (one write + fsync each)."""
+        snap = self._snapshot
+        dirty = self._dirty_sections()
+        if dirty or self._new_keys:
+            stamps = dict(snap.stamps)
+            state = _read_store_state()
+            files = state.setdefault("files", {})
+            self._flushing = True  # readers must not queue a refresh behind our own write
+            try:
+                with timed("store_persist"):
+                    for name in dirty:
+                        blocking_io(save_json, SECTION_FILES[name], list(getattr(snap, name)), fsync=STORE_FSYNC)
+                        stamps[name] = _file_stamp(SECTION_FILES[name])
+                        files[name] = [snap.revisions[name], stamps[name]]
+                    # no fsync: a lost record only makes other processes assign a new revision
+                    if dirty:
+                        blocking_io(save_json, STORE_STATE_FILE, state)
+                    # after the data: a crash in between makes a retry run
+                    # again rather than replay a change that was never saved
+                    if self._new_keys:
+                        now = time.time()
+                        keys = {name: entry for name, entry in self._keys.items() if entry[1] > now}
+                        blocking_io(save_json, STORE_KEYS_FILE, keys, fsync=STORE_FSYNC)
+                        self._keys_stamp = _file_stamp(STORE_KEYS_FILE)
+            except BaseException:
+                self._flushing = False
+                raise
+            snap = snap._replace(stamps=stamps)
+            self._count("flushes")
+        self._snapshot = self._persisted = snap
+        self._flushing = False
+        self._dirty_since = None
+        self._pending.clear()
+        self._new_keys.clear()
+
+    # ---------- Loading ----------
+    def _refresh(self, snap: Snapshot) -> Snapshot:
+        if _file_stamp(STORE_KEYS_FILE) != self._keys_stamp:
+            self._load_keys()
+        dirty = self._dirty_sections()
+        changed = [n for n in SECTIONS if _file_stamp(SECTION_FILES[n]) != snap.stamps[n]]
+        if self._locked and any(n in dirty for n in changed):
+            return self._rebase(changed)
+        # Without the lock, sections with unflushed async writes keep the
+        # in-memory version until the next locked batch rebases them
+        stale = [n for n in changed if n not in dirty]
+        if not stale:
+            return snap
+        snap = self._load(snap, stale)
+        if not dirty:
+            self._persisted = snap
+        else:
+            self._persisted = self._persisted._replace(
+                stamps=snap.stamps, **{n: getattr(snap, n) for n in stale})
+        return snap
+
+    def _load_keys(self) -> None:
+        data, self._keys_stamp = blocking_io(_read_section, STORE_KEYS_FILE)
+        now = time.time()
+        keys = OrderedDict((name, entry) for name, entry in (data or {}).items() if entry[1] > now)
+        keys.update(self._new_keys)  # ours, not flushed yet
+        self._keys = keys
+
+    def _rebase(self, changed: List[str]) -> Snapshot:
+        """Reload changed files and replay the unflushed async ops on top."""
+        base = self._persisted = self._load(self._persisted, changed)
+        new = base
+        for op in self._pending:
+            try:
+                # results are dropped: the client had its answer when it first ran
+                new, _ = op(new)
+            except Exception:
+                continue
+        revisions = {n: base.revisions[n] if getattr(new, n) is getattr(base, n) else self._next_id()
+                     for n in SECTIONS}
+        return new._replace(revisions=revisions, changes=())
+
+    def _load(self, snap: Snapshot, names: Iterable[str]) -> Snapshot:
+        fields: Dict[str, Any] = {}
+        revisions, stamps = dict(snap.revisions), dict(snap.stamps)
+        recorded = _read_store_state().get("files", {})
+        for name in SECTIONS:  # lists first: vehicle backfill reads them
+            if name not in names:
+                continue
+            with timed("store_load"):
+                data, stamps[name] = blocking_io(_read_section, SECTION_FILES[name])
+                data = data or list(SECTION_DEFAULTS[name])
+            if name == "vehicles":
+                with timed("backfill"):
+                    backfill_vehicles(data, fields.get("departments", snap.departments),
+                                      fields.get("technicians", snap.technicians),
+                                      fields.get("services", snap.services))
+                    fields["by_id"] = _index_vehicles(data)
+            fields[name] = tuple(data)
+            # the revision its writer recorded, or a new one (edited by hand, record lost)
+            rev, stamp = recorded.get(name) or (None, None)
+            if stamp != list(stamps[name] or ()) and not self._locked:
+                # lock-free refresh: its writer may not have recorded it yet
+                with self._exclusive():
+                    recorded = _read_store_state().get("files", {})
+                rev, stamp = recorded.get(name) or (None, None)
+            revisions[name] = rev if stamps[name] is not None and stamp == list(stamps[name]) else self._next_id()
+        return snap._replace(revisions=revisions, stamps=stamps, **fields)
+
+
+def _refresh_op(snap: Snapshot) -> Tuple[Snapshot, None]:
+    """No-op that read() submits: the writer refreshes before every batch."""
+    return snap, None
+
+
+store = Store()
+
+
+def mutate(op: Op) -> Any:
+    """Submit op for the current request, honouring X-Durability and Idempotency-Key."""
+    durability = request.headers.get("X-Durability")
+    durability = durability if durability in DURABILITY_LEVELS else None
+    key = g.get("idempotency_key")  # set by @idempotent
+    with timed("persist"):
+        if key is None:
+            return store.submit(op, durability)
+        result, replayed = store.submit_keyed(op, key, durability)
+    if replayed:
+        g.idempotent_replayed = True
+    return result
+
+
+def expected_version(data: Dict[str, Any]) -> Optional[int]:
+    """Version a change was based on (If-Match header or expected_version field).
+
+    None means unconditional; raises ValueError on a malformed value.
+    """
+    raw = request.headers.get("If-Match", data.get("expected_version"))
+    if raw is None or raw == "*":
+        return None
+    if isinstance(raw, str):
+        raw = raw.strip().removeprefix("W/").strip('"')
+    # int("1.9") already fails; a JSON 1.9, true or [1] must not become a version either
+    if isinstance(raw, bool) or not isinstance(raw, (int, str)):
+        raise ValueError("Invalid version")
+    return int(raw)
+
+
+def version_conflict(current: Dict[str, Any]):
+    return jsonify({"success": False, "message": "Version conflict", "current": current}), 409
+
+
+def read_vehicles() -> Tuple[Dict[str, Any], ...]:
+    """Current vehicles (immutable snapshot)"""
+    return store.read().vehicles
+
+
+def add_to_list(section: str, name: str) -> Op:
+    """Op appending name to a string-list section, if not already there."""
+    def op(snap: Snapshot) -> Tuple[Snapshot, None]:
+        items = getattr(snap, section)
+        if name in items:
+            return snap, None
+        return snap._replace(**{section: items + (name,)}), None
+    return op
+
+
+def remove_from_list(section: str, name: str) -> Op:
+    """Op removing name from a string-list section, if present."""
+    def op(snap: Snapshot) -> Tuple[Snapshot, None]:
+        items = getattr(snap, section)
+        if name not in items:
+            return snap, None
+        return snap._replace(**{section: tuple(i for i in items if i != name)}), None
+    return op
+
+
+def bootstrap_state(known: Dict[str, Any]) -> Dict[str, Any]:
+    """Current revisions plus every section whose revision differs from known."""
+    snap = store.read()
+    state: Dict[str, Any] = {"revisions": snap.revisions}
+    for name in SECTIONS:
+        if known.get(name) != snap.revisions[name]:
+            state[name] = getattr(snap, name)
+    return state
 
-// Stop all timers
-function stopTimers() {
-  clearTimeout(pageTimer);
-  clearTimeout(videoTimer);
-}
+###############################################################################
+# Live updates (change feed, Socket.IO)
+###############################################################################
+# Store change events (see change_events) are kept in a bounded replay
+# buffer that long-poll requests block on, and every publish is pushed to
+# all connected Socket.IO clients as one "changes" message. Event ids double
+# as the feed's revision: a client that sends the last id it saw gets exactly
+# the events after it; one that is too far behind, whose id this process
+# never handed out, or that sees a "reload" event, gets (or refetches) the
+# full state instead. Ids come from the store's shared numbering, so an id
+# from another process can never be mistaken for one of ours.
+
+class ChangeFeed:
+    """Replay buffer of store change events that requests can wait on."""
+
+    def __init__(self, size: int, floor: int) -> None:
+        self._events: "deque[Dict[str, Any]]" = deque(maxlen=size)
+        self._floor = floor  # newest id that is not (or no longer) buffered
+        self._cond = threading.Condition()
+        self._checked_at = 0.0
+
+    @property
+    def last_id(self) -> int:
+        events = self._events
+        return events[-1]["id"] if events else self._floor
+
+    def publish(self, events: List[Dict[str, Any]]) -> None:
+        with self._cond:
+            for event in events:
+                if len(self._events) == self._events.maxlen:
+                    self._floor = self._events[0]["id"]
+                self._events.append(event)
+            self._cond.notify_all()
+
+    def since(self, event_id: int) -> Optional[List[Dict[str, Any]]]:
+        """Events after event_id, or None when they are no longer buffered."""
+        with self._cond:
+            if event_id == self._floor:
+                return list(self._events)
+            # ids increase but skip the numbers other processes and revisions
+            # took, so look the id up from the newest end
+            newer: List[Dict[str, Any]] = []
+            for event in reversed(self._events):
+                if event["id"] == event_id:
+                    newer.reverse()
+                    return newer
+                if event["id"] < event_id:
+                    break
+                newer.append(event)
+            return None
+
+    def wait(self, event_id: int, timeout: float) -> Optional[List[Dict[str, Any]]]:
+        """Like since(), but block up to timeout seconds while nothing is newer."""
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._cond:
+                remaining = deadline - time.monotonic()
+                if self.last_id != event_id or remaining <= 0:
+                    break
+                self._cond.wait(min(remaining, FEED_RECHECK_SECONDS))
+            # One waiter per interval looks for other processes' writes (read()
+            # turns them into change events), however many clients are waiting;
+            # outside the lock, since the writer publishes under it
+            now = time.monotonic()
+            if now - self._checked_at >= FEED_RECHECK_SECONDS:
+                self._checked_at = now
+                store.read()
+        return self.since(event_id)
+
+
+change_feed = ChangeFeed(CHANGE_FEED_SIZE, store.last_event_id)
+store.subscribe(change_feed.publish)
+
+
+class VehicleFilter:
+    """Live subscription predicate over FILTER_FIELDS.
+
+    A record matches when every constrained field holds one of the allowed
+    values (?department=Body Shop&status=Waiting,In Service). route() turns
+    the global event stream into what one subscriber should see: events for
+    records outside the filter are dropped, and a record moving into or out
+    of it arrives as "enter" / "leave".
+    """
+
+    def __init__(self, terms: Dict[str, FrozenSet[Any]]) -> None:
+        self.terms = terms
+        # canonical form: equal filters share one Socket.IO room
+        self.key = "&".join(f"{f}={','.join(sorted(map(str, v)))}" for f, v in sorted(terms.items()))
+
+    @classmethod
+    def parse(cls, values: Callable[[str], List[Any]]) -> Optional["VehicleFilter"]:
+        """Build from values(field) -> list of raw values; None when nothing is constrained."""
+        terms: Dict[str, FrozenSet[Any]] = {}
+        for field in FILTER_FIELDS:
+            raw = [part.strip() if isinstance(part, str) else part
+                   for val in values(field) for part in (val.split(",") if isinstance(val, str) else [val])]
+            raw = [val for val in raw if val != ""]
+            if not raw:
+                continue
+            if field == "visible":
+                raw = [val if isinstance(val, bool) else str(val).lower() in {"1", "true", "yes", "on"}
+                       for val in raw]
+            terms[field] = frozenset(raw)
+        return cls(terms) if terms else None
+
+    @classmethod
+    def from_args(cls, args: Any) -> Optional["VehicleFilter"]:
+        return cls.parse(args.getlist)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Optional["VehicleFilter"]:
+        def values(field: str) -> List[Any]:
+            val = data.get(field)
+            return [] if val is None else list(val) if isinstance(val, (list, tuple)) else [val]
+        return cls.parse(values)
+
+    def matches(self, record: Dict[str, Any]) -> bool:
+        return all(record.get(f, True if f == "visible" else None) in allowed for f, allowed in self.terms.items())
+
+    def route(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        routed = []
+        for event in events:
+            record = event.get("vehicle")
+            if record is None:  # options / reload concern everyone
+                routed.append(event)
+                continue
+            was = event.get("was")
+            before = was is not None and self.matches(was)
+            after = event["type"] != "delete" and self.matches(record)
+            if before and after or (event["type"] == "delete" and before) or (event["type"] == "add" and after):
+                routed.append(event)
+            elif after:
+                routed.append({**event, "type": "enter"})
+            elif before:
+                routed.append({**event, "type": "leave", "vehicle": {"id": record["id"], "version": record["version"]}})
+        return routed
+
+
+def feed_state(filt: Optional[VehicleFilter] = None) -> Tuple[int, Dict[str, Any]]:
+    """Feed revision and every section, for clients that cannot replay events."""
+    revision = change_feed.last_id  # before the read, so the snapshot is at least this new
+    snap = store.read()
+    vehicles = snap.vehicles if filt is None else [v for v in snap.vehicles if filt.matches(v)]
+    return revision, {"departments": snap.departments, "technicians": snap.technicians,
+                      "services": snap.services, "vehicles": vehicles}
+
+
+# Every held live connection (long-poll, SSE stream, Socket.IO client) takes a slot
+_live_slots = threading.BoundedSemaphore(MAX_LIVE_CONNECTIONS)
+
+
+def live_capacity_exceeded():
+    response = jsonify({"success": False, "message": "Too many live connections"})
+    response.headers["Retry-After"] = "5"
+    return response, 503
+
+
+def _release_slot_after(body: Iterable[bytes]) -> Iterator[bytes]:
+    try:
+        yield from body
+    finally:
+        _live_slots.release()
+
+
+def _needs_reset(events: Optional[List[Dict[str, Any]]]) -> bool:
+    return events is None or any(e["type"] == "reload" for e in events)
+
+
+def _sse(event_id: int, event: str, data: Any) -> bytes:
+    return b"id: %d\nevent: %s\ndata: %s\n\n" % (event_id, event.encode(), json_dumps(data))
+
+
+def iter_sse(last_id: Optional[int], filt: Optional[VehicleFilter] = None) -> Iterator[bytes]:
+    """Change events as text/event-stream, resuming after last_id when it is still buffered."""
+    yield b"retry: %d\n\n" % SSE_RETRY_MS
+    events = change_feed.since(last_id) if last_id is not None else None
+    while True:
+        if _needs_reset(events):
+            last_id, state = feed_state(filt)
+            yield _sse(last_id, "reset", state)
+        else:
+            routed = events if filt is None else filt.route(events)
+            for event in routed:
+                yield _sse(event["id"], event["type"], event)
+            if events:
+                last_id = events[-1]["id"]
+            if not routed:
+                yield b": keepalive\n\n"  # also how a closed connection gets noticed
+        events = change_feed.wait(last_id, SSE_KEEPALIVE_SECONDS)
+
+
+def wait_response(since: Optional[int], timeout: float, filt: Optional[VehicleFilter]):
+    """Body of /api/wait: the (filtered) delta after since, or the full state."""
+    deadline = time.monotonic() + timeout
+    while since is not None:
+        events = change_feed.wait(since, max(deadline - time.monotonic(), 0.0))
+        if _needs_reset(events):
+            break
+        routed = events if filt is None else filt.route(events)
+        if events:
+            since = events[-1]["id"]
+        # keep waiting while only records outside the filter changed
+        if routed or time.monotonic() >= deadline:
+            return api_response({"revision": since, "events": routed})
+    revision, state = feed_state(filt)
+    return api_response({"revision": revision, "full": True, **state})
+
+
+# ---------- Socket.IO ----------
+# Clients start in ALL_ROOM. A "subscribe" message with filter fields moves
+# the client to the room of that filter; equal filters share a room, so each
+# publish is routed once per distinct filter rather than once per client.
+ALL_ROOM = "changes"
+
+socketio = SocketIO(app, async_mode=SOCKETIO_ASYNC_MODE) if SocketIO is not None else None
+_live_filters: Dict[str, Tuple[VehicleFilter, int]] = {}  # room -> (filter, clients in it)
+_live_rooms: Dict[str, str] = {}                          # client sid -> its room
+_live_lock = threading.Lock()
+
+
+def _live_move(sid: str, filt: Optional[VehicleFilter]) -> str:
+    """Record that sid now listens on filt's room (None: leaving); returns the room."""
+    room = ALL_ROOM if filt is None else f"{ALL_ROOM}?{filt.key}"
+    with _live_lock:
+        old = _live_rooms.pop(sid, None)
+        if old in _live_filters:
+            old_filter, count = _live_filters[old]
+            if count > 1:
+                _live_filters[old] = (old_filter, count - 1)
+            else:
+                del _live_filters[old]
+        if filt is not None:
+            _live_filters[room] = (filt, _live_filters.get(room, (filt, 0))[1] + 1)
+        _live_rooms[sid] = room
+    return room
+
+
+def _live_broadcast(events: List[Dict[str, Any]]) -> None:
+    socketio.emit("changes", events, to=ALL_ROOM)
+    with _live_lock:
+        filters = list(_live_filters.items())
+    for room, (filt, _) in filters:
+        routed = filt.route(events)
+        if routed:
+            socketio.emit("changes", routed, to=room)
+
+
+if socketio is not None:
+    from flask_socketio import join_room, leave_room
+
+    @socketio.on("connect")
+    def _live_connect(auth: Any = None) -> bool:
+        if app.config.get("APP_ROLE", APP_ROLE) not in SOCKETIO_ROLES:
+            return False  # a replica only sees writes when something reads, so pushes would lag
+        if not _live_slots.acquire(blocking=False):
+            return False  # refused; the client retries with backoff
+        join_room(_live_move(request.sid, None))
+        return True
+
+    @socketio.on("subscribe")
+    def _live_subscribe(data: Any) -> Dict[str, Any]:
+        """{"department": [...], "status": ..., ...}; an empty filter means everything."""
+        leave_room(_live_rooms.get(request.sid, ALL_ROOM))
+        filt = VehicleFilter.from_dict(data) if isinstance(data, dict) else None
+        join_room(_live_move(request.sid, filt))
+        return {"success": True, "filter": filt.key if filt else ""}
+
+    @socketio.on("disconnect")
+    def _live_disconnect(*args: Any) -> None:
+        if request.sid not in _live_rooms:
+            return
+        _live_move(request.sid, None)
+        with _live_lock:
+            _live_rooms.pop(request.sid, None)
+        _live_slots.release()
+
+    store.subscribe(_live_broadcast)
 
-// Initialize + periodic refresh
-async function refreshDataAndRender() {
-  vehicles = await fetchVehicles();
-  filteredVehicles = [...vehicles]; // No search functionality
-
-  const visibleVehicles = filteredVehicles.filter(v => v.visible);
-  const previousTotalPages = totalPages;
-  totalPages = Math.ceil(visibleVehicles.length / ROWS_PER_PAGE);
-
-  console.log(`Data refreshed: ${visibleVehicles.length} vehicles, ${totalPages} pages`);
-
-  if (visibleVehicles.length === 0) {
-    noResults.style.display = 'block';
-    pageIndicator.style.display = 'none';
-    stopTimers();
-  } else {
-    noResults.style.display = 'none';
-    
-    // Reset pagination if current page is beyond available pages
-    if (currentPage >= totalPages) {
-      currentPage = 0;
-    }
-    
-    // Always render current page
-    if (!isShowingVideo) {
-      renderCurrentPage();
-    }
-  }
-}
+###############################################################################
+# Idempotency
+###############################################################################
+# POST endpoints honour an Idempotency-Key header: the first request with a
+# key runs, its response is kept for IDEMPOTENCY_TTL and any retry with the
+# same key gets that response back instead of running again. A retry that
+# arrives while the first is still running waits for it. Responses are
+# cached per process (bounded, oldest evicted first). Across processes the
+# store is what dedupes: a keyed mutation records its op's result in
+# STORE_KEYS_FILE, flushed with the same batch, and the writer checks that
+# table - refreshed under the file lock - before running an op, so a retry
+# that reaches another worker gets the recorded result back instead of
+# changing anything. Only async durability leaves a window of up to
+# ASYNC_FLUSH_MS.
+
+class IdempotencyKeyReused(Exception):
+    """An Idempotency-Key recorded for a different request."""
+
+
+class _IdempotencyEntry:
+    __slots__ = ("fingerprint", "expires", "done", "response")
+
+    def __init__(self, fingerprint: str) -> None:
+        self.fingerprint = fingerprint
+        self.expires = time.monotonic() + IDEMPOTENCY_TTL
+        self.done = threading.Event()
+        self.response: Optional[Tuple[int, bytes, str]] = None
+
+
+_idempotency: "OrderedDict[Tuple[str, str], _IdempotencyEntry]" = OrderedDict()
+_idempotency_lock = threading.Lock()
+
+
+def _idempotency_claim(key: Tuple[str, str], fingerprint: str) -> Tuple[_IdempotencyEntry, bool]:
+    """Return (entry, owner): owner is True when this request must run the view."""
+    now = time.monotonic()
+    with _idempotency_lock:
+        # Same TTL for every entry, so the oldest are always at the front
+        while _idempotency and next(iter(_idempotency.values())).expires <= now:
+            _idempotency.popitem(last=False)
+        entry = _idempotency.get(key)
+        if entry is not None:
+            return entry, False
+        entry = _idempotency[key] = _IdempotencyEntry(fingerprint)
+        if len(_idempotency) > IDEMPOTENCY_MAX_KEYS:
+            _idempotency.popitem(last=False)
+        return entry, True
+
+
+def _key_reused():
+    return jsonify({"success": False, "message": "Idempotency-Key reused with a different request"}), 422
+
+
+def idempotent(view: Callable) -> Callable:
+    """Replay the stored response for a repeated Idempotency-Key."""
+    @functools.wraps(view)
+    def wrapper(*args: Any, **kwargs: Any):
+        header = request.headers.get("Idempotency-Key", "").strip()
+        if not header:
+            return view(*args, **kwargs)
+
+        fingerprint = hashlib.sha256(request.get_data()).hexdigest()
+        entry, owner = _idempotency_claim((request.path, header), fingerprint)
+        if entry.fingerprint != fingerprint:
+            return _key_reused()
+
+        if not owner:
+            entry.done.wait()
+            if entry.response is None:  # the first attempt failed: run it again
+                return wrapper(*args, **kwargs)
+            status, body, mimetype = entry.response
+            response = Response(body, status=status, mimetype=mimetype)
+            response.headers["Idempotent-Replayed"] = "true"
+            return response
+
+        try:
+            g.idempotency_key = (f"{request.path} {header}", fingerprint)
+            try:
+                response = app.make_response(view(*args, **kwargs))
+            except IdempotencyKeyReused:
+                # recorded by another process for a different request; not
+                # cached here, so the request that owns the key still replays
+                return _key_reused()
+            if g.pop("idempotent_replayed", False):  # the store had it from another process
+                response.headers["Idempotent-Replayed"] = "true"
+            if response.status_code < 500:
+                entry.response = (response.status_code, response.get_data(), response.mimetype)
+            return response
+        finally:
+            if entry.response is None:  # server error (or not ours): let a retry run for real
+                with _idempotency_lock:
+                    if _idempotency.get((request.path, header)) is entry:
+                        del _idempotency[(request.path, header)]
+            entry.done.set()
+    return wrapper
 
-// Menu + overlay behavior
-menuToggle.addEventListener('click', () => {
-  const wasOpen = drawer.classList.contains('show');
-  if (wasOpen) {
-    drawer.classList.remove('show');
-    overlay.classList.remove('show');
-  } else {
-    drawer.classList.add('show');
-    overlay.classList.add('show');
-  }
-});
-
-overlay.addEventListener('click', () => {
-  drawer.classList.remove('show');
-  overlay.classList.remove('show');
-});
-
-// Logout
-function logout(){ window.location.href = '/logout'; }
-
-// Initialize application
-async function initialize() {
-  await refreshDataAndRender();
-  console.log(`Initialized: ${totalPages} total pages`);
-  
-  if (totalPages > 0 && !isShowingVideo) {
-    console.log('Starting initial page cycle');
-    startPageCycle();
-  }
-}
+###############################################################################
+# Pages
+###############################################################################
+# The HTML pages (login, reception, staff, admin, dashboard, display) live in
+# pages.py with their templates in templates/; configure_role registers them.
 
-// Start the application
-initialize();
-
-// Refresh data every 3 seconds, but don't interfere with pagination
-setInterval(async () => {
-  await refreshDataAndRender();
-}, 3000);
-
-// Handle video errors
-displayVideo.addEventListener('error', (e) => {
-  console.error('Video playback error:', e);
-  if (isShowingVideo) {
-    hideVideo(); // Fallback to table if video fails
-  }
-});
-
-// Video ended event (backup in case loop fails)
-displayVideo.addEventListener('ended', () => {
-  if (isShowingVideo) {
-    displayVideo.currentTime = 0;
-    displayVideo.play();
-  }
-});
-</script>
-</body>
-</html>""",
-    )
 ###############################################################################
 # API
 ###############################################################################
 @app.route("/api/vehicles", methods=["GET"])
 def api_vehicles():
-    return jsonify(read_vehicles())
+    # ?limit= / ?cursor= switch to cursor pagination; plain GET keeps the full list
+    if "limit" not in request.args and "cursor" not in request.args:
+        return api_response(read_vehicles())
+
+    limit = request.args.get("limit", DEFAULT_PAGE_SIZE, type=int)
+    if limit < 1:
+        return jsonify({"success": False, "message": "Invalid limit"}), 400
+    try:
+        page = paginate_vehicles(read_vehicles(), request.args.get("cursor"), min(limit, MAX_PAGE_SIZE))
+    except ValueError as exc:
+        return jsonify({"success": False, "message": str(exc)}), 400
+    return api_response(page)
+
+@app.get("/api/export/vehicles")
+def api_export_vehicles():
+    """Download every vehicle as a streamed JSON array or NDJSON (?format=ndjson)."""
+    records = read_vehicles()
+    if request.args.get("format") == "ndjson":
+        body, mimetype, ext = iter_ndjson(records), NDJSON_MIMETYPE, "ndjson"
+    else:
+        body, mimetype, ext = iter_json_array(records), JSON_MIMETYPE, "json"
+    response = Response(body, mimetype=mimetype)
+    response.headers["Content-Disposition"] = f"attachment; filename=vehicles.{ext}"
+    return response
 
 @app.post("/api/add")
+@idempotent
 def api_add_vehicle():
     data = request.get_json(force=True) or {}
     def pick(name: str, default: str = "") -> str:
         val = data.get(name, default)
         return val.strip() if isinstance(val, str) else default
 
+    snap = store.read()
     new_vehicle = {
         "id": str(uuid.uuid4()),
+        "seq": 0,
         "customer": pick("customer"),
         "vehicle_no": pick("vehicle_no"),
         "vehicle_name": pick("vehicle_name"),
-        "department": pick("department", departments[0] if departments else ""),
-        "service": pick("service", services[0] if services else ""),
-        "technician": pick("technician", technicians[0] if technicians else ""),
+        "department": pick("department", snap.departments[0] if snap.departments else ""),
+        "service": pick("service", snap.services[0] if snap.services else ""),
+        "technician": pick("technician", snap.technicians[0] if snap.technicians else ""),
         "status": pick("status", STATUSES[0]),
         "payment": "Unpaid",
         "parts": "Not Arrived",
@@ -8313,129 +2012,265 @@ def api_add_vehicle():
         "watch": False,
     }
 
-    current_vehicles = read_vehicles()
-    current_vehicles.append(new_vehicle)
-    save_json(VEHICLES_FILE, current_vehicles)
+    def add(snap: Snapshot):
+        record = {**new_vehicle, "seq": next_seq(snap.vehicles)}
+        return snap.with_vehicle(record), record["id"]
 
-    global vehicles
-    vehicles = current_vehicles
-
-    return jsonify({"success": True, "id": new_vehicle["id"]})
+    return jsonify({"success": True, "id": mutate(add)})
 
 @app.post("/api/delete_vehicle")
+@idempotent
 def api_delete_vehicle():
-    vid = (request.get_json(force=True) or {}).get("id")
+    data = request.get_json(force=True) or {}
+    vid = data.get("id")
     if not vid:
         return jsonify({"success": False, "message": "Missing id"}), 400
-
-    current_vehicles = read_vehicles()
-    before = len(current_vehicles)
-    current_vehicles[:] = [v for v in current_vehicles if v.get("id") != vid]
-
-    if len(current_vehicles) == before:
+    try:
+        expected = expected_version(data)
+    except ValueError:
+        return jsonify({"success": False, "message": "Invalid version"}), 400
+
+    def delete(snap: Snapshot):
+        v = snap.find(vid)
+        if v is None:
+            return snap, (404, None)
+        if expected is not None and v["version"] != expected:
+            return snap, (409, v)
+        return snap.without_vehicle(vid), (200, None)
+
+    status, current = mutate(delete)
+    if status == 404:
         return jsonify({"success": False, "message": "Vehicle not found"}), 404
-
-    save_json(VEHICLES_FILE, current_vehicles)
-    global vehicles
-    vehicles = current_vehicles
+    if status == 409:
+        return version_conflict(current)
     return jsonify({"success": True})
 
 @app.post("/api/toggle_visibility")
+@idempotent
 def api_toggle_visibility():
-    vid = (request.get_json(force=True) or {}).get("id")
+    data = request.get_json(force=True) or {}
+    vid = data.get("id")
     if not vid:
         return jsonify({"success": False, "message": "Missing id"}), 400
-
-    current_vehicles = read_vehicles()
-
-    for v in current_vehicles:
-        if v.get("id") == vid:
-            v["visible"] = not v.get("visible", True)
-            save_json(VEHICLES_FILE, current_vehicles)
-            global vehicles
-            vehicles = current_vehicles
-            return jsonify({"success": True, "visible": v["visible"]})
-
-    return jsonify({"success": False, "message": "Vehicle not found"}), 404
+    try:
+        expected = expected_version(data)
+    except ValueError:
+        return jsonify({"success": False, "message": "Invalid version"}), 400
+
+    def toggle(snap: Snapshot):
+        v = snap.find(vid)
+        if v is None:
+            return snap, (404, None)
+        if expected is not None and v["version"] != expected:
+            return snap, (409, v)
+        snap = snap.with_vehicle({**v, "visible": not v.get("visible", True)})
+        return snap, (200, snap.find(vid))
+
+    status, current = mutate(toggle)
+    if status == 404:
+        return jsonify({"success": False, "message": "Vehicle not found"}), 404
+    if status == 409:
+        return version_conflict(current)
+    return jsonify({"success": True, "visible": current["visible"], "version": current["version"]})
 
 # ---------- Departments ----------
 @app.post("/api/add_department")
+@idempotent
 def api_add_department():
     d = (request.get_json(force=True) or {}).get("department", "").strip()
     if not d:
         return jsonify({"success": False, "message": "Empty name"}), 400
-    if d not in departments:
-        departments.append(d)
-        save_json(DEPARTMENTS_FILE, departments)
+    mutate(add_to_list("departments", d))
     return jsonify({"success": True})
 
 @app.post("/api/delete_department")
+@idempotent
 def api_delete_department():
     d = (request.get_json(force=True) or {}).get("department", "").strip()
     if not d:
         return jsonify({"success": False, "message": "Empty name"}), 400
-    if d in departments:
-        departments.remove(d)
-        save_json(DEPARTMENTS_FILE, departments)
+    mutate(remove_from_list("departments", d))
     return jsonify({"success": True})
 
 # ---------- Technicians ----------
 @app.post("/api/add_technician")
+@idempotent
 def api_add_technician():
     t = (request.get_json(force=True) or {}).get("technician", "").strip()
     if not t:
         return jsonify({"success": False, "message": "Empty name"}), 400
-    if t not in technicians:
-        technicians.append(t)
-        save_json(TECHS_FILE, technicians)
+    mutate(add_to_list("technicians", t))
     return jsonify({"success": True})
 
 @app.post("/api/delete_technician")
+@idempotent
 def api_delete_technician():
     t = (request.get_json(force=True) or {}).get("technician", "").strip()
     if not t:
         return jsonify({"success": False, "message": "Empty name"}), 400
-    if t in technicians:
-        technicians.remove(t)
-        save_json(TECHS_FILE, technicians)
+    mutate(remove_from_list("technicians", t))
     return jsonify({"success": True})
 
 # ---------- Services ----------
 @app.post("/api/add_service")
+@idempotent
 def api_add_service():
     s = (request.get_json(force=True) or {}).get("service", "").strip()
     if not s:
         return jsonify({"success": False, "message": "Empty name"}), 400
-    if s not in services:
-        services.append(s)
-        save_json(SERVICES_FILE, services)
+    mutate(add_to_list("services", s))
     return jsonify({"success": True})
 
 @app.post("/api/delete_service")
+@idempotent
 def api_delete_service():
     s = (request.get_json(force=True) or {}).get("service", "").strip()
     if not s:
         return jsonify({"success": False, "message": "Empty name"}), 400
-    if s in services:
-        services.remove(s)
-        save_json(SERVICES_FILE, services)
+    mutate(remove_from_list("services", s))
     return jsonify({"success": True})
 
 # ---------- GET lists ----------
 @app.get("/api/departments")
 def api_get_departments():
-    return jsonify(departments)
+    return api_response(store.read().departments)
 
 @app.get("/api/technicians")
 def api_get_technicians():
-    return jsonify(technicians)
+    return api_response(store.read().technicians)
 
 @app.get("/api/services")
 def api_get_services():
-    return jsonify(services)
+    return api_response(store.read().services)
+
+# ---------- Metrics ----------
+@app.get("/metrics")
+def prometheus_metrics():
+    stats = store.stats()
+    gauges = {
+        "asg_store_queue_depth": ("Mutations waiting for the store writer", {(): stats["queue_depth"]}),
+        "asg_store_flush_lag_seconds": ("Age of the oldest unflushed async write", {(): stats["flush_lag_seconds"]}),
+        "asg_store_dirty_sections": ("Sections with unflushed async writes", {(): len(stats["dirty_sections"])}),
+        "asg_store_vehicles": ("Vehicles in the current snapshot", {(): len(store.read().vehicles)}),
+    }
+    return Response(metrics.render(gauges), mimetype="text/plain; version=0.0.4")
+
+# ---------- Profiler (admin only) ----------
+@app.get("/api/admin/profile")
+def api_admin_profile():
+    """Collapsed stacks of all profiled requests (?format=json for counters)."""
+    if session.get("user") != "admin":
+        return jsonify({"success": False, "message": "Forbidden"}), 403
+    if request.args.get("format") == "json":
+        return jsonify(profiler.stats())
+    response = Response(profiler.collapsed(), mimetype="text/plain")
+    response.headers["Content-Disposition"] = "attachment; filename=profile.folded"
+    return response
+
+@app.post("/api/admin/profile")
+def api_admin_profile_settings():
+    """Set {"sample_rate": 0..1} and/or {"reset": true}."""
+    if session.get("user") != "admin":
+        return jsonify({"success": False, "message": "Forbidden"}), 403
+    data = request.get_json(force=True) or {}
+    if "sample_rate" in data:
+        try:
+            rate = float(data["sample_rate"])
+        except (TypeError, ValueError):
+            return jsonify({"success": False, "message": "Invalid sample_rate"}), 400
+        profiler.sample_rate = min(max(rate, 0.0), 1.0)
+    if data.get("reset"):
+        profiler.reset()
+    return jsonify({"success": True, **profiler.stats()})
+
+# ---------- Slow requests (admin only) ----------
+@app.get("/api/admin/slow")
+def api_admin_slow():
+    """Worst routes and causes by total slow time, plus the latest slow requests (?top=N)."""
+    if session.get("user") != "admin":
+        return jsonify({"success": False, "message": "Forbidden"}), 403
+    return jsonify(slow_log.report(request.args.get("top", 10, type=int)))
+
+@app.post("/api/admin/slow")
+def api_admin_slow_settings():
+    """Set {"threshold_ms": N} and/or {"reset": true}."""
+    if session.get("user") != "admin":
+        return jsonify({"success": False, "message": "Forbidden"}), 403
+    data = request.get_json(force=True) or {}
+    if "threshold_ms" in data:
+        try:
+            slow_log.threshold_ms = max(float(data["threshold_ms"]), 0.0)
+        except (TypeError, ValueError):
+            return jsonify({"success": False, "message": "Invalid threshold_ms"}), 400
+    if data.get("reset"):
+        slow_log.reset()
+    return jsonify({"success": True, "threshold_ms": slow_log.threshold_ms})
+
+# ---------- Long-poll ----------
+@app.get("/api/wait")
+def api_wait():
+    """Block until the store changes after ?since=<revision> (or ?timeout= s), then return the delta.
+
+    Answers {"revision", "events"}; without a usable since (first call, too
+    far behind, or the data was reloaded) it answers {"revision", "full":
+    true} plus every section instead. Filter fields (?department=, see
+    VehicleFilter) limit both to matching vehicles.
+    """
+    since = request.args.get("since", type=int)
+    timeout = min(max(request.args.get("timeout", LONGPOLL_TIMEOUT, type=float), 0.0), LONGPOLL_MAX_TIMEOUT)
+    filt = VehicleFilter.from_args(request.args)
+    if since is not None and not _live_slots.acquire(blocking=False):
+        return live_capacity_exceeded()
+    try:
+        return wait_response(since, timeout, filt)
+    finally:
+        if since is not None:
+            _live_slots.release()
+
+
+# ---------- Server-sent events ----------
+@app.get("/api/events")
+def api_events():
+    """Stream change events (add, update, visibility, delete, options) as SSE.
+
+    Each event carries its id, so a reconnecting EventSource resumes with
+    Last-Event-ID (or ?last_event_id=) from the replay buffer; the first
+    connect, or a gap too old to replay, starts with a "reset" event holding
+    the full state. Filter fields (?department=, see VehicleFilter) narrow
+    the stream and add "enter" / "leave" events.
+    """
+    last_id = request.headers.get("Last-Event-ID", request.args.get("last_event_id"))
+    try:
+        last_id = int(last_id) if last_id else None
+    except ValueError:
+        last_id = None
+    filt = VehicleFilter.from_args(request.args)
+    if not _live_slots.acquire(blocking=False):
+        return live_capacity_exceeded()
+    response = Response(_release_slot_after(iter_sse(last_id, filt)), mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"  # nginx: do not buffer the stream
+    return response
+
+# ---------- Store stats ----------
+@app.get("/api/store/stats")
+def api_store_stats():
+    return jsonify(store.stats())
+
+# ---------- Bootstrap ----------
+@app.get("/api/bootstrap")
+def api_bootstrap():
+    """Everything /admin polls for in one response.
+
+    Clients pass the revisions they hold (?vehicles=<rev>&departments=<rev>...)
+    and sections that have not changed are omitted.
+    """
+    known = {name: request.args.get(name, type=int) for name in SECTIONS}
+    return api_response(bootstrap_state(known))
 
 # ---------- Unified Update Route ----------
 @app.post("/api/update")
+@idempotent
 def api_update():
     data = request.get_json(force=True) or {}
     vid = data.get("id")
@@ -8452,25 +2287,106 @@ def api_update():
     if key in {"visible","watch"}:
         value = bool(value) if isinstance(value, bool) else str(value).lower() in {"1","true","yes","on"}
 
-    current_vehicles = read_vehicles()
-    updated = False
-
-    for v in current_vehicles:
-        if v.get("id") == vid:
-            v[key] = value
-            updated = True
-            break
-
-    if not updated:
+    try:
+        expected = expected_version(data)
+    except ValueError:
+        return jsonify({"success": False, "message": "Invalid version"}), 400
+
+    def update(snap: Snapshot):
+        v = snap.find(vid)
+        if v is None:
+            return snap, (404, None)
+        if expected is not None and v["version"] != expected:
+            return snap, (409, v)
+        snap = snap.with_vehicle({**v, key: value})
+        return snap, (200, snap.find(vid))
+
+    status, current = mutate(update)
+    if status == 404:
         return jsonify({"success": False, "message": "Vehicle not found"}), 404
-
-    save_json(VEHICLES_FILE, current_vehicles)
-    global vehicles
-    vehicles = current_vehicles
-    return jsonify({"success": True})
+    if status == 409:
+        return version_conflict(current)
+    return jsonify({"success": True, "version": current["version"]})
 
 ###############################################################################
 # Run
 ###############################################################################
+# ---------- Roles ----------
+# Each process has its own store and change feed; a replica picks up other
+# processes' writes through the file stamps. Revisions and event ids come
+# from the shared numbering (see Store), so every process reports the same
+# revisions for the same data and no two hand out the same event id:
+# /api/bootstrap works against any replica, and a long-poll or SSE client
+# that lands on another process finds its id unknown there and gets one
+# reset (the full state) before carrying on. Sticky routing saves those
+# resets; Socket.IO's polling transport needs it.
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+_role_endpoints: Optional[FrozenSet[str]] = None  # None: serve everything
+
+
+def _role_serves(role: str, endpoint: str, methods: FrozenSet[str]) -> bool:
+    if endpoint in ("static", "prometheus_metrics"):
+        return True
+    page = endpoint.startswith("pages.")
+    if role == "pages":
+        return page
+    if role == "api-write":
+        return not page
+    return endpoint == "pages.display" or (not page and methods <= SAFE_METHODS)
+
+
+@app.before_request
+def _enforce_role():
+    if _role_endpoints is not None and request.endpoint is not None and request.endpoint not in _role_endpoints:
+        message = f"Not served by this process (APP_ROLE={app.config['APP_ROLE']})"
+        return jsonify({"success": False, "message": message}), 404
+    return None
+
+
+def configure_role(role: str = APP_ROLE) -> Flask:
+    """Set up this module's app for one deployment role (see APP_ROLES).
+
+    Roles without pages never import pages.py or read templates/; endpoints
+    outside the role answer 404. The routes live on the one module-level app,
+    so a process has a single role: configuring another one raises.
+    """
+    global _role_endpoints
+    if role not in APP_ROLES:
+        raise ValueError(f"Unknown role {role!r}")
+    configured = app.config.get("APP_ROLE")
+    if configured is not None:
+        if configured != role:
+            raise RuntimeError(f"app is already configured for APP_ROLE={configured!r}")
+        return app
+    if role != "api-write" and "pages" not in app.blueprints:
+        from pages import bp
+        app.register_blueprint(bp)
+    if role != "all":
+        _role_endpoints = frozenset(rule.endpoint for rule in app.url_map.iter_rules()
+                                    if _role_serves(role, rule.endpoint, frozenset(rule.methods or ())))
+    app.config["APP_ROLE"] = role
+    return app
+
+
+def warm_caches() -> None:
+    """Load the store and compile every page template in this process.
+
+    wsgi.py calls this in the gunicorn master (preload_app), so forked
+    workers start with both in memory and share them copy-on-write.
+    """
+    store.read()
+    if "pages" in app.blueprints:
+        templates = app.jinja_env.list_templates(extensions=["html"])
+        for name in templates:
+            app.jinja_env.get_template(name)
+        app.logger.info("warmed %d page templates", len(templates))
+
+
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=int(os.environ.get('PORT', 5000)))
\ No newline at end of file
+    # pages.py imports from "app"; make that this module, not a second copy
+    sys.modules.setdefault("app", sys.modules[__name__])
+    configure_role()
+    if socketio is not None:
+        socketio.run(app, host='0.0.0.0', port=int(os.environ.get('PORT', 5000)), allow_unsafe_werkzeug=True)
+    else:
+        app.run(host='0.0.0.0', port=int(os.environ.get('PORT', 5000)))
\ No newline at end of file
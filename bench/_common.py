@@ -0,0 +1,213 @@
+# bench/_common.py
+# Shared helpers for the benchmark scripts: synthetic data and an isolated app import.
+
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT, "bench", "results")
+
+DEPARTMENTS = ["Mechanical", "Electrical", "Body Shop", "Painting", "Denting"]
+TECHNICIANS = ["Rajesh", "Syon", "Haris", "Ishad", "Sharif"]
+SERVICES = ["General Service", "Oil Change", "Full Inspection", "Battery"]
+STATUSES = ["Waiting", "In Service", "Done"]
+
+
+def make_vehicles(n: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Build n realistic-looking vehicle records (same shape as vehicles.json)."""
+    rnd = random.Random(seed)
+    return [
+        {
+            "id": str(uuid.UUID(int=rnd.getrandbits(128), version=4)),
+            "customer": f"Customer {i}",
+            "vehicle_no": f"S {rnd.randint(1, 9999)}",
+            "vehicle_name": rnd.choice(["Corolla", "Civic", "Swift", "Hilux", "Pajero"]),
+            "department": rnd.choice(DEPARTMENTS),
+            "service": rnd.choice(SERVICES),
+            "technician": rnd.choice(TECHNICIANS),
+            "status": rnd.choice(STATUSES),
+            "payment": rnd.choice(["Paid", "Advance Paid", "Unpaid"]),
+            "parts": rnd.choice(["Arrived", "Not Arrived"]),
+            "visible": rnd.random() > 0.2,
+            "watch": rnd.random() > 0.9,
+        }
+        for i in range(n)
+    ]
+
+
+def import_app(workdir: Optional[str] = None):
+    """Import app.py with its data files living in a scratch directory.
+
+    app.py reads and writes its JSON files relative to the working
+    directory, so benchmarks chdir into a temp dir first and never touch
+    the real data.
+    """
+    workdir = workdir or tempfile.mkdtemp(prefix="asg-bench-")
+    os.chdir(workdir)
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    import app  # noqa: E402
+    return app
+
+
+def timeit(fn: Callable[[], Any], repeat: int = 5) -> float:
+    """Best-of-N wall time in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def percentiles(samples: Sequence[float]) -> Dict[str, float]:
+    """Latency summary in milliseconds for a list of durations in seconds."""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+
+    def pick(q: float) -> float:
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)] * 1000
+
+    return {
+        "mean": sum(ordered) / len(ordered) * 1000,
+        "p50": pick(0.50),
+        "p90": pick(0.90),
+        "p99": pick(0.99),
+        "max": ordered[-1] * 1000,
+    }
+
+
+def git_revision() -> Dict[str, Any]:
+    """Commit the numbers were taken on, so result files can be compared later."""
+    def git(*args: str) -> str:
+        try:
+            return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return ""
+
+    return {"commit": git("rev-parse", "--short", "HEAD") or "unknown",
+            "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+
+
+def save_results(name: str, results: Any, out: Optional[str] = None, **meta: Any) -> str:
+    """Write results plus run metadata to bench/results/<name>-<commit>.json (or out)."""
+    rev = git_revision()
+    payload = {
+        "benchmark": name,
+        "commit": rev["commit"],
+        "dirty": rev["dirty"],
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        **meta,
+        "results": results,
+    }
+    if out is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        suffix = "-dirty" if rev["dirty"] else ""
+        out = os.path.join(RESULTS_DIR, f"{name}-{rev['commit']}{suffix}.json")
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+    return out
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+# ---------- Live server helpers (load and push benchmarks) ----------
+
+def http_call(base: str, method: str, path: str, body: Optional[Dict[str, Any]] = None,
+              accept: str = "application/json", timeout: float = 30.0) -> Tuple[int, bytes]:
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(base + path, data=data, method=method,
+                                 headers={"Accept": accept, "Content-Type": "application/json"})
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return resp.status, resp.read()
+
+
+class ProcStat:
+    """CPU seconds and RSS of a server process and its workers from /proc (Linux only).
+
+    Worker RSS is summed, so pages shared copy-on-write count once per worker.
+    """
+
+    def __init__(self, pid: Optional[int]) -> None:
+        self.pid = pid
+        self.tick = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+    def _pids(self) -> List[int]:
+        try:
+            with open(f"/proc/{self.pid}/task/{self.pid}/children") as f:
+                return [self.pid] + [int(p) for p in f.read().split()]  # e.g. gunicorn workers
+        except (OSError, TypeError):
+            return [self.pid] if self.pid else []
+
+    def cpu(self) -> Optional[float]:
+        total = None
+        for pid in self._pids():
+            try:
+                with open(f"/proc/{pid}/stat") as f:
+                    fields = f.read().rsplit(")", 1)[1].split()
+            except OSError:
+                continue
+            total = (total or 0.0) + (int(fields[11]) + int(fields[12])) / self.tick  # utime + stime
+        return total
+
+    def rss_mb(self) -> Optional[float]:
+        total = None
+        for pid in self._pids():
+            try:
+                with open(f"/proc/{pid}/status") as f:
+                    for line in f:
+                        if line.startswith("VmRSS:"):
+                            total = (total or 0.0) + int(line.split()[1]) / 1024
+            except OSError:
+                continue
+        return total
+
+
+# How start_server runs the app: what is deployed (serve.py, gunicorn) or the
+# Werkzeug dev server (app.py), whose every live connection holds a thread
+SERVERS: Dict[str, List[str]] = {
+    "serve": [sys.executable, os.path.join(ROOT, "serve.py")],
+    "gunicorn": [sys.executable, "-m", "gunicorn", "-c", os.path.join(ROOT, "gunicorn.conf.py"),
+                 "--pythonpath", ROOT, "wsgi:app"],
+    "app": [sys.executable, os.path.join(ROOT, "app.py")],
+}
+
+
+def start_server(port: int, vehicles: int, env: Optional[Dict[str, str]] = None,
+                 server: str = "serve") -> Tuple[subprocess.Popen, str]:
+    """Start one of SERVERS in a scratch directory seeded with a synthetic board.
+
+    Returns the process and its base URL once it answers requests.
+    """
+    workdir = tempfile.mkdtemp(prefix="asg-server-")
+    with open(os.path.join(workdir, "vehicles.json"), "w", encoding="utf-8") as f:
+        json.dump(make_vehicles(vehicles), f)
+    proc = subprocess.Popen(SERVERS[server], cwd=workdir,
+                            env={**os.environ, "PORT": str(port), **(env or {})},
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    base = f"http://127.0.0.1:{port}"
+    for _ in range(150):
+        try:
+            http_call(base, "GET", "/api/store/stats", timeout=1.0)
+            return proc, base
+        except (urllib.error.URLError, OSError):
+            time.sleep(0.1)
+    proc.kill()
+    raise SystemExit("server did not come up")
@@ -0,0 +1,49 @@
+# bench/bench_json.py
+# Compare the old stdlib path (indent=2) with app.json_dumps / json_loads / jsonify.
+# Run: python bench/bench_json.py [--sizes 10000 100000] [--repeat 5]
+
+import argparse
+import json
+
+from _common import import_app, make_vehicles, timeit
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JSON serializer benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    app = import_app()
+    backend = "orjson" if app.orjson is not None else "stdlib json"
+    print(f"backend: {backend}")
+    print(f"{'vehicles':>9} {'case':<28} {'stdlib indent=2':>16} {'app':>10} {'speedup':>8}")
+
+    for n in args.sizes:
+        data = make_vehicles(n)
+        old_text = json.dumps(data, indent=2, ensure_ascii=False)
+        new_bytes = app.json_dumps(data)
+
+        cases = [
+            ("encode (save_json)",
+             lambda: json.dumps(data, indent=2, ensure_ascii=False),
+             lambda: app.json_dumps(data)),
+            ("decode (load_json)",
+             lambda: json.loads(old_text),
+             lambda: app.json_loads(new_bytes)),
+        ]
+        with app.app.test_request_context():
+            plain = app.DefaultJSONProvider(app.app)
+            cases.append(("jsonify", lambda: plain.response(data), lambda: app.jsonify(data)))
+            for name, old, new in cases:
+                t_old = timeit(old, args.repeat)
+                t_new = timeit(new, args.repeat)
+                print(f"{n:>9} {name:<28} {t_old * 1000:>13.1f} ms {t_new * 1000:>7.1f} ms {t_old / t_new:>7.1f}x")
+
+        print(f"{n:>9} {'file size':<28} {len(old_text.encode()) / 1024:>13.0f} KB "
+              f"{len(new_bytes) / 1024:>7.0f} KB {len(old_text.encode()) / len(new_bytes):>7.1f}x")
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+# bench/bench_pages.py
+# Render time, payload size and template compile time for every page, checked against budgets.
+# Run: python bench/bench_pages.py [--vehicles 500] [--repeat 20] [--budgets bench/page_budgets.json]
+#                                  [--history bench/results/pages-history.jsonl] [--update-budgets]
+#
+# Each page is requested through the test client as the user that owns it.
+# Timings come from the app's own Server-Timing header (template_compile,
+# render, total), so they match what /metrics reports in production; the
+# best of --repeat is kept because it is far steadier than the median on a
+# busy machine. Only the first request compiles the template, so compile
+# time and first_ms come from that one. Every run is appended to the history
+# file; a page is flagged when it exceeds its budget, or grew by more than
+# the size tolerance or got slower by more than the time tolerance compared
+# with the previous run.
+# The exit status is 1 when anything regressed, so this can gate CI.
+
+import argparse
+import gzip
+import json
+import os
+import statistics
+import time
+import zlib
+from typing import Any, Dict, List, Optional
+
+from _common import RESULTS_DIR, ROOT, git_revision, import_app, make_vehicles
+
+try:
+    import brotli  # optional; only used for the br column
+except ImportError:
+    brotli = None
+
+PAGES = {"/": None, "/reception": "reception", "/staff": "staff",
+         "/admin": "admin", "/dashboard": "dashboard", "/display": "display"}
+DEFAULT_BUDGETS = os.path.join(ROOT, "bench", "page_budgets.json")
+DEFAULT_HISTORY = os.path.join(RESULTS_DIR, "pages-history.jsonl")
+# fields compared with the previous run, and which tolerance applies
+CHECKED = {"total_ms": "time_tolerance", "template_compile_ms": "time_tolerance", "first_ms": "time_tolerance",
+           "bytes": "size_tolerance", "gzip_bytes": "size_tolerance"}
+
+
+def server_timing(header: str) -> Dict[str, float]:
+    phases = {}
+    for part in header.split(","):
+        name, _, dur = part.strip().partition(";dur=")
+        if dur:
+            phases[name] = float(dur)
+    return phases
+
+
+def measure(client, path: str, user: Optional[str], repeat: int) -> Dict[str, Any]:
+    with client.session_transaction() as sess:
+        sess.clear()
+        if user:
+            sess["user"] = user
+    runs: List[Dict[str, float]] = []
+    body = b""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        resp = client.get(path)
+        body = resp.get_data()
+        wall = (time.perf_counter() - start) * 1000
+        if resp.status_code != 200:
+            raise SystemExit(f"{path}: HTTP {resp.status_code}")
+        runs.append({**server_timing(resp.headers.get("Server-Timing", "")), "wall": wall})
+
+    def best(key: str) -> float:
+        return min(r.get(key, 0.0) for r in runs)
+
+    row = {
+        "total_ms": best("total"),
+        "template_compile_ms": runs[0].get("template_compile", 0.0),
+        "render_ms": best("render"),
+        "wall_ms": best("wall"),
+        "median_total_ms": statistics.median(r.get("total", 0.0) for r in runs),
+        "first_ms": runs[0].get("total", 0.0),
+        "bytes": len(body),
+        "gzip_bytes": len(gzip.compress(body, compresslevel=6)),
+        "deflate_bytes": len(zlib.compress(body, 6)),
+    }
+    if brotli is not None:
+        row["br_bytes"] = len(brotli.compress(body))
+    return row
+
+
+def last_run(history: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(history):
+        return None
+    last = None
+    with open(history, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                last = json.loads(line)
+    return last
+
+
+def check(pages: Dict[str, Dict[str, Any]], budgets: Dict[str, Any], previous: Optional[Dict[str, Any]],
+          tolerances: Dict[str, float]) -> Dict[str, List[str]]:
+    problems: Dict[str, List[str]] = {}
+    for path, row in pages.items():
+        found = []
+        for field, limit in budgets.get("pages", {}).get(path, {}).items():
+            if field in row and row[field] > limit:
+                found.append(f"{field} {row[field]:.1f} > budget {limit}")
+        prev = (previous or {}).get("pages", {}).get(path, {})
+        for field, kind in CHECKED.items():
+            if prev.get(field) and row[field] > prev[field] * (1 + tolerances[kind]):
+                found.append(f"{field} {prev[field]:.1f} -> {row[field]:.1f} (+{row[field] / prev[field] - 1:.0%})")
+        if found:
+            problems[path] = found
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Page render and payload budget benchmark")
+    parser.add_argument("--vehicles", type=int, default=500, help="board size the pages render with")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--pages", nargs="+", choices=list(PAGES), default=list(PAGES))
+    parser.add_argument("--budgets", default=DEFAULT_BUDGETS)
+    parser.add_argument("--history", default=DEFAULT_HISTORY)
+    parser.add_argument("--size-tolerance", type=float, default=None,
+                        help="allowed size growth vs the previous run (default: budgets file, else 0.05)")
+    parser.add_argument("--time-tolerance", type=float, default=None,
+                        help="allowed slowdown vs the previous run (default: budgets file, else 0.25)")
+    parser.add_argument("--update-budgets", action="store_true",
+                        help="rewrite the budgets file from this run plus headroom")
+    args = parser.parse_args()
+
+    app = import_app()
+    with open(app.VEHICLES_FILE, "w", encoding="utf-8") as f:
+        json.dump(make_vehicles(args.vehicles), f)
+    app.store = app.Store()
+    client = app.configure_role().test_client()
+
+    budgets: Dict[str, Any] = {}
+    if os.path.exists(args.budgets):
+        with open(args.budgets, encoding="utf-8") as f:
+            budgets = json.load(f)
+    tolerances = {
+        "size_tolerance": args.size_tolerance if args.size_tolerance is not None
+        else budgets.get("size_tolerance", 0.05),
+        "time_tolerance": args.time_tolerance if args.time_tolerance is not None
+        else budgets.get("time_tolerance", 0.25),
+    }
+
+    print(f"{'page':<11} {'total':>8} {'compile':>8} {'render':>8} {'first':>8} {'bytes':>9} {'gzip':>8}"
+          + (f" {'br':>8}" if brotli is not None else ""))
+    pages: Dict[str, Dict[str, Any]] = {}
+    for path in args.pages:
+        row = pages[path] = measure(client, path, PAGES[path], args.repeat)
+        print(f"{path:<11} {row['total_ms']:>6.2f}ms {row['template_compile_ms']:>6.2f}ms "
+              f"{row['render_ms']:>6.2f}ms {row['first_ms']:>6.2f}ms {row['bytes']:>9,} {row['gzip_bytes']:>8,}"
+              + (f" {row['br_bytes']:>8,}" if brotli is not None else ""))
+
+    rev = git_revision()
+    entry = {"commit": rev["commit"], "dirty": rev["dirty"], "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+             "vehicles": args.vehicles, "repeat": args.repeat, "pages": pages}
+    previous = last_run(args.history)
+    if previous is not None and previous.get("vehicles") != args.vehicles:
+        previous = None  # different board size, not comparable
+    problems = check(pages, budgets, previous, tolerances)
+
+    os.makedirs(os.path.dirname(args.history), exist_ok=True)
+    with open(args.history, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+    print(f"\nappended to {args.history}")
+
+    if args.update_budgets:
+        # timings are machine-dependent, so they get more headroom than sizes
+        budgets = {
+            **tolerances,
+            "vehicles": args.vehicles,
+            "pages": {path: {"total_ms": round(row["total_ms"] * 2, 1),
+                             "template_compile_ms": round(row["template_compile_ms"] * 2, 1),
+                             "first_ms": round(row["first_ms"] * 2, 1),
+                             "bytes": int(row["bytes"] * 1.1),
+                             "gzip_bytes": int(row["gzip_bytes"] * 1.1)}
+                      for path, row in pages.items()},
+        }
+        with open(args.budgets, "w", encoding="utf-8") as f:
+            json.dump(budgets, f, indent=2)
+            f.write("\n")
+        print(f"budgets written to {args.budgets}")
+        return
+
+    if problems:
+        print("\nREGRESSIONS:")
+        for path, found in problems.items():
+            for item in found:
+                print(f"  {path}: {item}")
+        raise SystemExit(1)
+    print("all pages within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+# bench/bench_push.py
+# Socket.IO fan-out: broadcast latency, delivered messages/s and server memory per connection.
+# Run: python bench/bench_push.py [--clients 200] [--updates 200] [--rate 20] [--server serve|gunicorn|app]
+#                                 [--url http://host:port --pid PID]
+#
+# Connects --clients raw Engine.IO v4 websocket clients (the same protocol the
+# browser socket.io client speaks), then sends --updates /api/update requests
+# at --rate per second. Each update writes a unique marker into `customer`,
+# so every client can time the "changes" message that carries it from just
+# before the POST to arrival. Server RSS is read before and after connecting
+# to get memory per connection. Without --url the server is started locally
+# (serve.py by default, i.e. gevent).
+
+import argparse
+import json
+import threading
+import time
+from typing import Any, Dict, List
+
+import simple_websocket
+
+from _common import SERVERS, ProcStat, http_call, percentiles, save_results, start_server
+
+MARKER = "push-bench-"
+
+
+class Deliveries:
+    """Send times per marker and arrival latencies, shared by every client."""
+
+    def __init__(self) -> None:
+        self.sent: Dict[int, float] = {}
+        self.latencies: List[float] = []
+        self.last_arrival = 0.0
+        self._lock = threading.Lock()
+
+    def arrived(self, marker: int, at: float) -> None:
+        with self._lock:
+            sent = self.sent.get(marker)
+            if sent is not None:
+                self.latencies.append(at - sent)
+                self.last_arrival = max(self.last_arrival, at)
+
+
+class PushClient:
+    """Minimal Socket.IO client: websocket transport, default namespace, "changes" events only."""
+
+    def __init__(self, base: str, deliveries: Deliveries) -> None:
+        url = base.replace("http", "ws", 1) + "/socket.io/?EIO=4&transport=websocket"
+        self.deliveries = deliveries
+        self.connected = threading.Event()
+        self.ws = simple_websocket.Client.connect(url)
+        # Connect to "/" straight away: the server's "0{...}" open packet can
+        # share a TCP segment with the handshake, and simple-websocket only
+        # surfaces it once more data arrives
+        self.ws.send("40")
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        if not self.connected.wait(10):
+            self.close()
+            raise RuntimeError("Socket.IO connect timed out")
+
+    def _run(self) -> None:
+        while True:
+            try:
+                msg = self.ws.receive()
+            except simple_websocket.ConnectionClosed:
+                return
+            if msg is None:
+                return
+            if msg.startswith("40"):    # Socket.IO connected
+                self.connected.set()
+            elif msg.startswith("44"):  # connect refused (server at MAX_LIVE_CONNECTIONS)
+                return
+            elif msg == "2":            # Engine.IO ping
+                self.ws.send("3")
+            elif msg.startswith("42"):  # Socket.IO event
+                at = time.perf_counter()
+                name, events = json.loads(msg[2:])[:2]
+                if name != "changes":
+                    continue
+                for event in events:
+                    customer = (event.get("vehicle") or {}).get("customer", "")
+                    if isinstance(customer, str) and customer.startswith(MARKER):
+                        self.deliveries.arrived(int(customer[len(MARKER):]), at)
+
+    def close(self) -> None:
+        try:
+            self.ws.close()
+        except Exception:
+            pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Socket.IO broadcast benchmark")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--updates", type=int, default=200)
+    parser.add_argument("--rate", type=float, default=20.0, help="updates per second")
+    parser.add_argument("--vehicles", type=int, default=500, help="board size for a spawned server")
+    parser.add_argument("--drain", type=float, default=10.0, help="seconds to wait for stragglers")
+    parser.add_argument("--server", choices=list(SERVERS), default="serve",
+                        help="how to start the server on --port (default serve.py)")
+    parser.add_argument("--url", help="existing server instead of starting one")
+    parser.add_argument("--pid", type=int, help="server pid for RSS when using --url")
+    parser.add_argument("--port", type=int, default=5098)
+    parser.add_argument("--out", help="result file (default bench/results/push-<commit>.json)")
+    args = parser.parse_args()
+
+    proc = None
+    if args.url:
+        base, pid = args.url.rstrip("/"), args.pid
+    else:
+        proc, base = start_server(args.port, args.vehicles, server=args.server)
+        pid = proc.pid
+    stat = ProcStat(pid)
+    clients: List[PushClient] = []
+    try:
+        _, raw = http_call(base, "GET", "/api/vehicles?limit=100")
+        ids = [v["id"] for v in json.loads(raw)["items"]]
+
+        deliveries = Deliveries()
+        rss_before = stat.rss_mb()
+        started = time.perf_counter()
+        for _ in range(args.clients):
+            clients.append(PushClient(base, deliveries))
+        connect_s = time.perf_counter() - started
+        time.sleep(1.0)  # let per-connection buffers settle before sampling RSS
+        rss_after = stat.rss_mb()
+        print(f"connected {len(clients)} clients in {connect_s:.2f}s")
+
+        errors = 0
+        first_send = time.perf_counter()
+        for i in range(args.updates):
+            due = first_send + i / args.rate
+            time.sleep(max(0.0, due - time.perf_counter()))
+            with deliveries._lock:
+                deliveries.sent[i] = time.perf_counter()
+            try:
+                status, _ = http_call(base, "POST", "/api/update",
+                                      {"id": ids[i % len(ids)], "key": "customer", "value": f"{MARKER}{i}"})
+                errors += status >= 400
+            except OSError:
+                errors += 1
+
+        expected = args.clients * (args.updates - errors)
+        deadline = time.perf_counter() + args.drain
+        while len(deliveries.latencies) < expected and time.perf_counter() < deadline:
+            time.sleep(0.05)
+    finally:
+        for c in clients:
+            c.close()
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+    delivered = len(deliveries.latencies)
+    span = (deliveries.last_arrival - first_send) if delivered else 0.0
+    result: Dict[str, Any] = {
+        "clients": args.clients,
+        "updates": args.updates,
+        "update_errors": errors,
+        "rate": args.rate,
+        "connect_seconds": connect_s,
+        "delivered": delivered,
+        "expected": expected,
+        "delivery_ratio": delivered / expected if expected else 0.0,
+        "messages_per_sec": delivered / span if span else 0.0,
+        "latency_ms": percentiles(deliveries.latencies),
+        "rss_before_mb": rss_before,
+        "rss_after_mb": rss_after,
+        "rss_per_connection_kb": ((rss_after - rss_before) * 1024 / args.clients
+                                  if rss_before is not None and rss_after is not None else None),
+    }
+    lat = result["latency_ms"]
+    print(f"delivered {delivered}/{expected} ({result['delivery_ratio']:.1%}), "
+          f"{result['messages_per_sec']:.0f} msg/s, {errors} update errors")
+    if lat:
+        print(f"latency p50 {lat['p50']:.1f} ms  p90 {lat['p90']:.1f} ms  p99 {lat['p99']:.1f} ms  "
+              f"max {lat['max']:.1f} ms")
+    if result["rss_per_connection_kb"] is not None:
+        print(f"server RSS {rss_before:.0f} -> {rss_after:.0f} MB, "
+              f"{result['rss_per_connection_kb']:.0f} KB per connection")
+    path = save_results("push", result, args.out, server=None if args.url else args.server)
+    print(f"saved {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+# bench/bench_store.py
+# Throughput and latency of the vehicle API at several board sizes, via the test client and directly.
+# Run: python bench/bench_store.py [--sizes 100 10000 100000] [--ops 200] [--out FILE] [--compare FILE]
+#
+# "client" goes through the full WSGI stack (routing, session, hooks, metrics);
+# "direct" calls the view function inside a bare request context, so the gap
+# between the two is framework overhead and the rest is store + serialization.
+# Results land in bench/results/store-<commit>.json; pass an older file to
+# --compare to print the throughput change per case.
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from _common import import_app, load_results, make_vehicles, percentiles, save_results
+
+ENDPOINTS = ["vehicles", "add", "update", "toggle_visibility", "delete_vehicle"]
+MODES = ["client", "direct"]
+
+Request = Tuple[str, str, Optional[Dict[str, Any]]]  # method, path, json body
+
+
+def reset_store(app, n: int):
+    """Replace the live store with a fresh one holding n synthetic vehicles."""
+    data = make_vehicles(n)
+    with open(app.VEHICLES_FILE, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    app.store = app.Store()
+    return [v["id"] for v in data]
+
+
+def requests_for(endpoint: str, ids: List[str], ops: int) -> List[Request]:
+    if endpoint == "vehicles":
+        return [("GET", "/api/vehicles", None)] * ops
+    if endpoint == "add":
+        return [("POST", "/api/add", {"customer": f"Bench {i}", "vehicle_no": f"B {i}"}) for i in range(ops)]
+    if endpoint == "update":
+        statuses = ["Waiting", "In Service", "Done"]
+        return [("POST", "/api/update", {"id": ids[i % len(ids)], "key": "status", "value": statuses[i % 3]})
+                for i in range(ops)]
+    if endpoint == "toggle_visibility":
+        return [("POST", "/api/toggle_visibility", {"id": ids[i % len(ids)]}) for i in range(ops)]
+    # every delete needs a distinct record that still exists
+    return [("POST", "/api/delete_vehicle", {"id": vid}) for vid in ids[:ops]]
+
+
+def client_caller(app) -> Callable[[Request], int]:
+    client = app.app.test_client()
+
+    def call(req: Request) -> int:
+        method, path, body = req
+        resp = client.open(path, method=method, json=body)
+        resp.get_data()
+        return resp.status_code
+
+    return call
+
+
+def direct_caller(app) -> Callable[[Request], int]:
+    flask_app = app.app
+    adapter = flask_app.url_map.bind("localhost")
+
+    def call(req: Request) -> int:
+        method, path, body = req
+        endpoint, _ = adapter.match(path, method=method)
+        view = flask_app.view_functions[endpoint]
+        with flask_app.test_request_context(path, method=method, json=body):
+            resp = flask_app.make_response(view())
+            resp.get_data()
+            return resp.status_code
+
+    return call
+
+
+def run_case(call: Callable[[Request], int], reqs: List[Request]) -> Dict[str, Any]:
+    samples: List[float] = []
+    errors = 0
+    started = time.perf_counter()
+    for req in reqs:
+        t0 = time.perf_counter()
+        status = call(req)
+        samples.append(time.perf_counter() - t0)
+        if status >= 400:
+            errors += 1
+    elapsed = time.perf_counter() - started
+    return {
+        "ops": len(reqs),
+        "errors": errors,
+        "ops_per_sec": len(reqs) / elapsed if elapsed else 0.0,
+        "latency_ms": percentiles(samples),
+    }
+
+
+def print_compare(results: List[Dict[str, Any]], baseline_path: str) -> None:
+    baseline = load_results(baseline_path)
+    old = {(r["size"], r["mode"], r["endpoint"]): r for r in baseline["results"]}
+    print(f"\nvs {baseline['commit']}{' (dirty)' if baseline.get('dirty') else ''}:")
+    for r in results:
+        prev = old.get((r["size"], r["mode"], r["endpoint"]))
+        if prev is None or not prev["ops_per_sec"]:
+            continue
+        ratio = r["ops_per_sec"] / prev["ops_per_sec"]
+        p50 = r["latency_ms"].get("p50", 0.0) - prev["latency_ms"].get("p50", 0.0)
+        print(f"{r['size']:>9} {r['mode']:<7} {r['endpoint']:<18} {ratio:>6.2f}x ops/s {p50:>+9.2f} ms p50")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Store / vehicle API benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000, 100_000])
+    parser.add_argument("--ops", type=int, default=200, help="requests per endpoint per case")
+    parser.add_argument("--endpoints", nargs="+", choices=ENDPOINTS, default=ENDPOINTS)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES)
+    parser.add_argument("--out", help="result file (default bench/results/store-<commit>.json)")
+    parser.add_argument("--compare", help="earlier result file to compare against")
+    args = parser.parse_args()
+
+    app = import_app()
+    callers = {"client": client_caller, "direct": direct_caller}
+    print(f"durability: {app.STORE_DURABILITY}, fsync: {app.STORE_FSYNC}, "
+          f"group commit window: {app.GROUP_COMMIT_WINDOW_MS} ms")
+    print(f"{'vehicles':>9} {'mode':<7} {'endpoint':<18} {'ops/s':>9} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8} {'err':>4}")
+
+    results: List[Dict[str, Any]] = []
+    for n in args.sizes:
+        for mode in args.modes:
+            # delete runs last so the other endpoints see the full board
+            ids = reset_store(app, n)
+            call = callers[mode](app)
+            for endpoint in [e for e in ENDPOINTS if e in args.endpoints]:
+                row = {"size": n, "mode": mode, "endpoint": endpoint,
+                       **run_case(call, requests_for(endpoint, ids, args.ops))}
+                results.append(row)
+                lat = row["latency_ms"]
+                print(f"{n:>9} {mode:<7} {endpoint:<18} {row['ops_per_sec']:>9.1f} "
+                      f"{lat['p50']:>6.2f}ms {lat['p90']:>6.2f}ms {lat['p99']:>6.2f}ms {lat['max']:>6.2f}ms "
+                      f"{row['errors']:>4}")
+
+    path = save_results("store", results, args.out, ops=args.ops,
+                        durability=app.STORE_DURABILITY, fsync=app.STORE_FSYNC,
+                        json_backend="orjson" if app.orjson is not None else "stdlib json")
+    print(f"\nsaved {path}")
+    if args.compare:
+        print_compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
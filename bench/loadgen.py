@@ -0,0 +1,307 @@
+# bench/loadgen.py
+# Simulate a branch's screens against a local server and find where it saturates.
+# Run: python bench/loadgen.py [--tvs 6] [--tabs 8] [--admins 2] [--reception-per-hour 120]
+#                              [--steps 1 2 4 8] [--duration 30] [--server serve|gunicorn|app]
+#                              [--url http://host:port --pid PID]
+#
+# One step runs the whole fleet multiplied by the step factor for --duration
+# seconds. Every simulated screen is a thread that behaves like its page:
+#   display TV      long-polls /api/wait?since=<revision> (syncVehicles),
+#                   backing off 3 s after an error
+#   staff/dashboard holds an /api/events stream, reconnecting with
+#                   Last-Event-ID 3 s after it drops (EventSource)
+#   admin           GET /api/bootstrap?<revisions> every 5 s (fetchAllData) and
+#                   an /api/update every --admin-edit-interval s
+#   reception       POST /api/add, Poisson arrivals at the peak hourly rate
+# Live connections are held on purpose, so they count towards errors but not
+# latency; what they cost shows up as slower admin and reception requests
+# (e.g. every open stream pins a thread of a threaded server). A step is
+# saturated when the error rate, p95 latency or achieved request rate misses
+# its target; the report names the last step that held up.
+# Without --url a server is started from app.py in a scratch directory.
+
+import argparse
+import http.client
+import json
+import random
+import socket
+import threading
+import time
+import urllib.error
+import urllib.parse
+from typing import Any, Dict, List, Optional, Set
+
+from _common import SERVERS, ProcStat, http_call, percentiles, save_results, start_server
+
+try:
+    import msgpack  # optional; decodes what the server sends the pages
+except ImportError:
+    msgpack = None
+
+# what static/api_client.js sends (JSON only when msgpack is missing here)
+API_ACCEPT = "application/msgpack, application/json;q=0.9" if msgpack is not None else "application/json"
+LIVE_KINDS = {"display_wait"}  # held until something changes: not a latency sample
+RETRY_SECONDS = 3.0            # display back-off and SSE_RETRY_MS
+
+
+class Recorder:
+    """Latency samples and errors per client kind, shared by every client thread."""
+
+    def __init__(self) -> None:
+        self.samples: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.stream_events = 0
+        self.streams: Set[socket.socket] = set()  # open SSE sockets, shut down at the end of a step
+        self._lock = threading.Lock()
+
+    def add(self, kind: str, seconds: float, ok: bool) -> None:
+        with self._lock:
+            self.samples.setdefault(kind, []).append(seconds)
+            if not ok:
+                self.errors[kind] = self.errors.get(kind, 0) + 1
+
+    def close_streams(self) -> None:
+        with self._lock:
+            streams = list(self.streams)
+        for sock in streams:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+def timed_call(rec: Recorder, kind: str, *args: Any, **kwargs: Any) -> Optional[bytes]:
+    start = time.perf_counter()
+    try:
+        status, raw = http_call(*args, **kwargs)
+    except (urllib.error.URLError, OSError):
+        rec.add(kind, time.perf_counter() - start, False)
+        return None
+    rec.add(kind, time.perf_counter() - start, status < 400)
+    return raw
+
+
+def decode(raw: bytes) -> Any:
+    # JSON bodies start with { or [; anything else is MessagePack
+    if msgpack is not None and raw[:1] not in (b"{", b"["):
+        return msgpack.unpackb(raw)
+    return json.loads(raw)
+
+
+def run_longpoll(base: str, rec: Recorder, stop: threading.Event) -> None:
+    revision = None
+    if stop.wait(random.uniform(0, RETRY_SECONDS)):
+        return
+    while not stop.is_set():
+        path = "/api/wait" + (f"?since={revision}" if revision is not None else "")
+        raw = timed_call(rec, "display_wait", base, "GET", path, accept=API_ACCEPT, timeout=60.0)
+        if raw is None:
+            stop.wait(RETRY_SECONDS)
+            continue
+        data = decode(raw)
+        reload = any(e.get("type") == "reload" for e in data.get("events", ()))
+        revision = None if reload else data.get("revision")
+
+
+def run_stream(base: str, rec: Recorder, stop: threading.Event) -> None:
+    url = urllib.parse.urlsplit(base)
+    last_id = None
+    if stop.wait(random.uniform(0, RETRY_SECONDS)):
+        return
+    while not stop.is_set():
+        conn = http.client.HTTPConnection(url.hostname, url.port, timeout=60.0)
+        sock = None
+        start = time.perf_counter()
+        try:
+            conn.request("GET", "/api/events", headers={"Last-Event-ID": last_id} if last_id else {})
+            sock = conn.sock  # the response takes it over, so keep a handle for close_streams
+            with rec._lock:
+                rec.streams.add(sock)
+            resp = conn.getresponse()
+            rec.add("tab_connect", time.perf_counter() - start, resp.status < 400)
+            if resp.status < 400:
+                # one line at a time; keepalive comments arrive at least every 15 s
+                for line in iter(resp.fp.readline, b""):
+                    if line.startswith(b"id: "):
+                        last_id = line[4:].strip().decode()
+                        with rec._lock:
+                            rec.stream_events += 1
+                    if stop.is_set():
+                        break
+        except (OSError, http.client.HTTPException):
+            if not stop.is_set():
+                rec.add("tab_connect", time.perf_counter() - start, False)
+        finally:
+            with rec._lock:
+                rec.streams.discard(sock)
+            conn.close()
+        stop.wait(RETRY_SECONDS)
+
+
+def run_admin(base: str, rec: Recorder, edit_every: float, stop: threading.Event) -> None:
+    revisions: Dict[str, Any] = {}
+    ids: List[str] = []
+    next_edit = time.monotonic() + random.uniform(0, edit_every)
+    if stop.wait(random.uniform(0, 5.0)):
+        return
+    while not stop.is_set():
+        began = time.monotonic()
+        raw = timed_call(rec, "admin_poll", base, "GET", "/api/bootstrap?" + urllib.parse.urlencode(revisions),
+                         accept=API_ACCEPT)
+        if raw:
+            data = decode(raw)
+            revisions = data.get("revisions", revisions)
+            if data.get("vehicles"):
+                ids = [v["id"] for v in data["vehicles"]]
+        if ids and began >= next_edit:
+            next_edit = began + edit_every
+            timed_call(rec, "admin_edit", base, "POST", "/api/update",
+                       {"id": random.choice(ids), "key": "status",
+                        "value": random.choice(["Waiting", "In Service", "Done"])})
+        stop.wait(max(0.0, 5.0 - (time.monotonic() - began)))
+
+
+def run_reception(base: str, rec: Recorder, per_hour: float, stop: threading.Event) -> None:
+    while not stop.wait(random.expovariate(per_hour / 3600)):
+        timed_call(rec, "reception", base, "POST", "/api/add",
+                   {"customer": "Load test", "vehicle_no": f"L {random.randint(1, 9999)}"})
+
+
+def run_step(base: str, args: argparse.Namespace, factor: int, stat: ProcStat) -> Dict[str, Any]:
+    rec = Recorder()
+    stop = threading.Event()
+    threads: List[threading.Thread] = []
+
+    def spawn(target, *targs) -> None:
+        threads.append(threading.Thread(target=target, args=(base, rec, *targs, stop), daemon=True))
+
+    for _ in range(args.tvs * factor):
+        spawn(run_longpoll)
+    for _ in range(args.tabs * factor):
+        spawn(run_stream)
+    for _ in range(args.admins * factor):
+        spawn(run_admin, args.admin_edit_interval)
+    if args.reception_per_hour:
+        spawn(run_reception, args.reception_per_hour * factor)
+
+    cpu0, t0 = stat.cpu(), time.monotonic()
+    for t in threads:
+        t.start()
+    time.sleep(args.duration)
+    stop.set()
+    wall = time.monotonic() - t0
+    cpu1 = stat.cpu()
+    rec.close_streams()
+    for t in threads:
+        t.join(timeout=65)
+
+    all_samples = [s for kind, samples in rec.samples.items() if kind not in LIVE_KINDS for s in samples]
+    requests = sum(len(samples) for samples in rec.samples.values())
+    errors = sum(rec.errors.values())
+    # what the admins and reception would send if every request came back
+    # instantly; displays and tabs wait for changes, so they offer no rate
+    offered = factor * args.duration * (args.admins / 5.0 + args.admins / args.admin_edit_interval
+                                        + args.reception_per_hour / 3600)
+    lat = percentiles(all_samples)
+    p95 = sorted(all_samples)[int(0.95 * (len(all_samples) - 1))] * 1000 if all_samples else 0.0
+    return {
+        "factor": factor,
+        "clients": len(threads),
+        "requests": requests,
+        "req_per_sec": requests / wall,
+        "offered": round(offered),
+        "scheduled": len(all_samples),
+        "errors": errors,
+        "error_rate": errors / requests if requests else 0.0,
+        "latency_ms": {**lat, "p95": p95},
+        "by_kind": {kind: {"requests": len(s), "errors": rec.errors.get(kind, 0), "latency_ms": percentiles(s)}
+                    for kind, s in sorted(rec.samples.items())},
+        "stream_events": rec.stream_events,
+        "server_cpu": (cpu1 - cpu0) / wall if cpu0 is not None and cpu1 is not None else None,
+        "server_rss_mb": stat.rss_mb(),
+    }
+
+
+def saturated(row: Dict[str, Any], args: argparse.Namespace) -> List[str]:
+    reasons = []
+    if row["error_rate"] > args.max_error_rate:
+        reasons.append(f"errors {row['error_rate']:.1%}")
+    if row["latency_ms"].get("p95", 0.0) > args.slo_ms:
+        reasons.append(f"p95 {row['latency_ms']['p95']:.0f} ms")
+    # admins and reception are closed-loop, so a slow server shows up as
+    # requests never sent
+    if row["scheduled"] < 0.9 * row["offered"]:
+        reasons.append("fell behind schedule")
+    return reasons
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fleet load generator")
+    parser.add_argument("--tvs", type=int, default=6, help="display TVs (long-poll /api/wait)")
+    parser.add_argument("--tabs", type=int, default=8, help="staff and dashboard tabs (SSE /api/events)")
+    parser.add_argument("--admins", type=int, default=2, help="admin tabs (fetchAllData + edits)")
+    parser.add_argument("--admin-edit-interval", type=float, default=15.0)
+    parser.add_argument("--reception-per-hour", type=float, default=120.0, help="peak-hour job submissions")
+    parser.add_argument("--steps", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="fleet multipliers")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds per step")
+    parser.add_argument("--vehicles", type=int, default=500, help="board size for a spawned server")
+    parser.add_argument("--slo-ms", type=float, default=500.0, help="p95 latency target")
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--server", choices=list(SERVERS), default="serve",
+                        help="how to start the server on --port (default serve.py)")
+    parser.add_argument("--url", help="existing server instead of starting one")
+    parser.add_argument("--pid", type=int, help="server pid for CPU/RSS when using --url")
+    parser.add_argument("--port", type=int, default=5099)
+    parser.add_argument("--out", help="result file (default bench/results/load-<commit>.json)")
+    args = parser.parse_args()
+
+    proc = None
+    if args.url:
+        base, pid = args.url.rstrip("/"), args.pid
+    else:
+        proc, base = start_server(args.port, args.vehicles, server=args.server)
+        pid = proc.pid
+    stat = ProcStat(pid)
+
+    print(f"{'step':>4} {'clients':>7} {'req/s':>7} {'p50':>8} {'p95':>8} {'p99':>8} {'err':>6} {'cpu':>6} {'rss':>7}")
+    results: List[Dict[str, Any]] = []
+    last_ok: Optional[Dict[str, Any]] = None
+    first_bad: Optional[Dict[str, Any]] = None
+    try:
+        for factor in args.steps:
+            row = run_step(base, args, factor, stat)
+            row["saturated"] = saturated(row, args)
+            results.append(row)
+            lat = row["latency_ms"]
+            cpu = f"{row['server_cpu']:.2f}" if row["server_cpu"] is not None else "n/a"
+            rss = f"{row['server_rss_mb']:.0f}MB" if row["server_rss_mb"] is not None else "n/a"
+            print(f"{factor:>3}x {row['clients']:>7} {row['req_per_sec']:>7.1f} {lat.get('p50', 0):>6.1f}ms "
+                  f"{lat.get('p95', 0):>6.1f}ms {lat.get('p99', 0):>6.1f}ms {row['error_rate']:>6.1%} {cpu:>6} {rss:>7}"
+                  + (f"  SATURATED: {', '.join(row['saturated'])}" if row["saturated"] else ""))
+            if row["saturated"]:
+                first_bad = row
+                break
+            last_ok = row
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+    if last_ok is None:
+        print("\nsaturated at the first step; lower the fleet or --steps")
+    elif first_bad is None:
+        print(f"\nno saturation up to {last_ok['factor']}x ({last_ok['clients']} clients, "
+              f"{last_ok['req_per_sec']:.1f} req/s)")
+    else:
+        print(f"\nholds {last_ok['factor']}x ({last_ok['clients']} clients, {last_ok['req_per_sec']:.1f} req/s); "
+              f"saturates by {first_bad['factor']}x")
+
+    fleet = {k: getattr(args, k) for k in ("tvs", "tabs", "admins", "admin_edit_interval", "reception_per_hour")}
+    path = save_results("load", results, args.out, fleet=fleet, duration=args.duration, url=base,
+                        server=None if args.url else args.server, vehicles=None if args.url else args.vehicles, slo_ms=args.slo_ms,
+                        max_error_rate=args.max_error_rate)
+    print(f"saved {path}")
+
+
+if __name__ == "__main__":
+    main()
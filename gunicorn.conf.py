@@ -0,0 +1,79 @@
+# gunicorn.conf.py
+# gunicorn -c gunicorn.conf.py wsgi:app
+#
+# SERVER_MODE picks the worker class (see app.py, Serving):
+#   gevent (default when installed) - gevent, WORKER_CONNECTIONS greenlets per worker
+#   threading                       - gthread, WEB_CONCURRENCY workers x THREADS threads
+# Defaults follow the CPU count: one worker per core, since the GIL keeps a
+# process to about one core anyway, and greenlets or threads rather than
+# extra processes for concurrent requests, because every worker holds its own
+# copy of anything it writes to and runs its own store writer. Every open SSE
+# stream and long-poll holds a greenlet or thread for as long as it lasts:
+# cheap under gevent, but with gthread MAX_LIVE_CONNECTIONS defaults to
+# three quarters of THREADS so live clients cannot take every thread.
+#
+# preload_app imports wsgi.py - loading the store and compiling the pages -
+# once in the master before forking. Workers start in milliseconds and share
+# those pages until they write to them. The store writer thread is started
+# lazily per process, so each worker gets its own after the fork; workers
+# see each other's writes through the data file stamps.
+#
+# Event ids and revisions are unique across workers, so long-poll and SSE
+# stay correct with any number; a client whose request reaches another worker
+# gets one reset (a full refresh), which keepalive mostly avoids by keeping
+# it on one connection. Socket.IO with more than one worker needs sticky
+# sessions (or clients that use the websocket transport only).
+#
+# Each worker keeps its own metrics; they share them through METRICS_DIR (a
+# fresh directory per server start, removed on exit), so /metrics reports
+# all workers whichever one answers the scrape.
+
+import os
+import shutil
+import tempfile
+
+try:
+    import gevent  # noqa: F401
+    default_mode = "gevent"
+except ImportError:
+    default_mode = "threading"
+SERVER_MODE = os.environ.setdefault("SERVER_MODE", default_mode)
+if SERVER_MODE == "gevent":
+    # the gevent worker patches after the fork, but preload imports app.py
+    # in the master first, so its locks and threads must be patched now
+    from gevent import monkey
+    monkey.patch_all()
+
+cpus = os.cpu_count() or 1
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '5000')}"
+preload_app = True
+# api-write stays one process, so writes are not spread over several store
+# writers contending for the file lock; the other roles scale with the cores
+workers = int(os.getenv("WEB_CONCURRENCY", 1 if os.getenv("APP_ROLE") == "api-write" else cpus))
+
+if SERVER_MODE == "gevent":
+    worker_class = "gevent"
+    # room for MAX_LIVE_CONNECTIONS live clients plus ordinary requests
+    worker_connections = int(os.getenv("WORKER_CONNECTIONS",
+                                       int(os.getenv("MAX_LIVE_CONNECTIONS", "5000")) + 1000))
+else:
+    worker_class = "gthread"
+    threads = int(os.getenv("THREADS", max(32, (2 * cpus + 1) // workers)))
+    # an open SSE stream or long-poll holds a thread for its whole duration;
+    # set before preload imports app.py, which reads it
+    os.environ.setdefault("MAX_LIVE_CONNECTIONS", str(max(1, threads - max(4, threads // 4))))
+
+if "METRICS_DIR" not in os.environ:
+    os.environ["METRICS_DIR"] = tempfile.mkdtemp(prefix="asg-metrics-",
+                                                 dir="/dev/shm" if os.path.isdir("/dev/shm") else None)
+
+    def on_exit(server) -> None:
+        shutil.rmtree(os.environ["METRICS_DIR"], ignore_errors=True)
+
+# heartbeat files on tmpfs, so a slow disk (fsync of the data files) cannot
+# make the arbiter think a worker hung
+if os.path.isdir("/dev/shm"):
+    worker_tmp_dir = "/dev/shm"
+graceful_timeout = 30
+keepalive = 5
@@ -0,0 +1,97 @@
+# pages.py
+# HTML pages: login/logout, reception, staff, admin, dashboard and display.
+#
+# Registered by app.configure_role for every role but api-write, and only
+# imported then, so an API-only process never loads this module or the
+# templates. Each page's template is read from templates/ and compiled on
+# its first render, then stays in Jinja's cache for the life of the process.
+
+from flask import Blueprint, redirect, render_template, request, session
+
+from app import STATUSES, USERS, read_vehicles, store
+
+bp = Blueprint("pages", __name__)
+
+###############################################################################
+# Auth (fixed: new UI, original USERS, added logout)
+###############################################################################
+@bp.route("/", methods=["GET", "POST"])
+def login():
+    error = ""
+    if request.method == "POST":
+        username = request.form.get("username", "").strip()
+        password = request.form.get("password", "").strip()
+        if username in USERS and USERS[username] == password:
+            session["user"] = username
+            return redirect(f"/{username}") if username != "admin" else redirect("/admin")
+        error = "Invalid username or password"
+
+    return render_template("login.html", error=error)
+
+@bp.route("/logout")
+def logout():
+    session.pop("user", None)
+    return redirect("/")
+###############################################################################
+# Reception (Vue wizard)
+###############################################################################
+@bp.route("/reception")
+def reception():
+    if session.get("user") != "reception":
+        return redirect("/")
+    snap = store.read()
+    return render_template(
+        "reception.html",
+        departments=snap.departments, technicians=snap.technicians, services=snap.services, statuses=STATUSES
+    )
+###############################################################################
+# Staff
+###############################################################################
+@bp.route("/staff")
+def staff():
+    if session.get("user") != "staff":
+        return redirect("/")
+
+    vehicles = read_vehicles()
+
+    return render_template("staff.html", vehicles=vehicles)
+###############################################################################
+# Admin
+###############################################################################
+@bp.route("/admin")
+def admin():
+    if session.get("user") != "admin":
+        return redirect("/")
+
+    # Load initial data (embedded in the page with its revisions, so the
+    # first /api/bootstrap poll only returns what changed since render)
+    snap = store.read()
+    return render_template(
+        "admin.html",
+        vehicles=snap.vehicles,
+        departments=snap.departments,
+        technicians=snap.technicians,
+        services=snap.services,
+        statuses=STATUSES,
+        revisions=snap.revisions,
+    )
+###############################################################################
+# Dashboard (read-only)
+###############################################################################
+@bp.route("/dashboard")
+def dashboard():
+    if session.get("user") != "dashboard":
+        return redirect("/")
+
+    vehicles = read_vehicles()
+
+    return render_template("dashboard.html", vehicles=vehicles)
+###############################################################################
+# Display (big screen)
+###############################################################################
+@bp.route("/display")
+def display():
+    if session.get("user") != "display":
+        return redirect("/")
+
+    return render_template("display.html")
@@ -0,0 +1,40 @@
+# serve.py
+# Production entry point for a single process: python serve.py
+#
+# SERVER_MODE=gevent (the default here) serves every request - including
+# long-poll, SSE and Socket.IO connections - on a greenlet instead of an OS
+# thread, so one process holds thousands of idle live clients at a few KB
+# each; MAX_LIVE_CONNECTIONS caps them. The standard library is monkey-patched
+# before app.py is imported, so the store writer, its locks and queues and the
+# change feed all become greenlet-aware. SERVER_MODE=threading falls back to
+# the threaded server. HOST / PORT choose the address.
+
+import os
+
+os.environ.setdefault("SERVER_MODE", "gevent")
+
+if os.environ["SERVER_MODE"] == "gevent":
+    from gevent import monkey
+    monkey.patch_all()
+
+from app import SERVER_MODE, configure_role, socketio  # noqa: E402
+
+app = configure_role()
+
+
+def main() -> None:
+    host = os.getenv("HOST", "0.0.0.0")
+    port = int(os.getenv("PORT", "5000"))
+    app.logger.info("serving on %s:%d (%s)", host, port, SERVER_MODE)
+    if socketio is not None:
+        # gevent: pywsgi with simple-websocket for the WebSocket transport
+        socketio.run(app, host=host, port=port, allow_unsafe_werkzeug=True)
+    elif SERVER_MODE == "gevent":
+        from gevent.pywsgi import WSGIServer
+        WSGIServer((host, port), app).serve_forever()
+    else:
+        app.run(host=host, port=port, threaded=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+/* ===== API client: MessagePack-aware fetch =====
+   Asks the server for MessagePack first and falls back to JSON, so the
+   low-end tablets skip the text parse when the server can encode binary. */
+const API_ACCEPT = 'application/msgpack, application/json;q=0.9';
+
+function decodeMsgpack(bytes) {
+  const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+  const utf8 = new TextDecoder();
+  let pos = 0;
+
+  function str(n) { const s = utf8.decode(bytes.subarray(pos, pos + n)); pos += n; return s; }
+  function bin(n) { const b = bytes.slice(pos, pos + n); pos += n; return b; }
+  function arr(n) { const a = new Array(n); for (let i = 0; i < n; i++) a[i] = read(); return a; }
+  function map(n) { const o = {}; for (let i = 0; i < n; i++) { const k = read(); o[k] = read(); } return o; }
+  function u8()  { const v = view.getUint8(pos);  pos += 1; return v; }
+  function u16() { const v = view.getUint16(pos); pos += 2; return v; }
+  function u32() { const v = view.getUint32(pos); pos += 4; return v; }
+  // 64-bit ints without BigInt (older Android WebViews lack it)
+  function u64() { const v = view.getUint32(pos) * 4294967296 + view.getUint32(pos + 4); pos += 8; return v; }
+  function i64() { const v = view.getInt32(pos) * 4294967296 + view.getUint32(pos + 4); pos += 8; return v; }
+
+  function read() {
+    const t = u8();
+    if (t < 0x80) return t;                  // positive fixint
+    if (t < 0x90) return map(t & 0x0f);      // fixmap
+    if (t < 0xa0) return arr(t & 0x0f);      // fixarray
+    if (t < 0xc0) return str(t & 0x1f);      // fixstr
+    if (t >= 0xe0) return t - 0x100;         // negative fixint
+    let v;
+    switch (t) {
+      case 0xc0: return null;
+      case 0xc2: return false;
+      case 0xc3: return true;
+      case 0xc4: return bin(u8());
+      case 0xc5: return bin(u16());
+      case 0xc6: return bin(u32());
+      case 0xca: v = view.getFloat32(pos); pos += 4; return v;
+      case 0xcb: v = view.getFloat64(pos); pos += 8; return v;
+      case 0xcc: return u8();
+      case 0xcd: return u16();
+      case 0xce: return u32();
+      case 0xcf: return u64();
+      case 0xd0: v = view.getInt8(pos);  pos += 1; return v;
+      case 0xd1: v = view.getInt16(pos); pos += 2; return v;
+      case 0xd2: v = view.getInt32(pos); pos += 4; return v;
+      case 0xd3: return i64();
+      case 0xd9: return str(u8());
+      case 0xda: return str(u16());
+      case 0xdb: return str(u32());
+      case 0xdc: return arr(u16());
+      case 0xdd: return arr(u32());
+      case 0xde: return map(u16());
+      case 0xdf: return map(u32());
+    }
+    throw new Error('msgpack: unsupported type 0x' + t.toString(16));
+  }
+
+  return read();
+}
+
+// Decode a fetch() Response according to the Content-Type the server picked
+async function readApiBody(response) {
+  const type = response.headers.get('Content-Type') || '';
+  if (type.startsWith('application/msgpack')) {
+    return decodeMsgpack(new Uint8Array(await response.arrayBuffer()));
+  }
+  return response.json();
+}
+
+function fetchApi(url, options = {}) {
+  const headers = Object.assign({ 'Accept': API_ACCEPT }, options.headers || {});
+  return fetch(url, Object.assign({}, options, { headers }));
+}
+
+/* ===== Change events (/api/wait, push) =====
+   Applies store change events to a vehicle list and returns the new list,
+   or null when an event says the list has to be refetched. Safe to replay:
+   a record is only replaced by the same or a newer version. "enter" and
+   "leave" come from filtered subscriptions. */
+function applyChangeEvents(list, events) {
+  let out = list;
+  for (const ev of events) {
+    if (ev.type === 'reload') {
+      if (!ev.sections || ev.sections.includes('vehicles')) return null;
+      continue;
+    }
+    if (!ev.vehicle) continue;
+    if (out === list) out = list.slice();
+    const i = out.findIndex(v => v.id === ev.vehicle.id);
+    if (ev.type === 'delete' || ev.type === 'leave') {
+      if (i >= 0) out.splice(i, 1);
+    } else if (i < 0) {
+      out.push(ev.vehicle);
+    } else if ((out[i].version || 0) <= (ev.vehicle.version || 0)) {
+      out[i] = ev.vehicle;
+    }
+  }
+  return out;
+}
+
+/* ===== Server-sent change stream (/api/events) =====
+   onReset(state) gets the full board (first connect, or when the server
+   could not replay what was missed); onEvents(events) gets changes. */
+const CHANGE_EVENT_TYPES = ['add', 'update', 'visibility', 'delete', 'enter', 'leave', 'options', 'reload'];
+const LIVE_FILTER_FIELDS = ['department', 'technician', 'status', 'visible'];
+
+// Subscription filter taken from the page's own URL, so a bay screen can be
+// opened as e.g. /display?department=Body%20Shop; returns '' or 'a=b&...'
+function liveFilterQuery() {
+  const params = new URLSearchParams();
+  for (const [key, value] of new URLSearchParams(window.location.search)) {
+    if (LIVE_FILTER_FIELDS.includes(key)) params.append(key, value);
+  }
+  return params.toString();
+}
+
+function openChangeStream(url, { onReset, onEvents }) {
+  const source = new EventSource(url);
+  source.addEventListener('reset', e => onReset(JSON.parse(e.data)));
+  for (const type of CHANGE_EVENT_TYPES) {
+    source.addEventListener(type, e => onEvents([JSON.parse(e.data)]));
+  }
+  return source;
+}
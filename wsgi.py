@@ -0,0 +1,33 @@
+# wsgi.py
+# Production WSGI entry point: gunicorn -c gunicorn.conf.py wsgi:app
+#
+# Importing this module loads the store and compiles every page template
+# (app.warm_caches). With preload_app the gunicorn master does that once and
+# then forks, so workers share the data and compiled templates copy-on-write
+# instead of each building their own. gc.freeze() moves everything loaded so
+# far out of the collector's reach; otherwise the first collection in each
+# worker touches those objects and copies the pages they live on.
+#
+# APP_ROLE picks what this process serves (app.py, Roles). A split
+# deployment sharing one data directory, behind a proxy:
+#   APP_ROLE=api-write  POST /api/*, /socket.io/     one process
+#   APP_ROLE=api-read   GET /api/*, /display         one worker per core
+#   APP_ROLE=pages      everything else (login, pages)
+# so TV polling and SSE streams scale on their own cores without delaying
+# writes. Socket.IO stays with the writer, which publishes every change as
+# it makes it; replicas notice writes when a request or waiting client
+# checks the file stamps, and turn them into the same per-vehicle events, so
+# long-poll and SSE clients still get deltas rather than the full board.
+# Revisions and event ids are shared, but each replica keeps its own replay
+# buffer: routing a client to the same one (e.g. by address) saves the reset
+# it gets when it moves.
+
+import gc
+
+from app import configure_role, warm_caches
+
+app = configure_role()
+warm_caches()
+gc.freeze()
+
+application = app